@@ -1 +1,2 @@
-from .serializers import TModelSerializer, TSerializer
+from .query_plan import optimize_queryset
+from .serializers import TModelSerializer, TSerializer, warmup_serializers
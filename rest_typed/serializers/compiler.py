@@ -0,0 +1,609 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.core.validators import (
+    MaxLengthValidator,
+    MaxValueValidator,
+    MinLengthValidator,
+    MinValueValidator,
+    ProhibitNullCharactersValidator,
+)
+from rest_framework import serializers
+from rest_framework.fields import (
+    Field,
+    SkipField,
+    empty,
+    get_error_detail,
+    set_value,
+)
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import PKOnlyObject
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+from rest_typed.utils import get_setting
+
+GUARDS = {
+    serializers.IntegerField: "type({v}) is int",
+    serializers.FloatField: "(type({v}) is float or type({v}) is int)",
+    serializers.BooleanField: "({v} is True or {v} is False)",
+    serializers.CharField: 'type({v}) is str and {v}.isascii() and "\\x00" not in {v}',
+}
+
+# Validators a field's guard fully covers.
+COVERED_VALIDATORS = {
+    serializers.IntegerField: (MinValueValidator, MaxValueValidator),
+    serializers.FloatField: (MinValueValidator, MaxValueValidator),
+    serializers.BooleanField: (),
+    serializers.CharField: (
+        ProhibitNullCharactersValidator,
+        ProhibitSurrogateCharactersValidator,
+        MinLengthValidator,
+        MaxLengthValidator,
+    ),
+}
+
+
+# Generated functions kept per serializer class, one per field configuration;
+# past this many, instances whose fields differ use DRF's methods.
+MAX_VARIANTS = 8
+
+
+def is_compiled(serializer_class: type) -> bool:
+    meta = getattr(serializer_class, "Meta", None)
+    return getattr(meta, "compiled", get_setting("compiled_serializers", False))
+
+
+def get_validator_signature(field: serializers.Field) -> Optional[tuple]:
+    if type(field) not in GUARDS:
+        return None
+
+    return getattr(field, "trim_whitespace", None), tuple(
+        (type(validator), getattr(validator, "limit_value", None))
+        for validator in field.validators
+    )
+
+
+def get_input_signature(serializer: serializers.Serializer) -> tuple:
+    """
+    What the generated `to_internal_value` depends on, for each field: an
+    instance whose fields differ here, e.g. one made read-only in
+    `__init__`, gets its own code.
+    """
+    return tuple(
+        (
+            name,
+            type(field),
+            field.read_only,
+            tuple(field.source_attrs),
+            get_validator_signature(field),
+        )
+        for name, field in serializer.fields.items()
+    )
+
+
+def get_output_signature(serializer: serializers.Serializer) -> tuple:
+    """
+    What the generated `to_representation` depends on, for each field: an
+    instance whose fields differ here, e.g. one made write-only in
+    `__init__`, gets its own code.
+    """
+    return tuple(
+        (
+            name,
+            type(field),
+            field.write_only,
+            tuple(field.source_attrs),
+            getattr(field, "uuid_format", None),
+        )
+        for name, field in serializer.fields.items()
+    )
+
+
+def get_values_signature(serializer: serializers.Serializer) -> tuple:
+    """
+    What the generated `read_values` depends on: the output signature of
+    the serializer's fields, whether related fields read only keys, and the
+    same for nested serializers.
+    """
+    return tuple(
+        (
+            field_signature,
+            isinstance(field, serializers.RelatedField)
+            and field.use_pk_only_optimization(),
+            isinstance(field, serializers.Serializer) and get_values_signature(field),
+        )
+        for field_signature, field in zip(
+            get_output_signature(serializer), serializer.fields.values()
+        )
+    )
+
+
+def get_limits(field: serializers.Field, validator_class: type) -> List[Any]:
+    return [
+        validator.limit_value
+        for validator in field.validators
+        if type(validator) is validator_class
+    ]
+
+
+def get_guard(field: serializers.Field, index: int, namespace: dict) -> Optional[str]:
+    """
+    A condition under which the field would accept `v` as is (strings are
+    still stripped). When it doesn't hold, the field's own `run_validation`
+    decides, so errors are always DRF's. Limits are read from the field's
+    validators, which is what DRF checks.
+    """
+    field_class = type(field)
+
+    if field_class not in GUARDS:
+        return None
+
+    covered = COVERED_VALIDATORS[field_class]
+
+    for validator in field.validators:
+        if type(validator) not in covered or callable(
+            getattr(validator, "limit_value", None)
+        ):
+            return None
+
+    v = f"v{index}"
+    conditions = [GUARDS[field_class].format(v=v)]
+
+    for validator_class, operator in (
+        (MinValueValidator, ">="),
+        (MaxValueValidator, "<="),
+    ):
+        for position, limit in enumerate(get_limits(field, validator_class)):
+            limit_name = f"{validator_class.code}{index}_{position}"
+            namespace[limit_name] = limit
+            conditions.append(f"{v} {operator} {limit_name}")
+
+    return " and ".join(conditions)
+
+
+def compile_field(
+    lines: List[str], index: int, name: str, field: serializers.Field, namespace: dict
+):
+    key = repr(name)
+    v = f"v{index}"
+    generic = f"fields[{key}].run_validation({v})"
+    guard = get_guard(field, index, namespace)
+
+    if guard is None:
+        lines.append(f"    {v} = fields[{key}].get_value(data)")
+        lines.append("    try:")
+        lines.append(f"        {v} = {generic}")
+    else:
+        lines.append(f"    {v} = data.get({key}, empty)")
+        lines.append("    try:")
+
+        if isinstance(field, serializers.CharField):
+            # Blank strings and length errors are left to the field.
+            s = f"s{index}"
+            stripped = f"{v}.strip()" if field.trim_whitespace else v
+            conditions = [guard, f"({s} := {stripped})"]
+
+            for limit in get_limits(field, MinLengthValidator):
+                conditions.append(f"len({s}) >= {int(limit)}")
+            for limit in get_limits(field, MaxLengthValidator):
+                conditions.append(f"len({s}) <= {int(limit)}")
+
+            lines.append(f"        if {' and '.join(conditions)}:")
+            lines.append(f"            {v} = {s}")
+        elif isinstance(field, serializers.FloatField):
+            lines.append(f"        if {guard}:")
+            lines.append(f"            {v} = float({v})")
+        else:
+            lines.append(f"        if {guard}:")
+            lines.append("            pass")
+
+        lines.append("        else:")
+        lines.append(f"            {v} = {generic}")
+
+    validate_method = f"validate_{name}"
+
+    if validate_method in namespace["validate_methods"]:
+        lines.append(f"        {v} = self.{validate_method}({v})")
+
+    lines.append("    except ValidationError as exc:")
+    lines.append(f"        errors[{key}] = exc.detail")
+    lines.append("    except DjangoValidationError as exc:")
+    lines.append(f"        errors[{key}] = get_error_detail(exc)")
+    lines.append("    except SkipField:")
+    lines.append("        pass")
+    lines.append("    else:")
+
+    if list(field.source_attrs) == [name]:
+        lines.append(f"        ret[{key}] = {v}")
+    else:
+        namespace[f"source_attrs{index}"] = list(field.source_attrs)
+        lines.append(f"        set_value(ret, source_attrs{index}, {v})")
+
+
+def compile_to_internal_value(
+    serializer: serializers.Serializer,
+) -> Callable[[serializers.Serializer, Any], OrderedDict]:
+    """
+    Generates a `to_internal_value` for the serializer's fields: one block of
+    straight-line code per writable field, with common primitive inputs
+    accepted inline. Anything else is passed to the field's own
+    `run_validation`, so `validated_data` and errors match DRF's. The code
+    applies to instances with the same `get_input_signature()`.
+    """
+    serializer_class = serializer.__class__
+    fields = serializer.fields
+    namespace = {
+        "OrderedDict": OrderedDict,
+        "ValidationError": ValidationError,
+        "DjangoValidationError": DjangoValidationError,
+        "SkipField": SkipField,
+        "empty": empty,
+        "get_error_detail": get_error_detail,
+        "set_value": set_value,
+        "generic": serializers.Serializer.to_internal_value,
+        "validate_methods": {
+            attr for attr in dir(serializer_class) if attr.startswith("validate_")
+        },
+    }
+    lines = [
+        "def to_internal_value(self, data):",
+        "    fields = self.fields",
+        "    if type(data) is not dict:",
+        "        return generic(self, data)",
+        "    ret = OrderedDict()",
+        "    errors = OrderedDict()",
+    ]
+
+    for index, (name, field) in enumerate(fields.items()):
+        if not field.read_only:
+            compile_field(lines, index, name, field, namespace)
+
+    lines += [
+        "    if errors:",
+        "        raise ValidationError(errors)",
+        "    return ret",
+    ]
+
+    return build_function(serializer_class, "to_internal_value", lines, namespace)
+
+
+def compile_validate_batch(
+    serializer: serializers.Serializer,
+) -> Callable[[serializers.Serializer, List[dict]], tuple]:
+    """
+    Generates a function that validates the fields of a list of `dict` items
+    in columnar passes: one loop over every item per field, running the same
+    code as the compiled `to_internal_value`. Returns each item's validated
+    fields and field errors; serializer-level validation is left to the
+    caller. The code applies to instances with the same
+    `get_input_signature()`.
+    """
+    serializer_class = serializer.__class__
+    fields = serializer.fields
+    namespace = {
+        "OrderedDict": OrderedDict,
+        "ValidationError": ValidationError,
+        "DjangoValidationError": DjangoValidationError,
+        "SkipField": SkipField,
+        "empty": empty,
+        "get_error_detail": get_error_detail,
+        "set_value": set_value,
+        "validate_methods": {
+            attr for attr in dir(serializer_class) if attr.startswith("validate_")
+        },
+    }
+    lines = [
+        "def validate_batch(self, items):",
+        "    fields = self.fields",
+        "    rets = [OrderedDict() for _ in items]",
+        "    all_errors = [OrderedDict() for _ in items]",
+    ]
+
+    for index, (name, field) in enumerate(fields.items()):
+        if not field.read_only:
+            block = []
+            compile_field(block, index, name, field, namespace)
+            lines.append("    for data, ret, errors in zip(items, rets, all_errors):")
+            lines += ["    " + line for line in block]
+
+    lines.append("    return rets, all_errors")
+    return build_function(serializer_class, "validate_batch", lines, namespace)
+
+
+# Field class -> expression for its representation of a non-None `{a}`.
+REPRESENTATIONS = {
+    serializers.IntegerField: "{a} if type({a}) is int else int({a})",
+    serializers.FloatField: "{a} if type({a}) is float else float({a})",
+    serializers.CharField: "{a} if type({a}) is str else str({a})",
+    serializers.BooleanField: (
+        "{a} if {a} is True or {a} is False else {field}.to_representation({a})"
+    ),
+}
+
+
+def get_representation(
+    field: serializers.Field, a: str, key: str, fields_name: str = "fields"
+) -> str:
+    field_class = type(field)
+    expression = REPRESENTATIONS.get(field_class)
+
+    if field_class is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        expression = "str({a})"
+
+    if expression is None:
+        expression = "{field}.to_representation({a})"
+
+    return expression.format(a=a, field=f"{fields_name}[{key}]")
+
+
+def compile_representation_field(lines: List[str], index: int, name: str, field):
+    key = repr(name)
+    a = f"a{index}"
+    generic = f"fields[{key}].get_attribute(instance)"
+    source_attrs = list(field.source_attrs)
+
+    # Related fields return a placeholder for pk-only access, and dotted or
+    # `*` sources need DRF's traversal.
+    if type(field).get_attribute is not Field.get_attribute or len(source_attrs) != 1:
+        lines.append("    try:")
+        lines.append(f"        {a} = {generic}")
+    else:
+        attr = repr(source_attrs[0])
+        lines.append("    try:")
+        lines.append("        try:")
+        lines.append(
+            f"            {a} = instance[{attr}] if mapping else getattr(instance, {attr})"
+        )
+        lines.append("        except (AttributeError, KeyError, ObjectDoesNotExist):")
+        lines.append(f"            {a} = {generic}")
+        lines.append("        else:")
+        lines.append(f"            if callable({a}):")
+        lines.append(f"                {a} = {generic}")
+
+    lines.append("    except SkipField:")
+    lines.append("        pass")
+    lines.append("    else:")
+    lines.append(
+        f"        if {a} is None or (type({a}) is PKOnlyObject and {a}.pk is None):"
+    )
+    lines.append(f"            ret[{key}] = None")
+    lines.append("        else:")
+    lines.append(f"            ret[{key}] = {get_representation(field, a, key)}")
+
+
+def compile_to_representation(
+    serializer: serializers.Serializer,
+) -> Callable[[serializers.Serializer, Any], OrderedDict]:
+    """
+    Generates a `to_representation` for the serializer's fields that reads
+    each field's attribute directly and formats ints, floats, strings, bools
+    and UUIDs inline. Other fields, nested serializers included, use their
+    own `to_representation`; dotted sources, callables and related fields
+    use DRF's `get_attribute`. The code applies to instances with the same
+    `get_output_signature()`.
+    """
+    serializer_class = serializer.__class__
+    fields = serializer.fields
+    namespace = {
+        "OrderedDict": OrderedDict,
+        "Mapping": Mapping,
+        "ObjectDoesNotExist": ObjectDoesNotExist,
+        "PKOnlyObject": PKOnlyObject,
+        "SkipField": SkipField,
+    }
+    lines = [
+        "def to_representation(self, instance):",
+        "    fields = self.fields",
+        "    mapping = isinstance(instance, Mapping)",
+        "    ret = OrderedDict()",
+    ]
+
+    for index, (name, field) in enumerate(fields.items()):
+        if not field.write_only:
+            compile_representation_field(lines, index, name, field)
+
+    lines.append("    return ret")
+    return build_function(serializer_class, "to_representation", lines, namespace)
+
+
+def reads_values(serializer_class: type) -> bool:
+    meta = getattr(serializer_class, "Meta", None)
+    return getattr(meta, "read_values", False)
+
+
+def get_column(
+    model: Type[models.Model], field: serializers.Field
+) -> Optional[Tuple[str, Any]]:
+    """
+    The `values()` lookup for a field whose source is a column, possibly
+    through non-null foreign keys, and the model field it ends on. Sources
+    through nullable relations are left out: DRF falls back to the field's
+    default when the relation is missing.
+    """
+    source_attrs = list(field.source_attrs)
+    opts = model._meta
+    path = []
+
+    for position, attr in enumerate(source_attrs, 1):
+        try:
+            model_field = opts.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+
+        path.append(model_field.name)
+
+        if position == len(source_attrs):
+            break
+
+        if not model_field.is_relation or model_field.null:
+            return None
+
+        opts = model_field.related_model._meta
+    else:
+        return None
+
+    return "__".join(path), model_field
+
+
+def compile_values_fields(
+    lines: List[str],
+    serializer: serializers.Serializer,
+    model: Type[models.Model],
+    prefix: str,
+    indent: str,
+    fields_path: str,
+    lookups: List[str],
+    field_paths: List[str],
+) -> bool:
+    """
+    Adds the code building the serializer's output from a `values_list()`
+    row. Returns False if a field reads something other than columns.
+    """
+    from rest_typed.serializers.serializers import TSerializerAttrFieldsMixin
+
+    depth = prefix.count("__")
+    ret = f"ret{depth}"
+    fields_name = f"fields{len(field_paths)}"
+    field_paths.append(f"{fields_name} = {fields_path}")
+
+    def get_index(lookup: str) -> int:
+        if lookup not in lookups:
+            lookups.append(lookup)
+        return lookups.index(lookup)
+
+    lines.append(f"{indent}{ret} = OrderedDict()")
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        key = repr(name)
+
+        if isinstance(field, serializers.BaseSerializer):
+            relation = get_column(model, field)
+
+            if (
+                not isinstance(field, serializers.Serializer)
+                or type(field).to_representation
+                not in (
+                    serializers.Serializer.to_representation,
+                    TSerializerAttrFieldsMixin.to_representation,
+                )
+                or relation is None
+                or not relation[1].is_relation
+                or len(field.source_attrs) != 1
+            ):
+                return False
+
+            lookup, model_field = relation
+            related_model = model_field.related_model
+            pk_index = get_index(prefix + lookup + "__" + related_model._meta.pk.name)
+            lines.append(f"{indent}if row[{pk_index}] is None:")
+            lines.append(f"{indent}    {ret}[{key}] = None")
+            lines.append(f"{indent}else:")
+
+            if not compile_values_fields(
+                lines,
+                field,
+                related_model,
+                prefix + lookup + "__",
+                indent + "    ",
+                f"{fields_name}[{key}].fields",
+                lookups,
+                field_paths,
+            ):
+                return False
+
+            lines.append(f"{indent}    {ret}[{key}] = ret{depth + 1}")
+            continue
+
+        column = get_column(model, field)
+
+        if column is None:
+            return False
+
+        lookup, model_field = column
+        a = f"row[{get_index(prefix + lookup)}]"
+
+        if isinstance(model_field, models.FileField):
+            # Instances wrap the stored name in a FieldFile.
+            return False
+
+        if isinstance(field, serializers.RelatedField):
+            if not field.use_pk_only_optimization() or not model_field.is_relation:
+                return False
+
+            value = f"{fields_name}[{key}].to_representation(PKOnlyObject(pk={a}))"
+        elif type(field).get_attribute is not Field.get_attribute or (
+            model_field.is_relation and field.source_attrs[-1] != model_field.attname
+        ):
+            return False
+        else:
+            value = get_representation(field, a, key, fields_name)
+
+        lines.append(f"{indent}{ret}[{key}] = None if {a} is None else {value}")
+
+    return True
+
+
+def compile_read_values(
+    serializer: serializers.ModelSerializer,
+) -> Callable[[serializers.Serializer, Any], List[OrderedDict]]:
+    """
+    Generates a function rendering a queryset from `values_list()` rows,
+    without building model instances, for serializers whose fields all read
+    columns of the model or of models it joins through foreign keys. Returns
+    False for other serializers. The code applies to instances with the same
+    `get_values_signature()`.
+    """
+    serializer_class = serializer.__class__
+    lookups: List[str] = []
+    field_paths: List[str] = []
+    lines: List[str] = []
+
+    if not compile_values_fields(
+        lines,
+        serializer,
+        serializer.Meta.model,
+        "",
+        "        ",
+        "self.fields",
+        lookups,
+        field_paths,
+    ):
+        return False
+
+    namespace = {
+        "OrderedDict": OrderedDict,
+        "PKOnlyObject": PKOnlyObject,
+        "lookups": lookups,
+    }
+    lines = [
+        "def read_values(self, queryset):",
+        *[f"    {path}" for path in field_paths],
+        "    result = []",
+        "    for row in queryset.values_list(*lookups):",
+        *lines,
+        "        result.append(ret0)",
+        "    return result",
+    ]
+    return build_function(serializer_class, "read_values", lines, namespace)
+
+
+def build_function(
+    serializer_class: type, name: str, lines: List[str], namespace: dict
+) -> Callable:
+    source = "\n".join(lines)
+    exec(
+        compile(source, f"<compiled {serializer_class.__qualname__}.{name}>", "exec"),
+        namespace,
+    )
+    func = namespace[name]
+    func.__source__ = source
+    return func
@@ -1,7 +1,7 @@
 from datetime import date, datetime, time, timedelta
 from enum import Enum
 import inspect
-from typing import Any
+from typing import Any, get_args
 from uuid import UUID
 
 from rest_framework import serializers
@@ -50,3 +50,8 @@ def construct(hint: Any, default_value: Any = empty):
             list_item_type, serializers.Serializer
         ):
             return list_item_type(many=True)
+
+        if list_item_type in FIELD_MAPPING:
+            return serializers.ListField(
+                child=construct(get_args(parsed.resolved_hint)[0]), **kwargs
+            )
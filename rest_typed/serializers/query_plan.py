@@ -0,0 +1,264 @@
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Prefetch, QuerySet
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField
+
+from rest_typed.serializers.compiler import MAX_VARIANTS
+
+
+class QueryPlan(object):
+    """
+    The joins, prefetches and columns a serializer reads from its model.
+    `prefetch_related` maps each lookup to the related model and the plan of
+    the serializer rendering it (None when only the related keys are read).
+    `columns` is None when they can't all be worked out, in which case every
+    column is loaded.
+    """
+
+    def __init__(
+        self,
+        select_related: Set[str],
+        prefetch_related: Dict[str, Tuple[Type[models.Model], Optional["QueryPlan"]]],
+        columns: Optional[Set[str]],
+    ):
+        self.select_related = select_related
+        self.prefetch_related = prefetch_related
+        self.columns = columns
+
+    def merge(self, lookup: str, plan: "QueryPlan"):
+        """
+        Adds the plan of a relation joined in as `lookup`.
+        """
+        prefix = lookup + "__"
+        self.select_related.add(lookup)
+        self.select_related.update(prefix + name for name in plan.select_related)
+        self.prefetch_related.update(
+            (prefix + name, prefetch)
+            for name, prefetch in plan.prefetch_related.items()
+        )
+
+        if self.columns is not None and plan.columns is not None:
+            self.columns.add(lookup)
+            self.columns.update(prefix + column for column in plan.columns)
+        else:
+            self.columns = None
+
+    def get_prefetches(self, seen: Set[str] = frozenset()) -> List[Prefetch]:
+        prefetches = []
+
+        for lookup, (model, plan) in sorted(self.prefetch_related.items()):
+            if lookup in seen:
+                continue
+
+            queryset = model._default_manager.all()
+            prefetches.append(
+                Prefetch(lookup, queryset=plan.apply(queryset) if plan else queryset)
+            )
+
+        return prefetches
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+
+        if self.prefetch_related:
+            # Lookups the queryset already prefetches, possibly with a
+            # queryset of its own, are left alone.
+            seen = {
+                getattr(lookup, "prefetch_to", lookup)
+                for lookup in queryset._prefetch_related_lookups
+            }
+            queryset = queryset.prefetch_related(*self.get_prefetches(seen))
+
+        # Columns already chosen with only() or defer(), e.g. by a sparse
+        # fieldset, are left alone.
+        deferred, defer = queryset.query.deferred_loading
+        joined = queryset.query.select_related
+
+        # Relations the queryset joins itself can't be deferred; their
+        # models' columns are all loaded. `True` joins every non-null
+        # foreign key, which only() can't be told about.
+        if self.columns is not None and not deferred and defer and joined is not True:
+            columns = self.columns | set(get_joined_paths(joined or {}))
+            queryset = queryset.only(*sorted(columns))
+
+        return queryset
+
+
+def get_joined_paths(select_related: dict, prefix: str = "") -> List[str]:
+    """
+    The lookups of a `query.select_related` tree, e.g. `director` and
+    `director__agent` for `select_related("director__agent")`.
+    """
+    paths = []
+
+    for name, nested in select_related.items():
+        paths.append(prefix + name)
+        paths += get_joined_paths(nested, prefix + name + "__")
+
+    return paths
+
+
+def get_relation(model: Type[models.Model], attr: str) -> Optional[Any]:
+    """
+    The relation an attribute of the model's instances reads, forward or
+    reverse, or None if it isn't one.
+    """
+    try:
+        field = model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        field = None
+
+    if field is not None and field.is_relation and not field.auto_created:
+        return field
+
+    for related in model._meta.related_objects:
+        if related.get_accessor_name() == attr:
+            return related
+
+    return None
+
+
+def plan_serializer(
+    model: Type[models.Model], serializer: serializers.Serializer
+) -> QueryPlan:
+    from rest_typed.views.fieldsets import plan_declared_sources, plan_field
+
+    declared = getattr(getattr(serializer, "Meta", None), "field_sources", {})
+    plan = QueryPlan(set(), {}, {model._meta.pk.name})
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        if name in declared:
+            field_plan = plan_declared_sources(declared[name])
+        elif isinstance(field, (serializers.BaseSerializer, ManyRelatedField)):
+            plan_relation(model, field, plan)
+            continue
+        else:
+            field_plan = plan_field(model, field)
+
+        plan.select_related.update(field_plan.relations)
+
+        if plan.columns is not None and field_plan.columns is not None:
+            plan.columns.update(field_plan.columns)
+        else:
+            plan.columns = None
+
+    return plan
+
+
+def plan_relation(model: Type[models.Model], field: serializers.Field, plan: QueryPlan):
+    """
+    Adds a nested serializer or many related field to the plan: single
+    relations are joined, to-many relations prefetched.
+    """
+    source_attrs = field.source_attrs
+    relation = get_relation(model, source_attrs[0]) if len(source_attrs) == 1 else None
+
+    if relation is None:
+        plan.columns = None
+        return
+
+    lookup = source_attrs[0]
+    related_model = relation.related_model
+    nested = getattr(field, "child", field)
+
+    if relation.many_to_many or relation.one_to_many:
+        nested_plan = None
+
+        if isinstance(nested, serializers.Serializer):
+            nested_plan = plan_serializer(related_model, nested)
+
+            # Prefetched rows are matched to their parents by this key.
+            if relation.one_to_many and nested_plan.columns is not None:
+                nested_plan.columns.add(relation.field.name)
+
+        plan.prefetch_related[lookup] = (related_model, nested_plan)
+        return
+
+    if not isinstance(nested, serializers.Serializer):
+        plan.columns = None
+        return
+
+    nested_plan = plan_serializer(related_model, nested)
+
+    if not relation.concrete:
+        # Reverse one-to-one relations have no column of their own.
+        nested_plan.columns = None
+
+    plan.merge(lookup, nested_plan)
+
+
+def get_plan_signature(serializer: serializers.Serializer) -> tuple:
+    """
+    What a serializer's plan depends on, for each field, nested serializers
+    included: instances whose fields differ here get plans of their own.
+    """
+    signature = []
+
+    for name, field in serializer.fields.items():
+        nested = getattr(field, "child", field)
+
+        if isinstance(nested, serializers.Serializer):
+            nested = get_plan_signature(nested)
+        else:
+            nested = None
+
+        signature.append(
+            (name, type(field), field.write_only, tuple(field.source_attrs), nested)
+        )
+
+    return tuple(signature)
+
+
+_plans: "weakref.WeakKeyDictionary[type, Dict[Tuple[Any, tuple], QueryPlan]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def get_query_plan(
+    serializer: serializers.Serializer, model: Type[models.Model]
+) -> QueryPlan:
+    """
+    Returns the plan for rendering the model's instances with the
+    serializer, worked out from its fields (and nested serializers') the
+    first time and kept per class for instances whose fields are the same.
+    """
+    key = (model, get_plan_signature(serializer))
+
+    with _lock:
+        plans = _plans.setdefault(serializer.__class__, {})
+        plan = plans.get(key)
+
+    if plan is None:
+        plan = plan_serializer(model, serializer)
+
+        with _lock:
+            if len(plans) < MAX_VARIANTS:
+                plan = plans.setdefault(key, plan)
+
+    return plan
+
+
+def optimize_queryset(
+    queryset: QuerySet,
+    serializer: Union[serializers.Serializer, Type[serializers.Serializer]],
+) -> QuerySet:
+    """
+    Adds the `select_related()`, `prefetch_related()` and `only()` calls
+    needed to render the queryset with the serializer without further
+    queries. A serializer class is instantiated without arguments; pass an
+    instance for serializers that need arguments or context.
+    """
+    if isinstance(serializer, type):
+        serializer = serializer()
+
+    return get_query_plan(serializer, queryset.model).apply(queryset)
@@ -0,0 +1,221 @@
+import threading
+import weakref
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from rest_framework import serializers
+
+
+class Record(Mapping):
+    """
+    Base of the slotted classes that nested validated data is read through.
+    Subclasses are generated per serializer class, with a slot per key of its
+    validated data: each field's source, plus any key `validate()` adds.
+    Records are read-only mappings of their set fields, so they can still be
+    passed where the nested dicts were, e.g. as `**kwargs`.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _converters: Dict[str, Callable[[Any], Any]] = {}
+
+    @classmethod
+    def from_data(cls, data: dict) -> "Record":
+        record = object.__new__(cls)
+        converters = cls._converters
+
+        for name, value in data.items():
+            if value is not None and name in converters:
+                value = converters[name](value)
+
+            object.__setattr__(record, name, value)
+
+        return record
+
+    def asdict(self) -> dict:
+        data = {}
+
+        for name in self._fields:
+            if hasattr(self, name):
+                value = getattr(self, name)
+
+                if isinstance(value, Record):
+                    value = value.asdict()
+                elif isinstance(value, list):
+                    value = [
+                        item.asdict() if isinstance(item, Record) else item
+                        for item in value
+                    ]
+
+                data[name] = value
+
+        return data
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._fields:
+            raise KeyError(name)
+
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self._fields if hasattr(self, name))
+
+    def __len__(self) -> int:
+        return sum(1 for name in self._fields if hasattr(self, name))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Record):
+            other = other.asdict()
+
+        return isinstance(other, Mapping) and self.asdict() == dict(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self._fields
+            if hasattr(self, name)
+        )
+        return f"{self.__class__.__name__}({values})"
+
+
+# Keys that can't be slots: they would shadow the mapping methods.
+RESERVED_NAMES = frozenset(dir(Record))
+
+
+def is_slot_name(key: Any) -> bool:
+    return (
+        isinstance(key, str)
+        and key.isidentifier()
+        and not key.startswith("__")
+        and key not in RESERVED_NAMES
+    )
+
+
+class RecordFactory(object):
+    """
+    Converts a serializer's validated data to records. Data with the same
+    extra keys shares a record class; data whose keys can't all be slots, or
+    past `MAX_VARIANTS` sets of extra keys, stays a plain dict (with its
+    nested data still converted).
+    """
+
+    def __init__(
+        self,
+        serializer_class: type,
+        keys: Tuple[str, ...],
+        converters: Dict[str, Callable[[Any], Any]],
+    ):
+        self.serializer_class = serializer_class
+        self.keys = keys
+        self.key_set = frozenset(keys)
+        self.converters = converters
+        self.classes: Dict[Tuple[Any, ...], Optional[type]] = {}
+
+    def get_class(self, extra: Tuple[Any, ...]) -> Optional[type]:
+        from rest_typed.serializers.compiler import MAX_VARIANTS
+
+        with _records_lock:
+            if extra in self.classes:
+                return self.classes[extra]
+
+            if len(self.classes) >= MAX_VARIANTS:
+                return None
+
+            names = self.keys + extra
+            record_class = None
+
+            if all(is_slot_name(name) for name in names):
+                serializer_class = self.serializer_class
+                record_class = type(
+                    serializer_class.__name__.replace("Serializer", "") + "Record",
+                    (Record,),
+                    {
+                        "__slots__": names,
+                        "__module__": serializer_class.__module__,
+                        "_fields": names,
+                        "_converters": self.converters,
+                    },
+                )
+
+            self.classes[extra] = record_class
+            return record_class
+
+    def __call__(self, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+
+        extra = tuple(key for key in data if key not in self.key_set)
+        record_class = self.classes.get(extra, False)
+
+        if record_class is False:
+            record_class = self.get_class(extra)
+
+        if record_class is not None:
+            return record_class.from_data(data)
+
+        converters = self.converters
+        return {
+            key: (
+                converters[key](value)
+                if value is not None and key in converters
+                else value
+            )
+            for key, value in data.items()
+        }
+
+
+_records: "weakref.WeakKeyDictionary[type, RecordFactory]" = weakref.WeakKeyDictionary()
+_records_lock = threading.RLock()
+
+
+def get_converter(field: serializers.Field) -> Optional[Callable[[Any], Any]]:
+    from rest_typed.serializers.serializers import TSerializerAttrFieldsMixin
+
+    if isinstance(field, TSerializerAttrFieldsMixin):
+        return get_record_factory(field)
+
+    if isinstance(field, serializers.ListSerializer) and isinstance(
+        field.child, TSerializerAttrFieldsMixin
+    ):
+        factory = get_record_factory(field.child)
+        return lambda value: (
+            [factory(item) for item in value] if isinstance(value, list) else value
+        )
+
+    return None
+
+
+def get_record_factory(serializer: serializers.Serializer) -> RecordFactory:
+    """
+    Returns the record factory for a serializer's class, creating it (and
+    those of its nested serializers) the first time. Validated data is keyed
+    by each writable field's source.
+    """
+    serializer_class = serializer.__class__
+
+    with _records_lock:
+        if serializer_class not in _records:
+            keys = []
+            converters = {}
+
+            for field in serializer.fields.values():
+                if field.read_only or len(field.source_attrs) != 1:
+                    continue
+
+                key = field.source_attrs[0]
+                keys.append(key)
+                converter = get_converter(field)
+
+                if converter is not None:
+                    converters[key] = converter
+
+            _records[serializer_class] = RecordFactory(
+                serializer_class, tuple(dict.fromkeys(keys)), converters
+            )
+
+        return _records[serializer_class]
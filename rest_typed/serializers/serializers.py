@@ -1,48 +1,436 @@
+import copy
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.signals import setting_changed
+from django.db import models
+from django.db.models.query import ModelIterable
+from django.dispatch import receiver
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
 from rest_framework.fields import empty
+from rest_framework.relations import ManyRelatedField
+from rest_framework.settings import api_settings
+from rest_framework.utils import html
 from typing_extensions import get_type_hints
 
 from rest_typed.serializers import field_factory
+from rest_typed.serializers.compiler import (
+    MAX_VARIANTS,
+    compile_read_values,
+    compile_to_internal_value,
+    compile_to_representation,
+    compile_validate_batch,
+    get_input_signature,
+    get_output_signature,
+    get_values_signature,
+    is_compiled,
+    reads_values,
+)
+from rest_typed.utils import get_setting
+from rest_typed.serializers.records import get_converter
 
+# Fields that hold other fields, which are bound to them and so can't be shared.
+NESTING_FIELDS = (serializers.BaseSerializer, ManyRelatedField)
+CHILD_FIELDS = (serializers.ListField, serializers.DictField)
 
-class AttrDict(dict):
-    def __init__(self, *args, **kwargs):
-        super(AttrDict, self).__init__(*args, **kwargs)
-        self.__dict__ = self
 
+def copy_field(field: serializers.Field) -> serializers.Field:
+    """
+    Clones a declared field for a new serializer instance.
 
-class TSerializerMetaClass(serializers.SerializerMetaclass):
-    def __new__(cls, clsname, bases, attrs):
+    DRF deep copies declared fields, which re-runs each field's `__init__`
+    with deep copies of its arguments. A field only gets per-instance state
+    when it is bound, so a copy of its attributes is enough; its default is
+    still deep copied so a mutable default isn't shared between instances.
+    List and dict fields get their own copy of their child.
+    Nested serializers are still deep copied.
+    """
+    if isinstance(field, NESTING_FIELDS):
+        return copy.deepcopy(field)
 
-        newclass = super(TSerializerMetaClass, cls).__new__(cls, clsname, bases, attrs)
-        attr_name_to_type_hint = get_type_hints(newclass)
-        declared_fields: dict = getattr(newclass, "_declared_fields")
+    clone = object.__new__(field.__class__)
+    clone.__dict__.update(field.__dict__)
+
+    if "_validators" in clone.__dict__:
+        clone._validators = list(clone._validators)
+
+    if clone.default is not empty and not callable(clone.default):
+        clone.default = copy.deepcopy(clone.default)
+
+    if isinstance(clone, CHILD_FIELDS):
+        # The child was bound when the field was declared; only its parent
+        # differs for the copy.
+        clone.child = copy_field(clone.child)
+        clone.child.parent = clone
+
+    return clone
+
+
+def copy_fields(declared_fields: dict) -> OrderedDict:
+    return OrderedDict(
+        (name, copy_field(field)) for name, field in declared_fields.items()
+    )
+
+
+# TModelSerializer class -> (model, fields built from it)
+_model_fields = weakref.WeakKeyDictionary()
+_model_fields_lock = threading.Lock()
+
+
+def clear_model_fields():
+    """
+    Drops the cached model serializer fields, e.g. after the app registry is
+    reloaded.
+    """
+    with _model_fields_lock:
+        _model_fields.clear()
+
+
+@receiver(setting_changed)
+def _clear_model_fields_on_apps_change(setting: str, **kwargs):
+    if setting == "INSTALLED_APPS":
+        clear_model_fields()
+
+
+def caches_fields(serializer_class: type) -> bool:
+    meta = getattr(serializer_class, "Meta", None)
+    return getattr(meta, "cache_fields", get_setting("cache_model_fields", False))
+
+
+class TypedAttribute(object):
+    """
+    Class attribute for a declared field. Reading it on a validated serializer
+    converts the field's value once and stores it on the instance, so later
+    reads are plain attribute lookups.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        return instance._get_typed_attribute(self.name)
+
+
+_fields_lock = threading.RLock()
+_pending_classes = weakref.WeakSet()
+
+
+def is_eager() -> bool:
+    return settings.configured and get_setting("eager_serializer_fields", False)
+
+
+def materialize_fields(serializer_class: type):
+    """
+    Builds the fields of a typed serializer class from its type hints. This
+    runs the first time the class is instantiated (its base classes first),
+    so hints may refer to classes defined later in the module.
+    """
+    if "_typed_class_attrs" not in serializer_class.__dict__:
+        return
+
+    with _fields_lock:
+        attrs = serializer_class.__dict__.get("_typed_class_attrs")
+
+        if attrs is None:
+            return
+
+        bases = serializer_class.__bases__
+
+        for base in bases:
+            if isinstance(base, TSerializerMetaClass):
+                materialize_fields(base)
+
+        # Merge the bases' fields again, now that theirs are built too.
+        declared_fields = TSerializerMetaClass._get_declared_fields(bases, dict(attrs))
+
+        try:
+            attr_name_to_type_hint = get_type_hints(serializer_class)
+        except NameError as e:
+            raise NameError(f"{serializer_class.__name__}: {e}") from e
 
         for attr_name, type_hint in attr_name_to_type_hint.items():
             if attr_name not in declared_fields:
-                type_hint = attr_name_to_type_hint[attr_name]
-
-                default_value = (
-                    getattr(newclass, attr_name)
-                    if hasattr(newclass, attr_name)
-                    else empty
-                )
+                default_value = attrs.get(attr_name, empty)
 
                 declared_fields[attr_name] = field_factory.construct(
                     type_hint, default_value
                 )
 
-                if hasattr(newclass, attr_name):
-                    delattr(newclass, attr_name)
+                if attr_name in serializer_class.__dict__:
+                    delattr(serializer_class, attr_name)
+
+        for attr_name in declared_fields:
+            if not hasattr(serializer_class, attr_name):
+                setattr(serializer_class, attr_name, TypedAttribute(attr_name))
+
+        serializer_class._declared_fields = declared_fields
+        del serializer_class._typed_class_attrs
+        _pending_classes.discard(serializer_class)
+
+
+def warmup_serializers() -> int:
+    """
+    Builds the fields of every typed serializer class defined so far, e.g.
+    when a worker boots, instead of on each class's first request. Returns
+    how many classes were built.
+    """
+    pending = list(_pending_classes)
+
+    for serializer_class in pending:
+        materialize_fields(serializer_class)
+
+    return len(pending)
+
+
+class TSerializerMetaClass(serializers.SerializerMetaclass):
+    """
+    Typed fields are built from the class's type hints when it is first
+    instantiated, or right away with the `eager_serializer_fields` setting.
+    """
+
+    def __new__(cls, clsname, bases, attrs):
+        class_attrs = dict(attrs)
+        newclass = super(TSerializerMetaClass, cls).__new__(cls, clsname, bases, attrs)
+        newclass._typed_class_attrs = class_attrs
+        _pending_classes.add(newclass)
+
+        if is_eager():
+            materialize_fields(newclass)
 
         return newclass
 
 
+class TListSerializer(serializers.ListSerializer):
+    """
+    The list serializer for `many=True` typed serializers. Takes a
+    `max_items` limit, and validates the `dict` items of compiled serializers
+    field by field across the whole list.
+    """
+
+    default_error_messages = {
+        "max_items": "Ensure this list has no more than {max_items} items.",
+    }
+
+    def __init__(self, *args, **kwargs):
+        self.max_items = kwargs.pop("max_items", None)
+        super().__init__(*args, **kwargs)
+
+    def get_validate_batch(self) -> Any:
+        child_class = self.child.__class__
+
+        # The batch only stands in for the compiled `to_internal_value`.
+        if (
+            child_class.run_validation is not serializers.Serializer.run_validation
+            or child_class.to_internal_value
+            is not TSerializerAttrFieldsMixin.to_internal_value
+        ):
+            return False
+
+        return self.child._get_compiled(
+            "_compiled_validate_batch", compile_validate_batch, get_input_signature
+        )
+
+    def to_internal_value(self, data):
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+
+        if not isinstance(data, list):
+            return super().to_internal_value(data)
+
+        if self.max_items is not None and len(data) > self.max_items:
+            message = self.error_messages["max_items"].format(max_items=self.max_items)
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}, code="max_items"
+            )
+
+        validate_batch = self.get_validate_batch()
+
+        if validate_batch is False or not data:
+            return super().to_internal_value(data)
+
+        child = self.child
+        batched = zip(
+            *validate_batch(child, [item for item in data if type(item) is dict])
+        )
+        ret = []
+        errors = []
+
+        for item in data:
+            try:
+                if type(item) is not dict:
+                    validated = child.run_validation(item)
+                else:
+                    validated, field_errors = next(batched)
+
+                    if field_errors:
+                        raise ValidationError(field_errors)
+
+                    try:
+                        child.run_validators(validated)
+                        validated = child.validate(validated)
+                        assert (
+                            validated is not None
+                        ), ".validate() should return the validated data"
+                    except (ValidationError, DjangoValidationError) as exc:
+                        raise ValidationError(
+                            detail=serializers.as_serializer_error(exc)
+                        )
+            except ValidationError as exc:
+                errors.append(exc.detail)
+            else:
+                ret.append(validated)
+                errors.append({})
+
+        if any(errors):
+            raise ValidationError(errors)
+
+        return ret
+
+    def to_representation(self, data):
+        if isinstance(data, models.Manager):
+            data = data.all()
+
+        child = self.child
+
+        # Querysets of the serializer's model that haven't been evaluated
+        # can be read as rows of values instead.
+        if (
+            isinstance(data, models.QuerySet)
+            and data._result_cache is None
+            and data._iterable_class is ModelIterable
+            and isinstance(child, TModelSerializer)
+            and data.model is getattr(child.Meta, "model", None)
+            and child.__class__.to_representation
+            is TSerializerAttrFieldsMixin.to_representation
+        ):
+            read_values = child._get_compiled(
+                "_compiled_read_values",
+                compile_read_values,
+                get_values_signature,
+                reads_values,
+            )
+
+            if read_values is not False:
+                return read_values(child, data)
+
+        return super().to_representation(data)
+
+
 class TSerializerAttrFieldsMixin(object):
+    def __init__(self, *args, **kwargs):
+        if "_typed_class_attrs" in self.__class__.__dict__:
+            materialize_fields(self.__class__)
+
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        """
+        As DRF's, but defaults to `TListSerializer` and passes `max_items` to
+        the list only.
+        """
+        max_items = kwargs.pop("max_items", None)
+        allow_empty = kwargs.pop("allow_empty", None)
+        list_kwargs = {"child": cls(*args, **kwargs)}
+
+        if allow_empty is not None:
+            list_kwargs["allow_empty"] = allow_empty
+        if max_items is not None:
+            list_kwargs["max_items"] = max_items
+
+        list_kwargs.update(
+            {
+                key: value
+                for key, value in kwargs.items()
+                if key in serializers.LIST_SERIALIZER_KWARGS
+            }
+        )
+        meta = getattr(cls, "Meta", None)
+        list_serializer_class = getattr(meta, "list_serializer_class", TListSerializer)
+        return list_serializer_class(*args, **list_kwargs)
+
     def __getattr__(self, name: str):
         if name not in self.fields.keys():
             raise AttributeError(f"{name} does not exist.")
 
+        return self._get_typed_attribute(name)
+
+    def _get_compiled(
+        self,
+        name: str,
+        compile_method: Callable,
+        get_signature: Callable[[Any], tuple],
+        enabled: Callable[[type], bool] = is_compiled,
+    ) -> Any:
+        """
+        Returns the code generated for this instance's fields, kept on the
+        class by the fields' signature, or False to use DRF's methods. The
+        lookup is remembered on the instance until its fields are rebuilt,
+        so e.g. a `many=True` child works out its signature once.
+        """
+        serializer_class = self.__class__
+
+        if not enabled(serializer_class):
+            return False
+
+        fields = self.fields
+        found = self.__dict__.setdefault("_compiled", {})
+        cached = found.get(name)
+
+        if cached is not None and cached[0] is fields:
+            return cached[1]
+
+        variants = serializer_class.__dict__.get(name)
+
+        if variants is None:
+            variants = {}
+            setattr(serializer_class, name, variants)
+
+        signature = get_signature(self)
+        compiled = variants.get(signature)
+
+        if compiled is None:
+            if len(variants) >= MAX_VARIANTS:
+                compiled = False
+            else:
+                compiled = variants[signature] = compile_method(self)
+
+        found[name] = (fields, compiled)
+        return compiled
+
+    def to_internal_value(self, data):
+        compiled = self._get_compiled(
+            "_compiled_to_internal_value",
+            compile_to_internal_value,
+            get_input_signature,
+        )
+
+        if compiled is False:
+            return super().to_internal_value(data)
+
+        return compiled(self, data)
+
+    def to_representation(self, instance):
+        compiled = self._get_compiled(
+            "_compiled_to_representation",
+            compile_to_representation,
+            get_output_signature,
+        )
+
+        if compiled is False:
+            return super().to_representation(instance)
+
+        return compiled(self, instance)
+
+    def _get_typed_attribute(self, name: str):
         if not hasattr(self, "_validated_data"):
             msg = (
                 "You must call `.is_valid()` before accessing de-serialized attributes."
@@ -54,20 +442,13 @@ class TSerializerAttrFieldsMixin(object):
         if name not in validated_data:
             raise AttributeError(f"{name} does not exist.")
 
-        field_instance = self.fields[name]
         field_data = validated_data[name]
+        converter = get_converter(self.fields[name])
 
-        if isinstance(field_instance, TSerializerAttrFieldsMixin) and isinstance(
-            field_data, dict
-        ):
-            field_data = AttrDict(**field_data)
-        elif (
-            isinstance(field_instance, serializers.ListSerializer)
-            and isinstance(field_instance.child, TSerializerAttrFieldsMixin)
-            and isinstance(field_data, list)
-        ):
-            field_data = [AttrDict(**data) for data in field_data]
+        if converter is not None and field_data is not None:
+            field_data = converter(field_data)
 
+        self.__dict__[name] = field_data
         return field_data
 
     def asdict(self) -> dict:
@@ -85,7 +466,33 @@ class TModelSerializer(
     serializers.ModelSerializer,
     metaclass=TSerializerMetaClass,
 ):
-    pass
+    def get_fields(self):
+        """
+        With `Meta.cache_fields = True`, introspects the model once per
+        serializer class; each instance gets a copy of the fields built then.
+        Leave it off for serializers whose fields depend on the instance.
+        """
+        meta = getattr(self, "Meta", None)
+
+        if not caches_fields(self.__class__):
+            return super().get_fields()
+
+        if self.url_field_name is None:
+            self.url_field_name = api_settings.URL_FIELD_NAME
+
+        serializer_class = self.__class__
+
+        with _model_fields_lock:
+            cached = _model_fields.get(serializer_class)
+
+        # A different model class means the app registry has been reloaded.
+        if cached is None or cached[0] is not getattr(meta, "model", None):
+            cached = (meta.model, super().get_fields())
+
+            with _model_fields_lock:
+                _model_fields[serializer_class] = cached
+
+        return copy_fields(cached[1])
 
 
 class TSerializer(
@@ -93,4 +500,5 @@ class TSerializer(
     serializers.Serializer,
     metaclass=TSerializerMetaClass,
 ):
-    pass
+    def get_fields(self):
+        return copy_fields(self._declared_fields)
@@ -5,11 +5,14 @@ from django.conf import settings
 from rest_framework import serializers
 
 
-def inspect_complex_type(t: Any) -> Optional[Literal["drf", "pydantic"]]:
+def get_setting(name: str, default: Any = None) -> Any:
     if hasattr(settings, "DRF_TYPED_VIEWS"):
-        enabled = settings.DRF_TYPED_VIEWS.get("schema_packages", [])
-    else:
-        enabled = []
+        return settings.DRF_TYPED_VIEWS.get(name, default)
+    return default
+
+
+def inspect_complex_type(t: Any) -> Optional[Literal["drf", "pydantic"]]:
+    enabled = get_setting("schema_packages", [])
 
     if "pydantic" in enabled:
         from pydantic import BaseModel as PydanticBaseModel
@@ -1,5 +1,5 @@
-from typing import Any
-from .decorators import typed_action, typed_api_view
+from typing import Any, Callable, List
+from .decorators import TypedViewSetMixin, typed_action, typed_api_view
 from .param_settings import ParamSettings
 
 
@@ -23,5 +23,25 @@ def Header(*args, **kwargs) -> Any:
     return ParamSettings("header", *args, **kwargs)
 
 
+def File(*args, **kwargs) -> Any:
+    return ParamSettings("file", *args, **kwargs)
+
+
+def Depends(dependency: Callable, **kwargs) -> Any:
+    return ParamSettings("depends", dependency=dependency, **kwargs)
+
+
+def Cursor(ordering: List[str], **kwargs) -> Any:
+    return ParamSettings("cursor", ordering=ordering, **kwargs)
+
+
+def Filter(schema: Any, **kwargs) -> Any:
+    return ParamSettings("filter", schema=schema, **kwargs)
+
+
+def Fields(serializer: Any, **kwargs) -> Any:
+    return ParamSettings("fields", schema=serializer, **kwargs)
+
+
 def Param(*args, **kwargs) -> Any:
     return ParamSettings(*args, **kwargs)
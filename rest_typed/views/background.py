@@ -0,0 +1,181 @@
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.core.cache import caches
+from django.db import connections
+from django.urls import NoReverseMatch, reverse
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_typed.utils import get_setting
+
+logger = logging.getLogger(__name__)
+
+JOB_URL_NAME = "typed-background-job"
+
+
+class BackgroundQueueFull(APIException):
+    status_code = 503
+    default_detail = "Too many background jobs are pending. Try again later."
+    default_code = "background_queue_full"
+
+
+class LocalBackend(object):
+    """
+    Runs jobs on an in-process thread pool. At most `max_pending` jobs may be
+    queued or running; past that, new jobs are refused with a 503.
+
+    Other backends (e.g. one that enqueues to a task queue) only need a
+    `submit(job_id, func)` method and are set with the `background_backend`
+    setting.
+    """
+
+    def __init__(self, max_workers: int = None, max_pending: int = None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or get_setting("background_workers", 4),
+            thread_name_prefix="rest_typed_background",
+        )
+        self.slots = threading.BoundedSemaphore(
+            max_pending or get_setting("background_max_pending", 100)
+        )
+
+    def submit(self, job_id: str, func: Callable[[], None]):
+        if not self.slots.acquire(blocking=False):
+            raise BackgroundQueueFull()
+
+        def run():
+            try:
+                func()
+            finally:
+                self.slots.release()
+
+        self.executor.submit(run)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+
+    with _backend_lock:
+        if _backend is None:
+            path = get_setting("background_backend", None)
+            _backend = import_string(path)() if path else LocalBackend()
+        return _backend
+
+
+def get_cache():
+    return caches[get_setting("background_cache", "default")]
+
+
+def job_key(job_id: str) -> str:
+    return f"rest_typed:background:{job_id}"
+
+
+def get_owner(request: Request) -> Optional[Any]:
+    user = getattr(request, "user", None)
+    return user.pk if getattr(user, "is_authenticated", False) else None
+
+
+def save_job(job_id: str, state: dict):
+    get_cache().set(
+        job_key(job_id), state, get_setting("background_result_ttl", 60 * 60)
+    )
+
+
+def get_job(job_id: str) -> Optional[dict]:
+    return get_cache().get(job_key(job_id))
+
+
+def get_status_url(request: Request, job_id: str) -> Optional[str]:
+    try:
+        path = reverse(
+            get_setting("background_url_name", JOB_URL_NAME), kwargs={"job_id": job_id}
+        )
+    except NoReverseMatch:
+        return None
+
+    return request.build_absolute_uri(path)
+
+
+def run_job(job_id: str, owner: Any, call_view: Callable[[], Any]):
+    save_job(job_id, {"status": "running", "owner": owner})
+
+    try:
+        response = call_view()
+        state = {
+            "status": "succeeded",
+            "status_code": getattr(response, "status_code", 200),
+            "result": getattr(response, "data", response),
+        }
+    except APIException as e:
+        state = {"status": "failed", "status_code": e.status_code, "result": e.detail}
+    except Exception:
+        logger.exception("Background job %s failed", job_id)
+        state = {
+            "status": "failed",
+            "status_code": 500,
+            "result": {"detail": "Server error."},
+        }
+    finally:
+        connections.close_all()
+
+    save_job(job_id, {**state, "owner": owner})
+
+
+def submit_job(request: Request, call_view: Callable[[], Any]) -> Response:
+    """
+    Queues the (already validated) view call and answers with a 202 that
+    points to where the result can be fetched.
+    """
+    job_id = uuid.uuid4().hex
+    owner = get_owner(request)
+    save_job(job_id, {"status": "pending", "owner": owner})
+
+    try:
+        get_backend().submit(job_id, lambda: run_job(job_id, owner, call_view))
+    except Exception:
+        get_cache().delete(job_key(job_id))
+        raise
+
+    status_url = get_status_url(request, job_id)
+    headers = {"Location": status_url} if status_url else None
+    return Response(
+        {"id": job_id, "status": "pending", "status_url": status_url},
+        status=202,
+        headers=headers,
+    )
+
+
+def background_job_view():
+    """
+    Returns the view that reports a background job's status and, once it is
+    done, its result. Route it with the `typed-background-job` URL name:
+
+        url(r"^jobs/(?P<job_id>[0-9a-f]+)/", background_job_view(), name="typed-background-job")
+    """
+    from rest_framework.exceptions import NotFound
+    from rest_typed.views import Path, typed_api_view
+
+    @typed_api_view(["GET"])
+    def background_job(request: Request, job_id: str = Path(regex="^[0-9a-f]{32}$")):
+        job = get_job(job_id)
+
+        if job is None or job["owner"] != get_owner(request):
+            raise NotFound()
+
+        body = {"id": job_id, "status": job["status"]}
+
+        if "result" in job:
+            body["status_code"] = job["status_code"]
+            body["result"] = job["result"]
+
+        return Response(body)
+
+    return background_job
@@ -0,0 +1,208 @@
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from urllib.parse import urlencode, urlsplit
+
+from django.core.exceptions import PermissionDenied
+from django.db import connections
+from django.http import Http404, HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_typed.serializers import TSerializer
+from rest_typed.views import Body, typed_api_view
+
+logger = logging.getLogger(__name__)
+
+BATCH_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+# Batch request headers that identify the client, which sub-requests share.
+# Others, such as idempotency keys, conditional and content headers, only
+# apply to the batch request itself.
+SHARED_META = [
+    "HTTP_AUTHORIZATION",
+    "HTTP_COOKIE",
+    "HTTP_HOST",
+    "HTTP_USER_AGENT",
+    "HTTP_ACCEPT_LANGUAGE",
+    "HTTP_X_FORWARDED_FOR",
+    "HTTP_X_FORWARDED_HOST",
+    "HTTP_X_FORWARDED_PROTO",
+    "REMOTE_ADDR",
+    "REMOTE_USER",
+    "SERVER_NAME",
+    "SERVER_PORT",
+    "SERVER_PROTOCOL",
+    "HTTPS",
+    "wsgi.url_scheme",
+]
+
+
+class BatchOperationSerializer(TSerializer):
+    method = serializers.ChoiceField(choices=BATCH_METHODS)
+    path: str
+    query = serializers.DictField(required=False, default=dict)
+    body = serializers.JSONField(required=False, default=None)
+
+
+class BatchSerializer(TSerializer):
+    operations: List[BatchOperationSerializer]
+
+
+def build_sub_request(request: Request, operation: Dict[str, Any]) -> HttpRequest:
+    """
+    Builds a request for one operation that reuses the batch request's
+    identity headers and already-authenticated user, so sub-requests skip
+    middleware and authentication.
+    """
+    parent = request._request
+    url = urlsplit(operation["path"])
+    query = QueryDict(url.query, mutable=True)
+
+    for key, value in operation["query"].items():
+        query.setlist(key, value if isinstance(value, list) else [value])
+
+    body = b""
+
+    if operation["body"] is not None:
+        body = json.dumps(operation["body"], cls=JSONEncoder).encode("utf-8")
+
+    sub = HttpRequest()
+    sub.method = operation["method"]
+    sub.path = sub.path_info = url.path
+    sub.META = {
+        **{key: parent.META[key] for key in SHARED_META if key in parent.META},
+        "REQUEST_METHOD": operation["method"],
+        "PATH_INFO": url.path,
+        "QUERY_STRING": urlencode(query, doseq=True),
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+    }
+    sub.GET = query
+    sub.COOKIES = parent.COOKIES
+    sub._stream = io.BytesIO(body)
+    sub._read_started = False
+    sub._dont_enforce_csrf_checks = True
+    sub._force_auth_user = request.user
+    sub._force_auth_token = request.auth
+
+    for attr in ("session", "user"):
+        if hasattr(parent, attr):
+            setattr(sub, attr, getattr(parent, attr))
+
+    return sub
+
+
+def response_body(response: Any) -> Any:
+    if hasattr(response, "data"):
+        return response.data
+
+    if not response.content:
+        return None
+
+    try:
+        return json.loads(response.content)
+    except ValueError:
+        return response.content.decode(response.charset)
+
+
+def dispatch_operation(request: Request, operation: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        match = resolve(urlsplit(operation["path"]).path)
+    except Resolver404:
+        return {"status": 404, "body": {"detail": "Not found."}}
+
+    if getattr(match.func, "typed_batch", False):
+        return {"status": 400, "body": {"detail": "Batch requests cannot be nested."}}
+
+    sub_request = build_sub_request(request, operation)
+    sub_request.resolver_match = match
+
+    try:
+        response = match.func(sub_request, *match.args, **match.kwargs)
+    except Http404:
+        return {"status": 404, "body": {"detail": "Not found."}}
+    except PermissionDenied:
+        return {"status": 403, "body": {"detail": "Permission denied."}}
+    except Exception:
+        logger.exception("Batch operation failed: %s", operation["path"])
+        return {"status": 500, "body": {"detail": "Server error."}}
+
+    return {"status": response.status_code, "body": response_body(response)}
+
+
+def dispatch_concurrently(
+    request: Request, operations: List[Dict[str, Any]], max_workers: int
+) -> List[Dict[str, Any]]:
+    def run(operation: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return dispatch_operation(request, operation)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, operations))
+
+
+def batch_view(
+    max_operations: int = 20, concurrent: bool = False, max_workers: int = 4
+):
+    """
+    Returns a view that runs many typed sub-requests in one HTTP call:
+
+        POST {"operations": [{"method": "GET", "path": "/logs/1/", "query": {}}]}
+
+    Operations run in order. With `concurrent=True`, consecutive GETs run on a
+    thread pool; writes still act as barriers between them. Inside a
+    transaction, e.g. with `ATOMIC_REQUESTS`, they run one at a time instead,
+    since the pool's threads use their own connections.
+    """
+
+    @typed_api_view(["POST"])
+    def batch(request: Request, payload: BatchSerializer = Body()):
+        operations = list(payload.validated_data["operations"])
+
+        if len(operations) > max_operations:
+            raise serializers.ValidationError(
+                {
+                    "operations": [
+                        f"Ensure this field has no more than {max_operations} elements."
+                    ]
+                }
+            )
+
+        results: List[Dict[str, Any]] = []
+        pending_reads: List[Dict[str, Any]] = []
+        run_concurrently = concurrent and not any(
+            connection.in_atomic_block for connection in connections.all()
+        )
+
+        for operation in operations + [None]:
+            if (
+                run_concurrently
+                and operation is not None
+                and operation["method"] == "GET"
+            ):
+                pending_reads.append(operation)
+                continue
+
+            if len(pending_reads) == 1:
+                results.append(dispatch_operation(request, pending_reads[0]))
+            elif len(pending_reads) > 1:
+                results.extend(
+                    dispatch_concurrently(request, pending_reads, max_workers)
+                )
+
+            pending_reads = []
+
+            if operation is not None:
+                results.append(dispatch_operation(request, operation))
+
+        return Response(results)
+
+    batch.typed_batch = True
+    return batch
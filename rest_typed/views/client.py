@@ -0,0 +1,115 @@
+from typing import Any, Callable, Dict, Optional, Type
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest
+from rest_framework.request import Request
+from rest_framework.views import APIView
+from rest_framework.viewsets import ViewSetMixin
+from rest_typed.views.decorators import TypedView
+
+
+class TypedClient(object):
+    """
+    Calls typed views in-process with Python values: params are validated by
+    the same plan and the view's authentication, permission and throttle
+    checks still run, but nothing is encoded, parsed or rendered.
+
+        client = TypedClient(user=request.user)
+        data = client.call(get_logs, myid=2, title="My title")
+    """
+
+    def __init__(self, user: Any = None, headers: Dict[str, str] = None):
+        self.user = user if user is not None else AnonymousUser()
+        self.headers = headers or {}
+
+    def call(self, view: Callable, method: str = None, **values) -> Any:
+        return self.request(view, method=method, **values).data
+
+    def call_action(
+        self,
+        viewset_class: Type[ViewSetMixin],
+        action_name: str,
+        method: str = None,
+        **values,
+    ) -> Any:
+        return self.request_action(
+            viewset_class, action_name, method=method, **values
+        ).data
+
+    def request(self, view: Callable, method: str = None, **values) -> Any:
+        """
+        Like `call()`, but returns the unrendered response.
+        """
+        typed_view = self.get_typed_view(view)
+        api_view = view.cls(**view.initkwargs)
+        request = self.initialize(api_view, typed_view, method, {})
+        return typed_view.call(request, values, [])
+
+    def request_action(
+        self,
+        viewset_class: Type[ViewSetMixin],
+        action_name: str,
+        method: str = None,
+        **values,
+    ) -> Any:
+        """
+        Like `call_action()`, but returns the unrendered response.
+        """
+        action_func = getattr(viewset_class, action_name)
+        typed_view = self.get_typed_view(action_func)
+        method = (method or typed_view.methods[0]).upper()
+        viewset = viewset_class(
+            basename=None, detail=action_func.detail, **action_func.kwargs
+        )
+        viewset.action_map = {method.lower(): action_name}
+        lookup = viewset.lookup_url_kwarg or viewset.lookup_field
+        path_args = {lookup: values[lookup]} if lookup in values else {}
+        request = self.initialize(viewset, typed_view, method, path_args)
+        return typed_view.call(request, values, [viewset])
+
+    def get_typed_view(self, view: Callable) -> TypedView:
+        typed_view = getattr(view, "typed_view", None)
+
+        if typed_view is None:
+            raise Exception(f"{view.__name__} is not a typed view")
+
+        return typed_view
+
+    def build_http_request(self, method: str) -> HttpRequest:
+        http_request = HttpRequest()
+        http_request.method = method
+        http_request.META["REQUEST_METHOD"] = method
+        http_request._force_auth_user = self.user
+        http_request._dont_enforce_csrf_checks = True
+
+        for header, value in self.headers.items():
+            key = "HTTP_" + header.upper().replace("-", "_")
+            http_request.META[key] = value
+
+        return http_request
+
+    def initialize(
+        self,
+        api_view: APIView,
+        typed_view: TypedView,
+        method: Optional[str],
+        path_args: dict,
+    ) -> Request:
+        method = (method or typed_view.methods[0]).upper()
+
+        if method not in typed_view.methods:
+            raise Exception(
+                f"{typed_view.view.__name__} does not allow {method}; "
+                f"use one of: {', '.join(typed_view.methods)}"
+            )
+
+        http_request = self.build_http_request(method)
+        api_view.args = ()
+        api_view.kwargs = path_args
+        api_view.request = request = api_view.initialize_request(
+            http_request, **path_args
+        )
+        api_view.headers = api_view.default_response_headers
+        api_view.format_kwarg = None
+        api_view.initial(request, **path_args)
+        return request
@@ -0,0 +1,72 @@
+import inspect
+from calendar import timegm
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_typed.views.utils import is_deferred_param
+from rest_typed.views.view_settings import ViewSettings
+
+
+def prevalidate_conditions(
+    view_func: Callable, params: List[inspect.Parameter], settings: ViewSettings
+):
+    """
+    Condition functions run before the body and current user are validated, so
+    they may only ask for the view's path, query, header and request params.
+    """
+    cheap = {p.name for p in params if not is_deferred_param(p)}
+
+    for func in (settings.etag, settings.last_modified):
+        if func is None:
+            continue
+
+        for name in inspect.signature(func).parameters:
+            if name not in cheap:
+                raise Exception(
+                    f"{view_func.__name__}: condition function '{func.__name__}' "
+                    f"can only receive the view's path, query, header or request "
+                    f"params, not '{name}'"
+                )
+
+
+def call_condition(func: Optional[Callable], values: Dict[str, Any]) -> Any:
+    if func is None:
+        return None
+
+    names = inspect.signature(func).parameters
+    return func(**{name: values[name] for name in names})
+
+
+def evaluate_conditions(
+    view_settings: ViewSettings, values: Dict[str, Any]
+) -> Tuple[Optional[str], Optional[int]]:
+    etag = call_condition(view_settings.etag, values)
+    etag = quote_etag(etag) if etag is not None else None
+
+    last_modified = call_condition(view_settings.last_modified, values)
+    last_modified = timegm(last_modified.utctimetuple()) if last_modified else None
+
+    return etag, last_modified
+
+
+def get_not_modified_response(
+    request: Request, etag: Optional[str], last_modified: Optional[int]
+):
+    return get_conditional_response(
+        request._request, etag=etag, last_modified=last_modified
+    )
+
+
+def set_condition_headers(
+    request: Request, response: Any, etag: Optional[str], last_modified: Optional[int]
+):
+    if request.method not in ("GET", "HEAD"):
+        return
+
+    if last_modified and not response.has_header("Last-Modified"):
+        response["Last-Modified"] = http_date(last_modified)
+
+    if etag and not response.has_header("ETag"):
+        response["ETag"] = etag
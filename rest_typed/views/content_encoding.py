@@ -0,0 +1,87 @@
+import io
+import zlib
+
+from rest_framework.exceptions import APIException, ParseError
+from rest_framework.request import Request
+from rest_typed.utils import get_setting
+from rest_typed.views.raw_body import get_content_length
+
+ENCODING_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "x-gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+CHUNK_SIZE = 64 * 1024
+
+
+class RequestBodyTooLarge(APIException):
+    status_code = 413
+    default_detail = "Request body is too large."
+    default_code = "request_body_too_large"
+
+
+class UnsupportedContentEncoding(APIException):
+    status_code = 415
+    default_detail = 'Unsupported content encoding "{encoding}" in request.'
+    default_code = "unsupported_content_encoding"
+
+    def __init__(self, encoding, detail=None, code=None):
+        if detail is None:
+            detail = self.default_detail.format(encoding=encoding)
+        super().__init__(detail, code)
+
+
+def check_body_size(request: Request, max_body_size: int):
+    if get_content_length(request._request) > max_body_size:
+        raise RequestBodyTooLarge()
+
+
+def decode_request_body(request: Request, encodings: list, max_decoded_size: int):
+    """
+    Decompresses a gzip/deflate request body chunk by chunk before DRF's
+    parsers see it, giving up as soon as the output passes `max_decoded_size`.
+    """
+    http_request = request._request
+    encoding = http_request.META.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+
+    if encoding in ("", "identity"):
+        return
+
+    if encoding not in encodings:
+        raise UnsupportedContentEncoding(encoding)
+
+    decompressor = zlib.decompressobj(ENCODING_WBITS[encoding])
+    chunks = []
+    size = 0
+
+    try:
+        while not decompressor.eof:
+            chunk = http_request.read(CHUNK_SIZE)
+
+            if not chunk:
+                break
+
+            # Ask for one byte more than the cap allows, so a zip bomb stops
+            # expanding the moment it is known to be too large.
+            data = decompressor.decompress(chunk, max_decoded_size - size + 1)
+            size += len(data)
+
+            if size > max_decoded_size:
+                raise RequestBodyTooLarge()
+
+            chunks.append(data)
+    except zlib.error:
+        raise ParseError(f"Request body is not valid {encoding} data.")
+
+    if not decompressor.eof:
+        raise ParseError(f"Request body is not valid {encoding} data.")
+
+    body = b"".join(chunks)
+    http_request._body = body
+    http_request._stream = io.BytesIO(body)
+    http_request.META["CONTENT_LENGTH"] = str(len(body))
+    del http_request.META["HTTP_CONTENT_ENCODING"]
+
+
+def get_max_decoded_body_size() -> int:
+    return get_setting("max_decoded_body_size", 10 * 1024 * 1024)
@@ -1,13 +1,46 @@
+import functools
 import inspect
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
+from django.http import HttpRequest
 from rest_framework.decorators import action, api_view
 from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.request import Request
 from rest_framework.views import APIView
-from rest_typed.views.utils import find_request
+from rest_typed.views.utils import (
+    find_request,
+    get_typed_params,
+    is_deferred_param,
+    prevalidate,
+)
 
+from .background import submit_job
+from .conditional import (
+    evaluate_conditions,
+    get_not_modified_response,
+    prevalidate_conditions,
+    set_condition_headers,
+)
+from .content_encoding import (
+    check_body_size,
+    decode_request_body,
+    get_max_decoded_body_size,
+)
+from .dependencies import build_dependency_graph
+from .filters import compile_filters
+from .raw_body import prevalidate_raw_body
+from .idempotency import call_idempotent, prevalidate_idempotency
 from .param_factory import ParamFactory
+from .replicas import (
+    get_replicas,
+    pin_to_primary,
+    replica_view,
+    route_dispatch,
+    route_reads,
+)
+from .uploads import get_upload_limits, install_upload_handler
+from .view_settings import ViewSettings
 
 
 def wraps_drf(view):
@@ -38,69 +71,220 @@ def wraps_drf(view):
 def transform_view_params(
     view_func: Callable, request: Request, path_args: dict
 ) -> List[Any]:
-    typed_params = [
-        p for n, p in inspect.signature(view_func).parameters.items() if n != "self"
-    ]
+    validated_params, errors = ParamFactory.validate(
+        get_typed_params(view_func), request, path_args
+    )
 
-    # List[Parameter] -> see docs: https://docs.python.org/3/library/inspect.html#inspect.Parameter
+    if len(errors) > 0:
+        raise ValidationError(errors)
+
+    return list(validated_params.values())
+
+
+class TypedView(object):
+    """
+    What can be worked out about a typed view when it is decorated: its typed
+    params, their dependency graph, its HTTP methods and its settings.
+    """
+
+    def __init__(
+        self,
+        view: Callable,
+        methods: List[str],
+        view_settings: ViewSettings,
+        for_method: bool = False,
+    ):
+        prevalidate(view, for_method=for_method)
+        self.view = view
+        self.methods = [method.upper() for method in methods]
+        self.view_settings = view_settings
+        self.typed_params = get_typed_params(view)
+        prevalidate_raw_body(view, self.typed_params)
+        self.upload_limits = get_upload_limits(self.typed_params)
+        build_dependency_graph(self.typed_params)
+        compile_filters(self.typed_params)
+        prevalidate_conditions(view, self.typed_params, view_settings)
+
+        if view_settings.idempotent:
+            prevalidate_idempotency(view, self.typed_params)
+
+    def prepare(self, http_request: HttpRequest):
+        """
+        Sets up the Django request before DRF's `initial()` can read its body.
+        """
+        if self.upload_limits:
+            install_upload_handler(http_request, self.upload_limits)
+
+    def run(self, request: Request, path_args: dict, leading_args: List[Any]) -> Any:
+        with route_reads(request):
+            response = self.run_routed(request, path_args, leading_args)
 
-    validated_params = []
-    errors: Dict[str, Any] = {}
+        if request.method not in SAFE_METHODS and get_replicas():
+            pin_to_primary(request)
 
-    for param in typed_params:
-        p = ParamFactory.make(param, request, path_args)
-        value, error = p.validate_or_error()
+        return response
 
-        if error:
-            errors.update(error)
+    def run_routed(
+        self, request: Request, path_args: dict, leading_args: List[Any]
+    ) -> Any:
+        view_settings = self.view_settings
+        typed_params = self.typed_params
+        etag = last_modified = None
+
+        if view_settings.max_body_size is not None:
+            check_body_size(request, view_settings.max_body_size)
+
+        if view_settings.request_encodings:
+            decode_request_body(
+                request,
+                view_settings.request_encodings,
+                view_settings.max_decoded_body_size or get_max_decoded_body_size(),
+            )
+
+        # Already done by typed_api_view; actions are reached after initial().
+        self.prepare(request._request)
+
+        if view_settings.is_conditional:
+            # Resolve the cheap params first: a matching ETag or Last-Modified
+            # returns a 304 before the body or current user are ever validated.
+            values, errors = ParamFactory.validate(
+                [p for p in typed_params if not is_deferred_param(p)],
+                request,
+                path_args,
+            )
+
+            if not errors:
+                etag, last_modified = evaluate_conditions(view_settings, values)
+                response = get_not_modified_response(request, etag, last_modified)
+
+                if response is not None:
+                    return response
+
+            deferred_values, deferred_errors = ParamFactory.validate(
+                [p for p in typed_params if is_deferred_param(p)], request, path_args
+            )
+            values.update(deferred_values)
+            errors.update(deferred_errors)
         else:
-            validated_params.append(value)
+            values, errors = ParamFactory.validate(typed_params, request, path_args)
 
-    if len(errors) > 0:
-        raise ValidationError(errors)
+        if len(errors) > 0:
+            raise ValidationError(errors)
 
-    return validated_params
+        transformed = [values[p.name] for p in typed_params]
 
+        def call():
+            return self.view(*leading_args, *transformed)
 
-def prevalidate(view_func, for_method: bool = False):
-    arg_info = inspect.getfullargspec(view_func)
+        if view_settings.background:
+            run_view = call
 
-    if arg_info.varargs is not None or arg_info.varkw is not None:
-        raise Exception(
-            f"{view_func.__name__}: variable-length argument lists and dictionaries cannot be used with typed views"
+            def call():
+                return submit_job(request, run_view)
+
+        if view_settings.idempotent:
+            response = call_idempotent(request, typed_params, transformed, call)
+        else:
+            response = call()
+
+        if view_settings.is_conditional:
+            set_condition_headers(request, response, etag, last_modified)
+
+        return response
+
+    def call(
+        self, request: Request, values: Dict[str, Any], leading_args: List[Any]
+    ) -> Any:
+        """
+        Runs the view with Python values standing in for its path, query,
+        header and body params; no request content is read or parsed.
+        """
+        unknown = set(values) - {p.name for p in self.typed_params}
+
+        if unknown:
+            raise TypeError(
+                f"{self.view.__name__}() got unexpected keyword arguments: "
+                f"{', '.join(sorted(unknown))}"
+            )
+
+        validated, errors = ParamFactory.validate(
+            self.typed_params, request, {}, values=values
         )
 
-    if for_method:
-        error_msg = "For typed methods, 'self' must be passed as the first arg with no annotation"
+        if len(errors) > 0:
+            raise ValidationError(errors)
 
-        if (
-            len(arg_info.args) < 1
-            or arg_info.args[0] != "self"
-            or "self" in arg_info.annotations
-        ):
-            raise Exception(error_msg)
+        return self.view(*leading_args, *[validated[p.name] for p in self.typed_params])
 
 
-def typed_api_view(methods):
+def typed_api_view(
+    methods,
+    idempotent: bool = False,
+    etag: Callable[..., Optional[str]] = None,
+    last_modified: Callable[..., Any] = None,
+    request_encodings: List[str] = None,
+    max_body_size: int = None,
+    max_decoded_body_size: int = None,
+    background: bool = False,
+):
+    view_settings = ViewSettings(
+        idempotent=idempotent,
+        etag=etag,
+        last_modified=last_modified,
+        request_encodings=request_encodings,
+        max_body_size=max_body_size,
+        max_decoded_body_size=max_decoded_body_size,
+        background=background,
+    )
+
     def wrap_validate_and_render(view):
-        prevalidate(view)
+        typed_view = TypedView(view, methods, view_settings)
 
         @api_view(methods)
         @wraps_drf(view)
         def wrapper(*original_args, **original_kwargs):
             original_args = list(original_args)
             request = find_request(original_args)
-            transformed = transform_view_params(view, request, original_kwargs)
-            return view(*transformed)
+            return typed_view.run(request, original_kwargs, [])
 
-        return wrapper
+        @functools.wraps(wrapper)
+        def prepared(request, *args, **kwargs):
+            typed_view.prepare(request)
+            return wrapper(request, *args, **kwargs)
+
+        prepared.typed_view = typed_view
+        return replica_view(prepared)
 
     return wrap_validate_and_render
 
 
-def typed_action(**action_kwargs):
+def typed_action(
+    idempotent: bool = False,
+    etag: Callable[..., Optional[str]] = None,
+    last_modified: Callable[..., Any] = None,
+    request_encodings: List[str] = None,
+    max_body_size: int = None,
+    max_decoded_body_size: int = None,
+    background: bool = False,
+    **action_kwargs,
+):
+    view_settings = ViewSettings(
+        idempotent=idempotent,
+        etag=etag,
+        last_modified=last_modified,
+        request_encodings=request_encodings,
+        max_body_size=max_body_size,
+        max_decoded_body_size=max_decoded_body_size,
+        background=background,
+    )
+
     def wrap_validate_and_render(view):
-        prevalidate(view, for_method=True)
+        typed_view = TypedView(
+            view,
+            action_kwargs.get("methods") or ["get"],
+            view_settings,
+            for_method=True,
+        )
 
         @action(**action_kwargs)
         @wraps_drf(view)
@@ -108,9 +292,30 @@ def typed_action(**action_kwargs):
             original_args = list(original_args)
             request = find_request(original_args)
             selfy = original_args.pop(0)
-            transformed = transform_view_params(view, request, original_kwargs)
-            return view(selfy, *transformed)
+            return typed_view.run(request, original_kwargs, [selfy])
 
+        wrapper.typed_view = typed_view
         return wrapper
 
     return wrap_validate_and_render
+
+
+class TypedViewSetMixin(object):
+    """
+    Does for a ViewSet's `typed_action` methods what `typed_api_view` does
+    before DRF handles the request: `File()` limits are installed before
+    authentication can read the body, and the reads of safe-method requests,
+    authentication's included, go to a replica.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        name = getattr(self, "action_map", {}).get(request.method.lower())
+        typed_view = getattr(getattr(self, name or "", None), "typed_view", None)
+
+        if typed_view is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        typed_view.prepare(request)
+
+        with route_dispatch(request):
+            return super().dispatch(request, *args, **kwargs)
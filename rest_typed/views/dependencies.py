@@ -0,0 +1,156 @@
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_typed.utils import get_setting
+from rest_typed.views.param_settings import ParamSettings
+from rest_typed.views.params import Param
+from rest_typed.views.utils import (
+    get_explicit_param_settings,
+    get_typed_params,
+    prevalidate,
+)
+
+
+class Dependency(object):
+    """
+    A `Depends()` callable with its own typed params, resolved once when the
+    view is decorated.
+    """
+
+    def __init__(self, func: Callable, typed_params: List[inspect.Parameter]):
+        self.func = func
+        self.typed_params = typed_params
+        self.lock = threading.Lock()
+        self.process_cache: "OrderedDict[Any, Tuple[Any, Any]]" = OrderedDict()
+
+    def resolve(
+        self, request: Request, path_args: dict, settings: ParamSettings, source: str
+    ) -> Tuple[Any, Any]:
+        # Memoized per request, so a dependency shared by several params (or by
+        # other dependencies) runs once.
+        memo: dict = request.__dict__.setdefault("_typed_dependencies", {})
+
+        if self.func not in memo:
+            memo[self.func] = self.call(request, path_args, settings, source)
+
+        return memo[self.func]
+
+    def call(
+        self, request: Request, path_args: dict, settings: ParamSettings, source: str
+    ) -> Tuple[Any, Any]:
+        from rest_typed.views.param_factory import ParamFactory
+
+        values, errors = ParamFactory.validate(self.typed_params, request, path_args)
+
+        if errors:
+            return None, errors
+
+        try:
+            if settings.cache_scope == "process":
+                return self.call_cached(values, settings.ttl), None
+            return self.func(**values), None
+        except ValidationError as e:
+            return None, {source: e.detail}
+
+    def call_cached(self, values: Dict[str, Any], ttl: float = None) -> Any:
+        try:
+            key = tuple(sorted(values.items()))
+            hash(key)
+        except TypeError:
+            return self.func(**values)
+
+        if any(isinstance(v, Request) for v in values.values()):
+            return self.func(**values)
+
+        now = time.monotonic()
+
+        with self.lock:
+            hit = self.process_cache.get(key)
+
+            if hit is not None and (hit[0] is None or hit[0] > now):
+                return hit[1]
+
+        value = self.func(**values)
+        max_size = get_setting("dependency_cache_size", 1024)
+
+        with self.lock:
+            self.process_cache[key] = (None if ttl is None else now + ttl, value)
+
+            while len(self.process_cache) > max_size:
+                self.process_cache.popitem(last=False)
+
+        return value
+
+
+_graph: Dict[Callable, Dependency] = {}
+_graph_lock = threading.RLock()
+
+
+def build_dependency(func: Callable, path: Tuple[Callable, ...] = ()) -> Dependency:
+    if func in path:
+        names = [getattr(f, "__name__", repr(f)) for f in path + (func,)]
+        raise Exception(f"Circular dependency: {' -> '.join(names)}")
+
+    with _graph_lock:
+        if func in _graph:
+            return _graph[func]
+
+        prevalidate(func)
+        typed_params = get_typed_params(func)
+
+        for param in typed_params:
+            settings = get_explicit_param_settings(param)
+
+            if settings and settings.param_type == "depends":
+                build_dependency(settings.dependency, path + (func,))
+
+        _graph[func] = Dependency(func, typed_params)
+        return _graph[func]
+
+
+def build_dependency_graph(typed_params: List[inspect.Parameter]):
+    for param in typed_params:
+        settings = get_explicit_param_settings(param)
+
+        if settings and settings.param_type == "depends":
+            build_dependency(settings.dependency)
+
+
+def resolve_dependency(request: Request, func: Callable) -> Any:
+    """
+    Returns the request's memoized value for a dependency, resolving it if
+    needed. Useful inside custom validators that receive the request.
+    """
+    path_args = getattr(request, "parser_context", None) or {}
+    settings = ParamSettings("depends", dependency=func)
+    value, error = build_dependency(func).resolve(
+        request, path_args.get("kwargs", {}), settings, source=func.__name__
+    )
+
+    if error:
+        raise ValidationError(error)
+
+    return value
+
+
+class DependsParam(Param):
+    def __init__(
+        self,
+        param: inspect.Parameter,
+        request: Request,
+        settings: ParamSettings,
+        path_args: dict,
+    ):
+        super().__init__(param, request, settings)
+        self.path_args = path_args
+
+    def validate_or_error(self) -> Tuple[Any, Any]:
+        dependency = build_dependency(self.settings.dependency)
+        return dependency.resolve(
+            self.request, self.path_args, self.settings, self.source
+        )
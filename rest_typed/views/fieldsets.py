@@ -0,0 +1,232 @@
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
+from rest_typed.views.params import Param
+
+
+class FieldPlan(object):
+    """
+    The columns and relations a serializer field reads. `columns` is None when
+    that can't be worked out from its source (method fields, properties) and
+    the serializer's `Meta.field_sources` doesn't declare it.
+    """
+
+    def __init__(self, columns: Optional[Set[str]], relations: Set[str]):
+        self.columns = columns
+        self.relations = relations
+
+
+def plan_declared_sources(sources: List[str]) -> FieldPlan:
+    relations = {source.rsplit("__", 1)[0] for source in sources if "__" in source}
+    return FieldPlan(set(sources), relations)
+
+
+def plan_field(model: Type[models.Model], field: serializers.Field) -> FieldPlan:
+    if field.source == "*" or not field.source_attrs:
+        return FieldPlan(None, set())
+
+    opts = model._meta
+    path: List[str] = []
+
+    for attr in field.source_attrs:
+        try:
+            model_field = opts.get_field(attr)
+        except FieldDoesNotExist:
+            return FieldPlan(None, set())
+
+        path.append(model_field.name)
+        lookup = "__".join(path)
+
+        if not model_field.is_relation:
+            return FieldPlan({lookup}, set(["__".join(path[:-1])]) - {""})
+
+        if model_field.many_to_many or model_field.one_to_many:
+            return FieldPlan(set(), set())
+
+        opts = model_field.related_model._meta
+
+    # The source ends on a forward relation: its key column is enough unless
+    # the relation is rendered by a nested serializer.
+    if isinstance(field, serializers.BaseSerializer):
+        return FieldPlan({lookup}, {lookup})
+
+    return FieldPlan({lookup}, set(["__".join(path[:-1])]) - {""})
+
+
+_plans: Dict[Tuple[Any, Any], Dict[str, FieldPlan]] = {}
+_names: Dict[Any, Tuple[str, ...]] = {}
+_lock = threading.Lock()
+
+
+def get_field_names(serializer_class: Type[serializers.Serializer]) -> Tuple[str, ...]:
+    with _lock:
+        if serializer_class not in _names:
+            _names[serializer_class] = tuple(serializer_class().fields.keys())
+        return _names[serializer_class]
+
+
+def get_field_plans(
+    serializer_class: Type[serializers.Serializer], model: Type[models.Model]
+) -> Dict[str, FieldPlan]:
+    key = (serializer_class, model)
+
+    with _lock:
+        if key not in _plans:
+            fields = serializer_class().fields
+            declared = getattr(
+                getattr(serializer_class, "Meta", None), "field_sources", {}
+            )
+            _plans[key] = {
+                name: (
+                    plan_declared_sources(declared[name])
+                    if name in declared
+                    else plan_field(model, field)
+                )
+                for name, field in fields.items()
+            }
+        return _plans[key]
+
+
+class FieldSet(object):
+    """
+    A validated sparse fieldset. `apply()` narrows a queryset to the columns
+    and joins the requested fields need, and `get_serializer()` builds the
+    serializer with the other fields removed.
+    """
+
+    def __init__(
+        self,
+        serializer_class: Type[serializers.Serializer],
+        names: Optional[List[str]] = None,
+    ):
+        self.serializer_class = serializer_class
+        self.all_names = get_field_names(serializer_class)
+        self.names = list(names) if names is not None else list(self.all_names)
+
+    @property
+    def is_sparse(self) -> bool:
+        return len(self.names) < len(self.all_names)
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        if not self.is_sparse:
+            return queryset
+
+        plans = get_field_plans(self.serializer_class, queryset.model)
+        requested = [plans[name] for name in self.names]
+
+        # A requested field reads the instance in a way that can't be traced,
+        # so any column or join may be needed.
+        if any(plan.columns is None for plan in requested):
+            return queryset
+
+        relations = set().union(*[plan.relations for plan in requested])
+        queryset, joined = self.prune_select_related(queryset, relations)
+        columns = set()
+
+        for plan in requested:
+            for column in plan.columns:
+                relation = column.rsplit("__", 1)[0] if "__" in column else ""
+                # Columns on relations that aren't joined load lazily, so only
+                # their key column is needed here.
+                columns.add(
+                    column
+                    if not relation or relation in joined
+                    else column.split("__", 1)[0]
+                )
+
+        return queryset.only(queryset.model._meta.pk.name, *sorted(columns))
+
+    def prune_select_related(
+        self, queryset: QuerySet, relations: Set[str]
+    ) -> Tuple[QuerySet, Set[str]]:
+        select_related = queryset.query.select_related
+
+        if not isinstance(select_related, dict):
+            return queryset, set()
+
+        def walk(tree: dict, prefix: str = "") -> List[str]:
+            paths = []
+            for name, subtree in tree.items():
+                path = prefix + name
+                paths.append(path)
+                paths.extend(walk(subtree, path + "__"))
+            return paths
+
+        keep = [
+            path
+            for path in walk(select_related)
+            if any(r == path or r.startswith(path + "__") for r in relations)
+        ]
+        queryset = queryset.select_related(None)
+
+        if keep:
+            queryset = queryset.select_related(*keep)
+
+        return queryset, set(keep)
+
+    def get_serializer(self, *args, **kwargs) -> serializers.BaseSerializer:
+        serializer = self.serializer_class(*args, **kwargs)
+
+        if self.is_sparse:
+            target = getattr(serializer, "child", serializer)
+
+            for name in list(target.fields.keys()):
+                if name not in self.names:
+                    target.fields.pop(name)
+
+        return serializer
+
+
+class FieldsParam(Param):
+    @property
+    def source(self) -> str:
+        return self.settings.source or "fields"
+
+    def get_raw_value(self):
+        if self.raw_value is not empty:
+            return self.raw_value
+
+        raw = self.request.query_params.get(self.source, "")
+        return empty if raw == "" else raw
+
+    def validate_or_error(self) -> Tuple[Any, Any]:
+        serializer_class = self.settings.schema
+        raw = self.get_raw_value()
+
+        if raw is empty or raw is None:
+            default = self.settings.default
+            names = None if default is empty or default is None else list(default)
+            return FieldSet(serializer_class, names), None
+
+        if isinstance(raw, str):
+            raw = raw.split(self.settings.delimiter)
+
+        names: List[str] = []
+
+        for name in raw:
+            name = name.strip()
+            if name and name not in names:
+                names.append(name)
+
+        all_names = get_field_names(serializer_class)
+        unknown = [name for name in names if name not in all_names]
+
+        if unknown:
+            error = ValidationError(
+                f"Unknown fields: {', '.join(unknown)}. "
+                f"Choose from: {', '.join(all_names)}."
+            )
+            return None, {self.source: error.detail}
+
+        if not names:
+            return None, {
+                self.source: ValidationError("Select at least one field.").detail
+            }
+
+        return FieldSet(serializer_class, names), None
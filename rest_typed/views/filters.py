@@ -0,0 +1,288 @@
+import dataclasses
+import threading
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Q, QuerySet
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
+from rest_framework.request import Request
+from rest_typed import ParsedType
+from rest_typed.utils import inspect_complex_type
+from rest_typed.views.param_settings import ParamSettings
+from rest_typed.views.params import Param
+from rest_typed.views.utils import get_explicit_param_settings
+from rest_typed.views.validators import DrfValidator, PydanticValidator
+from typing_extensions import get_type_hints
+
+
+class UnindexedFilterWarning(UserWarning):
+    pass
+
+
+class FilterQuery(object):
+    """
+    What a `Filter()` param receives: the validated filter values and the
+    single `Q` object they compile to.
+    """
+
+    def __init__(self, q: Q, data: Dict[str, Any]):
+        self.q = q
+        self.data = data
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        return queryset.filter(self.q)
+
+
+class FilterField(object):
+    """
+    A schema field: `key` is the query parameter it is read from, and
+    `data_key` the key of its value in the validated data.
+    """
+
+    def __init__(self, name: str, key: str, data_key: str, lookup: str, is_list: bool):
+        self.name = name
+        self.key = key
+        self.data_key = data_key
+        self.lookup = lookup
+        self.is_list = is_list
+
+
+class CompiledFilter(object):
+    """
+    A filter schema worked out once per view: which query keys to read, which
+    of them are lists, and the ORM lookup each value is compiled into.
+    """
+
+    def __init__(
+        self,
+        schema: Any,
+        model: Type[models.Model],
+        fields: List[FilterField],
+        make_validator: Callable[[Request], Any],
+        to_data: Callable[[Any], Dict[str, Any]],
+    ):
+        self.schema = schema
+        self.model = model
+        self.fields = fields
+        self.make_validator = make_validator
+        self.to_data = to_data
+
+    def get_raw_values(self, query_params, delimiter: str) -> Dict[str, Any]:
+        raw = {}
+
+        for field in self.fields:
+            values = [v for v in query_params.getlist(field.key) if v != ""]
+
+            if not values:
+                continue
+
+            if field.is_list:
+                if len(values) == 1:
+                    values = values[0].split(delimiter)
+                raw[field.key] = values
+            else:
+                raw[field.key] = values[-1]
+
+        return raw
+
+    def compile(self, data: Dict[str, Any]) -> Q:
+        return Q(
+            **{
+                field.lookup: data[field.data_key]
+                for field in self.fields
+                if data.get(field.data_key) is not None
+            }
+        )
+
+
+def get_lookup_field(model: Type[models.Model], lookup: str) -> models.Field:
+    """
+    Walks a lookup like `author__name__icontains` to the model field it
+    filters on, raising if it does not start with a field.
+    """
+    field = None
+    opts = model._meta
+
+    for part in lookup.split("__"):
+        try:
+            field = opts.pk if part == "pk" else opts.get_field(part)
+        except FieldDoesNotExist:
+            if field is None:
+                raise
+            break
+
+        if field.is_relation and field.related_model is not None:
+            opts = field.related_model._meta
+        else:
+            break
+
+    return field
+
+
+def is_indexed(field: models.Field) -> bool:
+    if field.primary_key or field.unique or field.db_index:
+        return True
+
+    opts = field.model._meta
+    leading = [index.fields[0].lstrip("-") for index in opts.indexes if index.fields]
+    leading += [fields[0] for fields in opts.unique_together]
+    leading += [fields[0] for fields in opts.index_together]
+    return field.name in leading
+
+
+def warn_unindexed(schema: Any, model: Type[models.Model], fields: List[FilterField]):
+    for field in fields:
+        model_field = get_lookup_field(model, field.lookup)
+
+        if model_field.concrete and not is_indexed(model_field):
+            warnings.warn(
+                f"Filter field '{field.name}' of {schema.__name__} uses "
+                f"{model_field.model._meta.label}.{model_field.name}, "
+                f"which has no database index",
+                UnindexedFilterWarning,
+                stacklevel=2,
+            )
+
+
+def get_model(schema: Any, model: Optional[Type[models.Model]]):
+    if model is not None:
+        return model
+
+    meta = getattr(schema, "Meta", None)
+
+    if getattr(meta, "model", None) is None:
+        raise Exception(f"Filter({schema.__name__}) needs a 'model'")
+
+    return meta.model
+
+
+def serializer_from_dataclass(schema: Any) -> Type[serializers.Serializer]:
+    from rest_typed.serializers import TSerializer
+
+    hints = get_type_hints(schema)
+    attrs: Dict[str, Any] = {"__annotations__": {}}
+
+    for field in dataclasses.fields(schema):
+        attrs["__annotations__"][field.name] = hints[field.name]
+
+        if field.default is not dataclasses.MISSING:
+            attrs[field.name] = field.default
+        elif field.default_factory is not dataclasses.MISSING:
+            attrs[field.name] = field.default_factory
+
+    return type(f"{schema.__name__}Serializer", (TSerializer,), attrs)
+
+
+def compile_serializer(
+    schema: Type[serializers.Serializer], model: Type[models.Model]
+) -> CompiledFilter:
+    fields = []
+
+    for name, field in schema().fields.items():
+        # Validated data is keyed by source, which names the lookup.
+        source = field.source if field.source not in (None, "*") else name
+        fields.append(
+            FilterField(
+                name, name, source, source, isinstance(field, serializers.ListField)
+            )
+        )
+
+    return CompiledFilter(
+        schema,
+        model,
+        fields,
+        lambda request: DrfValidator(schema, request),
+        lambda serializer: dict(serializer.validated_data),
+    )
+
+
+def compile_pydantic(schema: Any, model: Type[models.Model]) -> CompiledFilter:
+    fields = [
+        FilterField(
+            name,
+            field.alias,
+            name,
+            name,
+            ParsedType(field.outer_type_).hint_is_list,
+        )
+        for name, field in schema.__fields__.items()
+    ]
+    return CompiledFilter(
+        schema,
+        model,
+        fields,
+        lambda request: PydanticValidator(schema),
+        lambda instance: instance.dict(),
+    )
+
+
+_compiled: Dict[Tuple[Any, Any], CompiledFilter] = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_filter(settings: ParamSettings) -> CompiledFilter:
+    key = (settings.schema, settings.model)
+
+    with _compiled_lock:
+        if key in _compiled:
+            return _compiled[key]
+
+        schema = settings.schema
+        model = get_model(schema, settings.model)
+
+        if dataclasses.is_dataclass(schema):
+            compiled = compile_serializer(serializer_from_dataclass(schema), model)
+        elif inspect_complex_type(schema) == "pydantic":
+            compiled = compile_pydantic(schema, model)
+        elif inspect_complex_type(schema) == "drf":
+            compiled = compile_serializer(schema, model)
+        else:
+            raise Exception(
+                "Filter schemas must be serializers, pydantic models or dataclasses"
+            )
+
+        for field in compiled.fields:
+            get_lookup_field(model, field.lookup)
+
+        warn_unindexed(settings.schema, model, compiled.fields)
+        _compiled[key] = compiled
+        return compiled
+
+
+def compile_filters(typed_params: list):
+    for param in typed_params:
+        settings = get_explicit_param_settings(param)
+
+        if settings and settings.param_type == "filter":
+            compile_filter(settings)
+
+
+class FilterParam(Param):
+    def get_raw_value(self):
+        compiled = compile_filter(self.settings)
+
+        if self.raw_value is not empty:
+            return self.raw_value
+
+        return compiled.get_raw_values(
+            self.request.query_params, self.settings.delimiter
+        )
+
+    def validate_or_error(self) -> Tuple[Any, Any]:
+        compiled = compile_filter(self.settings)
+        raw = self.get_raw_value()
+
+        if isinstance(raw, FilterQuery):
+            return raw, None
+
+        try:
+            validated = compiled.make_validator(self.request).run_validation(raw)
+        except ValidationError as e:
+            return None, {self.source: e.detail}
+
+        data = compiled.to_data(validated)
+        return FilterQuery(compiled.compile(data), data), None
@@ -0,0 +1,225 @@
+import hashlib
+import inspect
+import json
+import time
+from enum import Enum
+from typing import Any, Callable, List, Optional
+
+from django.core.cache import caches
+from django.core.files.uploadedfile import UploadedFile
+from django.db import models
+from rest_framework import serializers
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_typed.utils import get_setting, inspect_complex_type
+from rest_typed.views.fieldsets import FieldSet
+from rest_typed.views.filters import FilterQuery
+from rest_typed.views.pagination import CursorPage
+from rest_typed.views.param_settings import ParamSettings
+from rest_typed.views.params import HeaderParam
+from rest_typed.views.raw_body import get_raw_body_kind
+from rest_typed.views.utils import get_explicit_param_settings
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyConflict(APIException):
+    status_code = 409
+    default_detail = "A request with this Idempotency-Key is still being processed."
+    default_code = "idempotency_conflict"
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = 422
+    default_detail = (
+        "This Idempotency-Key was already used with different request parameters."
+    )
+    default_code = "idempotency_key_reused"
+
+
+def get_idempotency_key(request: Request) -> Optional[str]:
+    if IDEMPOTENCY_HEADER not in request.headers:
+        return None
+
+    param = inspect.Parameter(
+        "idempotency_key", inspect.Parameter.KEYWORD_ONLY, annotation=str
+    )
+    header = HeaderParam(
+        param,
+        request,
+        settings=ParamSettings(
+            "header", source=IDEMPOTENCY_HEADER, min_length=1, max_length=255
+        ),
+    )
+    value, error = header.validate_or_error()
+
+    if error:
+        raise ValidationError(error)
+
+    return value
+
+
+def prevalidate_idempotency(view_func: Callable, params: List[inspect.Parameter]):
+    """
+    Requests are matched on their params, so a stream body, which can only
+    be read by the view, can't be part of an idempotent view.
+    """
+    for param in params:
+        settings = get_explicit_param_settings(param)
+
+        if (
+            settings is not None
+            and settings.param_type == "body"
+            and get_raw_body_kind(param.annotation) == "stream"
+        ):
+            raise Exception(
+                f"{view_func.__name__}: idempotent views cannot take the stream "
+                f"body param '{param.name}'; use bytes instead"
+            )
+
+
+def hash_file(file: UploadedFile) -> str:
+    hasher = hashlib.sha256()
+
+    for chunk in file.chunks():
+        hasher.update(chunk)
+
+    file.seek(0)
+    return hasher.hexdigest()
+
+
+def canonical_value(value: Any) -> Any:
+    if isinstance(value, Request):
+        return None
+    if isinstance(value, serializers.BaseSerializer):
+        return value.validated_data
+    if isinstance(value, models.Model):
+        return [value._meta.label, value.pk]
+    if isinstance(value, CursorPage):
+        return [value.ordering, value.page_size, value.position, value.reverse]
+    if isinstance(value, FilterQuery):
+        return value.data
+    if isinstance(value, FieldSet):
+        return value.names
+    if isinstance(value, (bytes, memoryview)):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, UploadedFile):
+        return [value.name, value.size, hash_file(value)]
+    if isinstance(value, list) and any(isinstance(v, UploadedFile) for v in value):
+        return [canonical_value(v) for v in value]
+    if isinstance(value, Enum):
+        return value.value
+    if inspect_complex_type(type(value)) == "pydantic":
+        return value.dict()
+    return value
+
+
+def fingerprint(
+    request: Request, params: List[inspect.Parameter], validated_params: List[Any]
+) -> str:
+    """
+    Hashes the request's method, path and validated params. `Depends()`
+    results are left out: they are worked out from the request's other
+    inputs and may be any object.
+    """
+    values = []
+
+    for param, value in zip(params, validated_params):
+        settings = get_explicit_param_settings(param)
+
+        if settings is None or settings.param_type != "depends":
+            values.append([param.name, canonical_value(value)])
+
+    encoded = json.dumps(values, cls=JSONEncoder, sort_keys=True)
+    raw = f"{request.method}:{request.path}:{encoded}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def cache_key(request: Request, key: str) -> str:
+    user = getattr(request, "user", None)
+    owner = user.pk if getattr(user, "is_authenticated", False) else "anonymous"
+    digest = hashlib.sha256(f"{owner}:{key}".encode("utf-8")).hexdigest()
+    return f"rest_typed:idempotency:{digest}"
+
+
+def replay(stored: dict) -> Response:
+    response = Response(data=stored["data"], status=stored["status"])
+
+    for header, value in stored["headers"].items():
+        response[header] = value
+
+    response[REPLAYED_HEADER] = "true"
+    return response
+
+
+def store(cache, key: str, request_hash: str, response: Any):
+    if not isinstance(response, Response) or response.status_code >= 500:
+        return
+
+    headers = {
+        header: value
+        for header, value in response.items()
+        if header.lower() != "content-type"
+    }
+
+    cache.set(
+        key,
+        {
+            "fingerprint": request_hash,
+            "status": response.status_code,
+            "data": response.data,
+            "headers": headers,
+        },
+        get_setting("idempotency_ttl", 60 * 60 * 24),
+    )
+
+
+def call_idempotent(
+    request: Request,
+    params: List[inspect.Parameter],
+    validated_params: List[Any],
+    call_view: Callable[[], Any],
+) -> Any:
+    """
+    Runs the view at most once per Idempotency-Key: repeats receive the stored
+    response, and concurrent duplicates wait on a cache lock until it is ready.
+    """
+    key = get_idempotency_key(request)
+
+    if key is None:
+        return call_view()
+
+    cache = caches[get_setting("idempotency_cache", "default")]
+    result_key = cache_key(request, key)
+    lock_key = result_key + ":lock"
+    request_hash = fingerprint(request, params, validated_params)
+    lock_timeout = get_setting("idempotency_lock_timeout", 30)
+    deadline = time.monotonic() + get_setting("idempotency_wait_timeout", 10)
+
+    while True:
+        stored = cache.get(result_key)
+
+        if stored is not None:
+            if stored["fingerprint"] != request_hash:
+                raise IdempotencyKeyReused()
+            return replay(stored)
+
+        if cache.add(lock_key, request_hash, lock_timeout):
+            try:
+                stored = cache.get(result_key)
+
+                if stored is None:
+                    response = call_view()
+                    store(cache, result_key, request_hash, response)
+                    return response
+            finally:
+                cache.delete(lock_key)
+            continue
+
+        if time.monotonic() >= deadline:
+            raise IdempotencyConflict()
+
+        time.sleep(get_setting("idempotency_poll_interval", 0.05))
@@ -0,0 +1,343 @@
+"""
+MessagePack encoding for the parser and renderer. Uses the `msgpack` package
+when it is installed and otherwise falls back to the pure-Python codec below,
+which covers the full spec including the timestamp extension type.
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Tuple
+
+from django.utils import timezone as django_timezone
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+TIMESTAMP_EXT = -1
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class ExtType(object):
+    def __init__(self, code: int, data: bytes):
+        self.code = code
+        self.data = data
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ExtType)
+            and self.code == other.code
+            and self.data == other.data
+        )
+
+    def __repr__(self):
+        return f"ExtType({self.code}, {self.data!r})"
+
+
+def packb(obj: Any, default: Callable[[Any], Any] = None) -> bytes:
+    if msgpack is not None:
+        return msgpack.packb(obj, default=_library_default(default), use_bin_type=True)
+    return py_packb(obj, default)
+
+
+def unpackb(data: bytes) -> Any:
+    if msgpack is not None:
+        return msgpack.unpackb(data, raw=False, timestamp=3, strict_map_key=False)
+    return py_unpackb(data)
+
+
+def _library_default(default: Optional[Callable[[Any], Any]]):
+    def library_default(obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            return msgpack.Timestamp(*to_timestamp(obj))
+        if default is None:
+            raise TypeError(f"Cannot serialize {obj!r}")
+        return default(obj)
+
+    return library_default
+
+
+def to_timestamp(value: datetime) -> Tuple[int, int]:
+    if django_timezone.is_naive(value):
+        value = django_timezone.make_aware(value)
+
+    delta = value - EPOCH
+    return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+
+
+def from_timestamp(seconds: int, nanoseconds: int) -> datetime:
+    return EPOCH + timedelta(seconds=seconds, microseconds=nanoseconds // 1000)
+
+
+def py_packb(obj: Any, default: Callable[[Any], Any] = None) -> bytes:
+    chunks: List[bytes] = []
+    _pack(obj, chunks, default, depth=0)
+    return b"".join(chunks)
+
+
+def _pack(obj: Any, out: List[bytes], default, depth: int):
+    if depth > 512:
+        raise ValueError("Object is too deeply nested")
+
+    if obj is None:
+        out.append(b"\xc0")
+    elif obj is True:
+        out.append(b"\xc3")
+    elif obj is False:
+        out.append(b"\xc2")
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, float):
+        out.append(struct.pack(">Bd", 0xCB, obj))
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        n = len(data)
+
+        if n < 32:
+            out.append(struct.pack("B", 0xA0 | n))
+        else:
+            out.append(_pack_length(n, 0xD9, 0xDA, 0xDB))
+        out.append(data)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        out.append(_pack_length(len(data), 0xC4, 0xC5, 0xC6))
+        out.append(data)
+    elif isinstance(obj, dict):
+        n = len(obj)
+        out.append(
+            struct.pack("B", 0x80 | n) if n < 16 else _pack_length(n, None, 0xDE, 0xDF)
+        )
+
+        for key, value in obj.items():
+            _pack(key, out, default, depth + 1)
+            _pack(value, out, default, depth + 1)
+    elif isinstance(obj, (list, tuple)):
+        n = len(obj)
+        out.append(
+            struct.pack("B", 0x90 | n) if n < 16 else _pack_length(n, None, 0xDC, 0xDD)
+        )
+
+        for item in obj:
+            _pack(item, out, default, depth + 1)
+    elif isinstance(obj, datetime):
+        _pack_timestamp(*to_timestamp(obj), out)
+    elif isinstance(obj, ExtType):
+        _pack_ext(obj.code, obj.data, out)
+    elif default is not None:
+        _pack(default(obj), out, default, depth + 1)
+    else:
+        raise TypeError(f"Cannot serialize {obj!r}")
+
+
+def _pack_int(obj: int, out: List[bytes]):
+    if 0 <= obj < 0x80:
+        out.append(struct.pack("B", obj))
+    elif -32 <= obj < 0:
+        out.append(struct.pack("b", obj))
+    elif 0 <= obj <= 0xFF:
+        out.append(struct.pack(">BB", 0xCC, obj))
+    elif 0 <= obj <= 0xFFFF:
+        out.append(struct.pack(">BH", 0xCD, obj))
+    elif 0 <= obj <= 0xFFFFFFFF:
+        out.append(struct.pack(">BI", 0xCE, obj))
+    elif 0 <= obj <= 0xFFFFFFFFFFFFFFFF:
+        out.append(struct.pack(">BQ", 0xCF, obj))
+    elif -0x80 <= obj < 0:
+        out.append(struct.pack(">Bb", 0xD0, obj))
+    elif -0x8000 <= obj < 0:
+        out.append(struct.pack(">Bh", 0xD1, obj))
+    elif -0x80000000 <= obj < 0:
+        out.append(struct.pack(">Bi", 0xD2, obj))
+    elif -0x8000000000000000 <= obj < 0:
+        out.append(struct.pack(">Bq", 0xD3, obj))
+    else:
+        raise OverflowError("Integer is too large for MessagePack")
+
+
+def _pack_length(n: int, marker8: Optional[int], marker16: int, marker32: int):
+    if marker8 is not None and n <= 0xFF:
+        return struct.pack(">BB", marker8, n)
+    if n <= 0xFFFF:
+        return struct.pack(">BH", marker16, n)
+    if n <= 0xFFFFFFFF:
+        return struct.pack(">BI", marker32, n)
+    raise ValueError("Object is too large for MessagePack")
+
+
+def _pack_ext(code: int, data: bytes, out: List[bytes]):
+    fixed = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}
+    n = len(data)
+
+    if n in fixed:
+        out.append(struct.pack(">Bb", fixed[n], code))
+    else:
+        out.append(_pack_length(n, 0xC7, 0xC8, 0xC9))
+        out.append(struct.pack("b", code))
+    out.append(data)
+
+
+def _pack_timestamp(seconds: int, nanoseconds: int, out: List[bytes]):
+    if seconds >> 34 == 0:
+        if nanoseconds == 0 and seconds <= 0xFFFFFFFF:
+            data = struct.pack(">I", seconds)
+        else:
+            data = struct.pack(">Q", (nanoseconds << 34) | seconds)
+    else:
+        data = struct.pack(">Iq", nanoseconds, seconds)
+
+    _pack_ext(TIMESTAMP_EXT, data, out)
+
+
+def py_unpackb(data: bytes) -> Any:
+    view = memoryview(data)
+    obj, offset = _unpack(view, 0, depth=0)
+
+    if offset != len(view):
+        raise ValueError("Extra data after MessagePack object")
+
+    return obj
+
+
+def _read(view: memoryview, offset: int, n: int) -> Tuple[memoryview, int]:
+    end = offset + n
+
+    if end > len(view):
+        raise ValueError("Unexpected end of MessagePack data")
+
+    return view[offset:end], end
+
+
+def _unpack_struct(view: memoryview, offset: int, fmt: str) -> Tuple[Any, int]:
+    raw, offset = _read(view, offset, struct.calcsize(fmt))
+    return struct.unpack(fmt, raw)[0], offset
+
+
+def _unpack(view: memoryview, offset: int, depth: int) -> Tuple[Any, int]:
+    if depth > 512:
+        raise ValueError("Object is too deeply nested")
+
+    marker, offset = _unpack_struct(view, offset, "B")
+
+    if marker <= 0x7F:
+        return marker, offset
+    if marker >= 0xE0:
+        return marker - 0x100, offset
+    if 0xA0 <= marker <= 0xBF:
+        return _unpack_str(view, offset, marker & 0x1F)
+    if 0x90 <= marker <= 0x9F:
+        return _unpack_array(view, offset, marker & 0x0F, depth)
+    if 0x80 <= marker <= 0x8F:
+        return _unpack_map(view, offset, marker & 0x0F, depth)
+    if marker == 0xC0:
+        return None, offset
+    if marker == 0xC2:
+        return False, offset
+    if marker == 0xC3:
+        return True, offset
+
+    if marker in NUMBER_FORMATS:
+        return _unpack_struct(view, offset, NUMBER_FORMATS[marker])
+
+    if marker in LENGTH_FORMATS:
+        kind, fmt = LENGTH_FORMATS[marker]
+        n, offset = _unpack_struct(view, offset, fmt)
+
+        if kind == "str":
+            return _unpack_str(view, offset, n)
+        if kind == "bin":
+            raw, offset = _read(view, offset, n)
+            return bytes(raw), offset
+        if kind == "array":
+            return _unpack_array(view, offset, n, depth)
+        if kind == "map":
+            return _unpack_map(view, offset, n, depth)
+
+        code, offset = _unpack_struct(view, offset, "b")
+        return _unpack_ext(view, offset, code, n)
+
+    if marker in FIXEXT_SIZES:
+        code, offset = _unpack_struct(view, offset, "b")
+        return _unpack_ext(view, offset, code, FIXEXT_SIZES[marker])
+
+    raise ValueError(f"Invalid MessagePack marker 0x{marker:02x}")
+
+
+NUMBER_FORMATS = {
+    0xCA: ">f",
+    0xCB: ">d",
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+}
+
+LENGTH_FORMATS = {
+    0xC4: ("bin", ">B"),
+    0xC5: ("bin", ">H"),
+    0xC6: ("bin", ">I"),
+    0xC7: ("ext", ">B"),
+    0xC8: ("ext", ">H"),
+    0xC9: ("ext", ">I"),
+    0xD9: ("str", ">B"),
+    0xDA: ("str", ">H"),
+    0xDB: ("str", ">I"),
+    0xDC: ("array", ">H"),
+    0xDD: ("array", ">I"),
+    0xDE: ("map", ">H"),
+    0xDF: ("map", ">I"),
+}
+
+FIXEXT_SIZES = {0xD4: 1, 0xD5: 2, 0xD6: 4, 0xD7: 8, 0xD8: 16}
+
+
+def _unpack_str(view: memoryview, offset: int, n: int) -> Tuple[str, int]:
+    raw, offset = _read(view, offset, n)
+    return str(raw, "utf-8"), offset
+
+
+def _unpack_array(view, offset: int, n: int, depth: int) -> Tuple[list, int]:
+    items = []
+
+    for _ in range(n):
+        item, offset = _unpack(view, offset, depth + 1)
+        items.append(item)
+
+    return items, offset
+
+
+def _unpack_map(view, offset: int, n: int, depth: int) -> Tuple[dict, int]:
+    result = {}
+
+    for _ in range(n):
+        key, offset = _unpack(view, offset, depth + 1)
+        value, offset = _unpack(view, offset, depth + 1)
+
+        if isinstance(key, list):
+            key = tuple(key)
+
+        result[key] = value
+
+    return result, offset
+
+
+def _unpack_ext(view, offset: int, code: int, n: int) -> Tuple[Any, int]:
+    raw, offset = _read(view, offset, n)
+
+    if code != TIMESTAMP_EXT:
+        return ExtType(code, bytes(raw)), offset
+
+    if n == 4:
+        return from_timestamp(struct.unpack(">I", raw)[0], 0), offset
+    if n == 8:
+        value = struct.unpack(">Q", raw)[0]
+        return from_timestamp(value & 0x3FFFFFFFF, value >> 34), offset
+    if n == 12:
+        nanoseconds, seconds = struct.unpack(">Iq", raw)
+        return from_timestamp(seconds, nanoseconds), offset
+
+    raise ValueError("Invalid MessagePack timestamp")
@@ -0,0 +1,281 @@
+import json
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+from django.core import signing
+from django.db import connections, models
+from django.db.models import F, Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_typed.views.params import Param
+
+CURSOR_SALT = "rest_typed.views.pagination"
+PAGE_SIZE_QUERY_PARAM = "page_size"
+
+
+def encode_cursor(values: List[Optional[str]], reverse: bool) -> str:
+    return signing.dumps({"v": values, "r": reverse}, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(cursor: str) -> Tuple[List[Optional[str]], bool]:
+    try:
+        payload = signing.loads(cursor, salt=CURSOR_SALT)
+        return list(payload["v"]), bool(payload["r"])
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        raise ValidationError("Invalid cursor.")
+
+
+def estimate_count(queryset: QuerySet) -> int:
+    """
+    Reads the planner's row estimate instead of running COUNT(*). Only
+    PostgreSQL exposes one cheaply; other backends fall back to an exact count.
+    """
+    connection = connections[queryset.db]
+
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CursorPage(object):
+    """
+    A keyset page: `paginate()` filters a queryset to the rows after (or
+    before) the cursor's position in `ordering`, so each page costs the same
+    index range scan no matter how deep into the table it is.
+
+        def list_movies(page: CursorPage = Cursor(ordering=["-rating", "id"])):
+            movies = page.paginate(Movie.objects.all())
+            return page.get_response(MovieSerializer(movies, many=True).data)
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        ordering: List[str],
+        page_size: int,
+        position: Optional[List[Optional[str]]] = None,
+        reverse: bool = False,
+        count: str = None,
+        query_key: str = "cursor",
+    ):
+        self.request = request
+        self.ordering = ordering
+        self.page_size = page_size
+        self.position = position
+        self.reverse = reverse
+        self.count_mode = count
+        self.query_key = query_key
+        self.results: List[Any] = []
+        self.count: Optional[int] = None
+        self.next_cursor: Optional[str] = None
+        self.previous_cursor: Optional[str] = None
+
+    def get_fields(self, model) -> List[Tuple[models.Field, bool]]:
+        fields = []
+
+        for name in self.ordering:
+            descending = name.startswith("-")
+            name = name.lstrip("-")
+            field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+            fields.append((field, descending))
+
+        # The last ordering field must be unique for positions to be exact.
+        if not fields[-1][0].unique:
+            fields.append((model._meta.pk, False))
+
+        return fields
+
+    def get_keyset_filter(
+        self, fields: List[Tuple[models.Field, bool]], values: List[Any]
+    ) -> Q:
+        """
+        Matches the rows after `values` in the page's order, in which NULLs
+        sort after every other value (see `get_order_by()`).
+        """
+        condition = Q()
+        equal = Q()
+
+        for (field, descending), value in zip(fields, values):
+            name = field.name
+            greater = descending == self.reverse
+
+            if value is None:
+                after = None if greater else Q(**{f"{name}__isnull": False})
+                same = Q(**{f"{name}__isnull": True})
+            else:
+                after = Q(**{f"{name}__{'gt' if greater else 'lt'}": value})
+                same = Q(**{name: value})
+
+                if greater and field.null:
+                    after |= Q(**{f"{name}__isnull": True})
+
+            if after is not None:
+                condition |= equal & after
+
+            equal &= same
+
+        # Nothing sorts after a position of NULLs only.
+        return condition if condition else Q(pk__in=[])
+
+    def get_order_by(self, fields: List[Tuple[models.Field, bool]]) -> List[Any]:
+        order_by = []
+
+        for field, descending in fields:
+            descending = descending != self.reverse
+
+            if not field.null:
+                order_by.append(("-" if descending else "") + field.name)
+            elif descending:
+                order_by.append(F(field.name).desc(nulls_first=True))
+            else:
+                order_by.append(F(field.name).asc(nulls_last=True))
+
+        return order_by
+
+    def get_values(self, fields: List[Tuple[models.Field, bool]]) -> List[Any]:
+        if len(self.position) != len(fields):
+            raise ValidationError({self.query_key: ["Invalid cursor."]})
+
+        try:
+            return [
+                None if value is None else field.to_python(value)
+                for (field, _), value in zip(fields, self.position)
+            ]
+        except Exception:
+            raise ValidationError({self.query_key: ["Invalid cursor."]})
+
+    def get_cursor(
+        self, fields: List[Tuple[models.Field, bool]], obj: models.Model, reverse: bool
+    ) -> str:
+        return encode_cursor(
+            [
+                (
+                    None
+                    if field.value_from_object(obj) is None
+                    else field.value_to_string(obj)
+                )
+                for field, _ in fields
+            ],
+            reverse,
+        )
+
+    def paginate(self, queryset: QuerySet) -> List[Any]:
+        fields = self.get_fields(queryset.model)
+
+        if self.count_mode == "estimated":
+            self.count = estimate_count(queryset)
+        elif self.count_mode == "exact":
+            self.count = queryset.count()
+
+        queryset = queryset.order_by(*self.get_order_by(fields))
+
+        if self.position is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(fields, self.get_values(fields))
+            )
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, self.position is not None
+
+        if rows and has_next:
+            self.next_cursor = self.get_cursor(fields, rows[-1], reverse=False)
+        if rows and has_previous:
+            self.previous_cursor = self.get_cursor(fields, rows[0], reverse=True)
+
+        self.results = rows
+        return rows
+
+    def get_link(self, cursor: Optional[str]) -> Optional[str]:
+        if cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.query_key, cursor)
+
+    def get_next_link(self) -> Optional[str]:
+        return self.get_link(self.next_cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        return self.get_link(self.previous_cursor)
+
+    def get_response(self, data: Any) -> Response:
+        body = OrderedDict(
+            [("next", self.get_next_link()), ("previous", self.get_previous_link())]
+        )
+
+        if self.count_mode is not None:
+            body["count"] = self.count
+
+        body["results"] = data
+        return Response(body)
+
+
+class CursorParam(Param):
+    def get_raw_value(self):
+        if self.raw_value is not empty:
+            return self.raw_value
+
+        raw = self.request.query_params.get(self.source, "")
+        return empty if raw == "" else raw
+
+    @property
+    def source(self) -> str:
+        return self.settings.source or "cursor"
+
+    def get_page_size(self) -> int:
+        settings = self.settings
+        page_size = settings.page_size or api_settings.PAGE_SIZE or 100
+
+        if settings.max_page_size is None:
+            return page_size
+
+        raw = self.request.query_params.get(PAGE_SIZE_QUERY_PARAM)
+
+        try:
+            requested = int(raw)
+        except (TypeError, ValueError):
+            return page_size
+
+        return min(max(requested, 1), settings.max_page_size)
+
+    def validate_or_error(self) -> Tuple[Any, Any]:
+        raw = self.get_raw_value()
+        position, reverse = None, False
+
+        if raw is not empty and raw is not None:
+            try:
+                position, reverse = decode_cursor(str(raw))
+            except ValidationError as e:
+                return None, {self.source: e.detail}
+
+        page = CursorPage(
+            self.request,
+            self.settings.ordering,
+            self.get_page_size(),
+            position=position,
+            reverse=reverse,
+            count=self.settings.count,
+            query_key=self.source,
+        )
+        return page, None
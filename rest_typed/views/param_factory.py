@@ -1,16 +1,25 @@
 import inspect
+from typing import Any, Dict, List, Tuple
 
 from rest_framework.fields import empty
 from rest_framework.request import Request
+from rest_typed.views.dependencies import DependsParam
+from rest_typed.views.fieldsets import FieldsParam
+from rest_typed.views.filters import FilterParam
+from rest_typed.views.pagination import CursorParam
 from rest_typed.views.param_settings import ParamSettings
 from rest_typed.views.params import (
     BodyParam,
     CurrentUserParam,
+    FileParam,
     HeaderParam,
     PassThruParam,
     PathParam,
     QueryParam,
+    RawBodyParam,
+    ValueParam,
 )
+from rest_typed.views.raw_body import get_raw_body_kind
 from rest_typed.views.utils import (
     get_default_value,
     get_explicit_param_settings,
@@ -34,6 +43,12 @@ class ParamFactory(object):
                     param, request, settings=explicit_settings, raw_value=raw_value
                 )
             elif explicit_settings.param_type == "body":
+                kind = get_raw_body_kind(param.annotation)
+
+                if kind:
+                    return RawBodyParam(
+                        param, request, settings=explicit_settings, kind=kind
+                    )
                 return BodyParam(param, request, settings=explicit_settings)
             elif explicit_settings.param_type == "header":
                 return HeaderParam(param, request, settings=explicit_settings)
@@ -41,6 +56,18 @@ class ParamFactory(object):
                 return CurrentUserParam(param, request, settings=explicit_settings)
             elif explicit_settings.param_type == "query_param":
                 return QueryParam(param, request, settings=explicit_settings)
+            elif explicit_settings.param_type == "file":
+                return FileParam(param, request, settings=explicit_settings)
+            elif explicit_settings.param_type == "cursor":
+                return CursorParam(param, request, settings=explicit_settings)
+            elif explicit_settings.param_type == "filter":
+                return FilterParam(param, request, settings=explicit_settings)
+            elif explicit_settings.param_type == "fields":
+                return FieldsParam(param, request, settings=explicit_settings)
+            elif explicit_settings.param_type == "depends":
+                return DependsParam(
+                    param, request, settings=explicit_settings, path_args=path_args
+                )
             raise Exception("Could not determine typed view param!")
         elif is_explicit_request_param(param):
             return PassThruParam(request)
@@ -65,3 +92,73 @@ class ParamFactory(object):
                 request,
                 settings=ParamSettings(param_type="query_param", default=default),
             )
+
+    @classmethod
+    def make_from_value(cls, param: inspect.Parameter, request: Request, value: Any):
+        explicit_settings = get_explicit_param_settings(param)
+        param_type = explicit_settings.param_type if explicit_settings else None
+
+        if param_type == "current_user" or is_explicit_request_param(param):
+            return cls.make(param, request, {})
+        elif param_type == "file":
+            return FileParam(
+                param, request, settings=explicit_settings, raw_value=value
+            )
+        elif param_type == "body" and get_raw_body_kind(param.annotation):
+            return RawBodyParam(
+                param,
+                request,
+                settings=explicit_settings,
+                raw_value=value,
+                kind=get_raw_body_kind(param.annotation),
+            )
+        elif param_type == "cursor":
+            return CursorParam(
+                param, request, settings=explicit_settings, raw_value=value
+            )
+        elif param_type == "filter":
+            return FilterParam(
+                param, request, settings=explicit_settings, raw_value=value
+            )
+        elif param_type == "fields":
+            return FieldsParam(
+                param, request, settings=explicit_settings, raw_value=value
+            )
+        elif param_type == "depends":
+            if value is empty:
+                return cls.make(param, request, {})
+            return PassThruParam(value)
+        elif not explicit_settings and is_implicit_request_param(param):
+            return PassThruParam(request)
+
+        settings = explicit_settings or ParamSettings(
+            param_type="body" if is_implicit_body_param(param) else "query_param",
+            default=get_default_value(param),
+        )
+        return ValueParam(param, request, settings=settings, raw_value=value)
+
+    @classmethod
+    def validate(
+        cls,
+        typed_params: List[inspect.Parameter],
+        request: Request,
+        path_args: dict,
+        values: Dict[str, Any] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        validated_params: Dict[str, Any] = {}
+        errors: Dict[str, Any] = {}
+
+        for param in typed_params:
+            if values is None:
+                p = cls.make(param, request, path_args)
+            else:
+                p = cls.make_from_value(param, request, values.get(param.name, empty))
+
+            value, error = p.validate_or_error()
+
+            if error:
+                errors.update(error)
+            else:
+                validated_params[param.name] = value
+
+        return validated_params, errors
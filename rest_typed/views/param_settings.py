@@ -1,4 +1,5 @@
-from typing import Any, List, Optional
+import hashlib
+from typing import Any, Callable, List, Optional
 
 from rest_framework.fields import empty
 
@@ -32,8 +33,21 @@ class ParamSettings(object):
     protocol: str
     child: Optional["ParamSettings"]
     allow_empty: Optional[bool]
+    container: Optional[str]
     member_of: Optional[str]
     member_of_any: List[str]
+    dependency: Optional[Callable]
+    cache_scope: str
+    ttl: Optional[float]
+    max_size: Optional[int]
+    content_types: Optional[List[str]]
+    checksum: Optional[str]
+    ordering: Optional[List[str]]
+    page_size: Optional[int]
+    max_page_size: Optional[int]
+    count: Optional[str]
+    schema: Optional[Any]
+    model: Optional[Any]
 
     def __init__(
         self,
@@ -69,9 +83,26 @@ class ParamSettings(object):
         # ListField arg
         child: "ParamSettings" = None,
         allow_empty: bool = True,
+        container: str = None,
         # Current user validator arg
         member_of: str = None,
         member_of_any: List[str] = [],
+        # Depends args
+        dependency: Callable = None,
+        cache_scope: str = "request",
+        ttl: float = None,
+        # File args
+        max_size: int = None,
+        content_types: List[str] = None,
+        checksum: str = None,
+        # Cursor args
+        ordering: List[str] = None,
+        page_size: int = None,
+        max_page_size: int = None,
+        count: str = None,
+        # Filter args
+        schema: Any = None,
+        model: Any = None,
     ):
         self.param_type = param_type
         self.default = default
@@ -101,8 +132,21 @@ class ParamSettings(object):
         self.protocol = protocol
         self.child = child
         self.allow_empty = allow_empty
+        self.container = container
         self.member_of = member_of
         self.member_of_any = member_of_any
+        self.dependency = dependency
+        self.cache_scope = cache_scope
+        self.ttl = ttl
+        self.max_size = max_size
+        self.content_types = content_types
+        self.checksum = checksum
+        self.ordering = list(ordering) if ordering else None
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.count = count
+        self.schema = schema
+        self.model = model
 
         if self.regex and self.format:
             raise Exception("Cannot set both 'regex' and 'format'")
@@ -125,14 +169,47 @@ class ParamSettings(object):
                 "'format' must be one of: uuid, email, slug, url, ip_address, file_path"
             )
 
+        if self.container is not None and self.container not in (
+            "list",
+            "tuple",
+            "frozenset",
+            "array",
+        ):
+            raise Exception("'container' must be one of: list, tuple, frozenset, array")
+
+        if self.cache_scope not in ("request", "process"):
+            raise Exception("'cache_scope' must be one of: request, process")
+
+        if self.checksum and self.checksum not in hashlib.algorithms_available:
+            raise Exception(
+                f"'checksum' must be one of: {', '.join(sorted(hashlib.algorithms_available))}"
+            )
+
+        if self.param_type == "depends" and not callable(self.dependency):
+            raise Exception("'dependency' must be a callable")
+
+        if self.param_type == "cursor" and not self.ordering:
+            raise Exception("'ordering' is required for cursor params")
+
+        if self.param_type in ("filter", "fields") and self.schema is None:
+            raise Exception(f"'schema' is required for {self.param_type} params")
+
+        if self.count not in (None, "exact", "estimated"):
+            raise Exception("'count' must be one of: exact, estimated")
+
         if self.param_type and self.param_type not in (
             "body",
             "query_param",
             "path",
             "current_user",
             "header",
+            "depends",
+            "file",
+            "cursor",
+            "filter",
+            "fields",
             # "cookie",
         ):
             raise Exception(
-                "'param_type' must be one of: body, query_param, path, current_user, header"
+                "'param_type' must be one of: body, query_param, path, current_user, header, depends, file, cursor, filter, fields"
             )
@@ -1,14 +1,28 @@
 import inspect
+from enum import Enum
 from typing import Any, Tuple
 
+from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import Field, empty
 from rest_framework.request import Request
 from rest_typed import ParsedType
+from rest_typed.utils import inspect_complex_type
 from rest_typed.views.param_settings import ParamSettings
+from rest_typed.views.raw_body import (
+    get_content_length,
+    is_body_loaded,
+    read_raw_body,
+    too_long_error,
+)
+from rest_typed.views.uploads import get_upload_handler
 from rest_typed.views.utils import get_nested_value
 from rest_typed.views.validator_factory import ValidatorFactory
-from rest_typed.views.validators import CurrentUserValidator
+from rest_typed.views.validators import (
+    CurrentUserValidator,
+    FileValidator,
+    RawBodyValidator,
+)
 
 
 class Param(object):
@@ -54,7 +68,13 @@ class QueryParam(Param):
             raw = self.request.query_params.get(key, empty)
             raw = empty if raw == "" else raw
 
-            if raw is not empty and self.parsed_type.resolved_type is list:
+            if (
+                raw is not empty
+                and self.parsed_type.resolved_type is list
+                and not ValidatorFactory.is_bulk_list(
+                    self.parsed_type.inner_list_type, self.settings
+                )
+            ):
                 raw = raw.split(self.settings.delimiter)
 
         return raw
@@ -66,6 +86,32 @@ class PathParam(Param):
         return raw
 
 
+class ValueParam(Param):
+    """
+    A param whose value is passed in directly by the caller (in-process calls)
+    instead of being read from the request.
+    """
+
+    def get_raw_value(self):
+        if isinstance(self.raw_value, Enum):
+            return self.raw_value.value
+        if isinstance(self.raw_value, serializers.BaseSerializer):
+            # Serializers are validated from the data they were given; one
+            # without data is rejected by the validator as not a dictionary.
+            return getattr(self.raw_value, "initial_data", self.raw_value)
+        return self.raw_value
+
+    def validate_or_error(self) -> Tuple[Any, Any]:
+        resolved_type = self.parsed_type.resolved_type
+
+        if inspect_complex_type(resolved_type) == "pydantic" and isinstance(
+            self.raw_value, resolved_type
+        ):
+            return self.raw_value, None
+
+        return super().validate_or_error()
+
+
 class PassThruParam(object):
     def __init__(self, value: Any):
         self.value = value
@@ -81,6 +127,35 @@ class BodyParam(Param):
         return get_nested_value(self.request.data, self.settings.source, fallback=empty)
 
 
+class RawBodyParam(Param):
+    def __init__(self, *args, kind: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.kind = kind
+
+    def get_validator(self) -> RawBodyValidator:
+        return RawBodyValidator(self.settings, self.kind)
+
+    def get_raw_value(self):
+        if self.raw_value is not empty:
+            return self.raw_value
+
+        http_request = self.request._request
+        max_length = self.settings.max_length
+        content_length = get_content_length(http_request)
+
+        if max_length is not None and content_length > max_length:
+            raise too_long_error(max_length)
+
+        if not is_body_loaded(http_request):
+            if content_length == 0:
+                return empty
+            if self.kind == "stream":
+                return http_request
+
+        body = read_raw_body(http_request, max_length)
+        return body if len(body) > 0 else empty
+
+
 class HeaderParam(Param):
     def get_raw_value(self):
         headers = {
@@ -100,6 +175,25 @@ class HeaderParam(Param):
         return raw
 
 
+class FileParam(Param):
+    def get_validator(self) -> FileValidator:
+        return FileValidator(
+            self.settings,
+            many=self.parsed_type.hint_is_list,
+            handler=get_upload_handler(self.request),
+            field_name=self.source,
+        )
+
+    def get_raw_value(self):
+        if self.raw_value is not empty:
+            return self.raw_value
+
+        if self.parsed_type.hint_is_list:
+            return self.request.FILES.getlist(self.source)
+
+        return self.request.FILES.get(self.source, empty)
+
+
 class CurrentUserParam(Param):
     def get_raw_value(self):
         if self.settings.source in ("*", None):
@@ -0,0 +1,18 @@
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_typed.views.msgpack_codec import unpackb
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses MessagePack-encoded request bodies. Timestamps decode to aware
+    `datetime` objects, which DRF's date/time fields accept as-is.
+    """
+
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return unpackb(stream.read() if stream is not None else b"")
+        except Exception as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -0,0 +1,89 @@
+import inspect
+import io
+import typing
+from inspect import isclass
+from typing import Any, Callable, List, Optional
+
+from django.http import HttpRequest
+from rest_framework.exceptions import ValidationError
+from rest_typed import ParsedType
+from rest_typed.views.utils import get_explicit_param_settings, is_implicit_body_param
+
+
+def get_raw_body_kind(hint: Any) -> Optional[str]:
+    """
+    `Body()` params annotated as `bytes`, `memoryview` or a binary file-like
+    type receive the request body as-is instead of going through DRF's parsers.
+    """
+    hint = ParsedType(hint).resolved_hint
+
+    if hint is bytes:
+        return "bytes"
+
+    if hint is memoryview:
+        return "memoryview"
+
+    origin = typing.get_origin(hint) or hint
+
+    if isclass(origin) and issubclass(origin, (typing.IO, io.IOBase)):
+        return "stream"
+
+    return None
+
+
+def prevalidate_raw_body(view_func: Callable, params: List[inspect.Parameter]):
+    """
+    The raw body can only be read once, so a raw body param must be the view's
+    only body param.
+    """
+    raw, other = [], []
+
+    for param in params:
+        settings = get_explicit_param_settings(param)
+
+        if settings is not None and settings.param_type == "body":
+            (raw if get_raw_body_kind(param.annotation) else other).append(param.name)
+        elif settings is None and is_implicit_body_param(param):
+            other.append(param.name)
+
+    others = raw[1:] + other
+
+    if raw and others:
+        raise Exception(
+            f"{view_func.__name__}: raw body param '{raw[0]}' cannot be combined "
+            f"with other body params: {', '.join(others)}"
+        )
+
+
+def get_content_length(http_request: HttpRequest) -> int:
+    try:
+        return int(http_request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        return 0
+
+
+def too_long_error(max_length: int) -> ValidationError:
+    return ValidationError(f"Ensure this field has no more than {max_length} bytes.")
+
+
+def is_body_loaded(http_request: HttpRequest) -> bool:
+    return hasattr(http_request, "_body")
+
+
+def read_raw_body(http_request: HttpRequest, max_length: int = None) -> bytes:
+    """
+    Reads the body once and keeps it on the request, as `HttpRequest.body`
+    does. With an explicit `max_length` that limit replaces Django's
+    DATA_UPLOAD_MAX_MEMORY_SIZE, and at most one byte past it is read.
+    """
+    if max_length is None or is_body_loaded(http_request):
+        return http_request.body
+
+    body = http_request.read(max_length + 1)
+
+    if len(body) > max_length:
+        raise too_long_error(max_length)
+
+    http_request._body = body
+    http_request._stream = io.BytesIO(body)
+    return body
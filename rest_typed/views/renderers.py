@@ -0,0 +1,31 @@
+import decimal
+import uuid
+from typing import Any
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+from rest_typed.views.msgpack_codec import packb
+
+
+def encode_default(obj: Any) -> Any:
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    return JSONEncoder().default(obj)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders responses as MessagePack. Datetimes use the timestamp extension
+    type; decimals and UUIDs are sent as strings, and anything else is
+    converted the same way DRF's JSON renderer would.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return packb(data, default=encode_default)
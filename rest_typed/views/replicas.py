@@ -0,0 +1,126 @@
+import functools
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional
+
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_typed.utils import get_setting
+
+_read_alias: ContextVar[Optional[str]] = ContextVar(
+    "rest_typed_read_alias", default=None
+)
+
+
+class ReplicaRouter(object):
+    """
+    Sends reads to the replica chosen for the current safe-method typed
+    request. Add it to DATABASE_ROUTERS ahead of any other routers.
+    """
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        return _read_alias.get()
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # Replicas hold the primary's data, so objects read from either can
+        # be related to each other.
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+
+def get_replicas() -> List[str]:
+    return get_setting("read_replicas", [])
+
+
+@contextmanager
+def read_from(alias: Optional[str]) -> Iterator[None]:
+    token = _read_alias.set(alias)
+
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def pin_key(request: Request) -> Optional[str]:
+    user = getattr(request, "user", None)
+
+    if not getattr(user, "is_authenticated", False):
+        return None
+
+    digest = hashlib.sha256(str(user.pk).encode("utf-8")).hexdigest()
+    return f"rest_typed:replica_pin:{digest}"
+
+
+def is_pinned(request: Request) -> bool:
+    key = pin_key(request)
+
+    if key is None:
+        return False
+
+    return caches[get_setting("replica_cache", "default")].get(key) is not None
+
+
+def pin_to_primary(request: Request):
+    """
+    After a write, keeps the user's reads on the primary for the stickiness
+    window so they see their own changes despite replication lag.
+    """
+    key = pin_key(request)
+    stickiness = get_setting("replica_stickiness", 10)
+
+    if key is not None and stickiness > 0:
+        caches[get_setting("replica_cache", "default")].set(key, True, stickiness)
+
+
+@contextmanager
+def route_reads(request: Request) -> Iterator[None]:
+    replicas = get_replicas()
+
+    if not replicas or request.method not in SAFE_METHODS:
+        yield
+    elif is_pinned(request):
+        with read_from(None):
+            yield
+    elif _read_alias.get() in replicas:
+        yield
+    else:
+        with read_from(random.choice(replicas)):
+            yield
+
+
+@contextmanager
+def route_dispatch(request) -> Iterator[None]:
+    """
+    Sends the reads made while a safe-method request is dispatched, before
+    the typed view runs (such as authentication's user lookup), to a replica.
+    """
+    replicas = get_replicas()
+
+    if not replicas or request.method not in SAFE_METHODS:
+        yield
+    else:
+        with read_from(random.choice(replicas)):
+            yield
+
+
+def replica_view(view_func: Callable) -> Callable:
+    """
+    Wraps a view function so its whole dispatch is routed by
+    `route_dispatch()`.
+    """
+
+    @functools.wraps(view_func)
+    def routed(request, *args, **kwargs):
+        with route_dispatch(request):
+            return view_func(request, *args, **kwargs)
+
+    return routed
@@ -0,0 +1,118 @@
+import hashlib
+import inspect
+from typing import Dict, List, Optional
+
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile, StopUpload
+from django.http import HttpRequest
+from django.template.defaultfilters import filesizeformat
+from rest_framework.request import Request
+from rest_typed.views.param_settings import ParamSettings
+from rest_typed.views.utils import get_explicit_param_settings
+
+
+class TypedUploadHandler(FileUploadHandler):
+    """
+    Runs ahead of Django's own upload handlers to enforce `File()` limits while
+    chunks arrive: wrong content types are skipped, oversize uploads stop the
+    upload outright, and the checksum is computed as the data streams through.
+    """
+
+    def __init__(self, request=None, limits: Dict[str, ParamSettings] = None):
+        super().__init__(request)
+        self.limits = limits or {}
+        self.errors: Dict[str, List[str]] = {}
+        self.checksums: Dict[str, List[str]] = {}
+        self.settings: Optional[ParamSettings] = None
+        self.hasher = None
+        self.received = 0
+
+    def add_error(self, message: str):
+        self.errors.setdefault(self.field_name, []).append(message)
+
+    def new_file(self, field_name, file_name, content_type, content_length, *args):
+        super().new_file(field_name, file_name, content_type, content_length, *args)
+        self.settings = self.limits.get(field_name)
+        self.hasher = None
+        self.received = 0
+
+        if self.settings is None:
+            return
+
+        if (
+            self.settings.content_types is not None
+            and content_type not in self.settings.content_types
+        ):
+            self.add_error(f"Unsupported file type '{content_type}'.")
+            raise SkipFile()
+
+        if self.exceeds_max_size(content_length or 0):
+            raise StopUpload(connection_reset=True)
+
+        if self.settings.checksum:
+            self.hasher = hashlib.new(self.settings.checksum)
+
+    def exceeds_max_size(self, size: int) -> bool:
+        max_size = self.settings.max_size
+
+        if max_size is None or size <= max_size:
+            return False
+
+        self.add_error(
+            f"Ensure this file is no larger than {filesizeformat(max_size)}."
+        )
+        return True
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.settings is not None:
+            self.received += len(raw_data)
+
+            if self.exceeds_max_size(self.received):
+                raise StopUpload(connection_reset=True)
+
+            if self.hasher is not None:
+                self.hasher.update(raw_data)
+
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.hasher is not None:
+            self.checksums.setdefault(self.field_name, []).append(
+                self.hasher.hexdigest()
+            )
+        return None
+
+
+def get_upload_limits(
+    typed_params: List[inspect.Parameter],
+) -> Dict[str, ParamSettings]:
+    limits = {}
+
+    for param in typed_params:
+        settings = get_explicit_param_settings(param)
+
+        if settings and settings.param_type == "file":
+            limits[settings.source or param.name] = settings
+
+    return limits
+
+
+def install_upload_handler(
+    http_request: HttpRequest, limits: Dict[str, ParamSettings]
+) -> TypedUploadHandler:
+    """
+    Installs the handler on the Django request, once. This has to happen
+    before anything reads the body, e.g. SessionAuthentication's CSRF check,
+    or the files are already stored by Django's own handlers.
+    """
+    handler = getattr(http_request, "_typed_upload_handler", None)
+
+    if handler is None:
+        handler = TypedUploadHandler(http_request, limits)
+        http_request.upload_handlers.insert(0, handler)
+        http_request._typed_upload_handler = handler
+
+    return handler
+
+
+def get_upload_handler(request: Request) -> Optional[TypedUploadHandler]:
+    return getattr(request._request, "_typed_upload_handler", None)
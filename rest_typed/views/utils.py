@@ -1,7 +1,7 @@
 import inspect
 import operator
 from functools import reduce
-from typing import Any, Optional
+from typing import Any, Callable, List, Optional
 
 from rest_framework.fields import empty
 from rest_framework.request import Request
@@ -43,6 +43,25 @@ def is_implicit_body_param(param: inspect.Parameter) -> bool:
     return t is not None
 
 
+def is_deferred_param(param: inspect.Parameter) -> bool:
+    """
+    Body, file, current user and dependency params are the costly ones to
+    resolve (parsing the body, querying the user's groups, running a
+    dependency), so they can be validated last.
+    """
+    explicit_settings = get_explicit_param_settings(param)
+
+    if explicit_settings:
+        return explicit_settings.param_type in (
+            "body",
+            "current_user",
+            "depends",
+            "file",
+        )
+
+    return is_implicit_body_param(param)
+
+
 def is_explicit_request_param(param: inspect.Parameter) -> bool:
     return param.annotation is Request
 
@@ -51,6 +70,30 @@ def is_implicit_request_param(param: inspect.Parameter) -> bool:
     return param.name == "request" and param.annotation is inspect.Parameter.empty
 
 
+def get_typed_params(func: Callable) -> List[inspect.Parameter]:
+    # List[Parameter] -> see docs: https://docs.python.org/3/library/inspect.html#inspect.Parameter
+    return [p for n, p in inspect.signature(func).parameters.items() if n != "self"]
+
+
+def prevalidate(view_func, for_method: bool = False):
+    arg_info = inspect.getfullargspec(view_func)
+
+    if arg_info.varargs is not None or arg_info.varkw is not None:
+        raise Exception(
+            f"{view_func.__name__}: variable-length argument lists and dictionaries cannot be used with typed views"
+        )
+
+    if for_method:
+        error_msg = "For typed methods, 'self' must be passed as the first arg with no annotation"
+
+        if (
+            len(arg_info.args) < 1
+            or arg_info.args[0] != "self"
+            or "self" in arg_info.annotations
+        ):
+            raise Exception(error_msg)
+
+
 def find_request(original_args: list) -> Request:
     for arg in original_args:
         if isinstance(arg, Request):
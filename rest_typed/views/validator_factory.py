@@ -2,6 +2,7 @@ from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Union
+from uuid import UUID
 from rest_framework.request import Request
 
 from rest_framework import serializers
@@ -10,6 +11,8 @@ from rest_typed import ParsedType
 from rest_typed.utils import inspect_complex_type
 from rest_typed.views.param_settings import ParamSettings
 from rest_typed.views.validators import (
+    BULK_PARSERS,
+    BulkListValidator,
     DefaultValidator,
     DrfValidator,
     PydanticValidator,
@@ -96,7 +99,34 @@ class ValidatorFactory(object):
                 inner_type, settings.child or ParamSettings(), request
             )
 
-        return serializers.ListField(**options)
+        field = serializers.ListField(**options)
+
+        if not cls.is_bulk_list(inner_type, settings):
+            return field
+
+        parse = BULK_PARSERS.get(inner_type.resolved_type)
+
+        if settings.container == "array" and parse is not BULK_PARSERS[int]:
+            raise Exception("'container' can only be 'array' for List[int]")
+
+        return BulkListValidator(field, parse, settings.delimiter, settings.container)
+
+    @classmethod
+    def is_bulk_list(
+        cls, inner_type: Union[ParsedType, empty], settings: ParamSettings
+    ) -> bool:
+        """
+        Query lists of ints/UUIDs, and lists with an explicit `container`, are
+        parsed in bulk instead of through one ListField child call per item.
+        """
+        if settings.container is not None:
+            return True
+
+        return (
+            settings.param_type == "query_param"
+            and inner_type is not empty
+            and inner_type.resolved_type in BULK_PARSERS
+        )
 
     @classmethod
     def make(cls, parsed: ParsedType, settings: ParamSettings, request: Request) -> Any:
@@ -142,6 +172,8 @@ class ValidatorFactory(object):
             return serializers.TimeField(
                 default=settings.default, input_formats=settings.input_formats
             )
+        elif parsed.resolved_type is UUID:
+            return serializers.UUIDField(default=settings.default)
         elif parsed.resolved_type is timedelta:
             return serializers.DurationField(default=settings.default)
         elif parsed.resolved_type is Enum:
@@ -2,3 +2,6 @@ from .pydantic_validator import PydanticValidator
 from .default_validator import DefaultValidator
 from .current_user_validator import CurrentUserValidator
 from .drf_validator import DrfValidator
+from .file_validator import FileValidator
+from .raw_body_validator import RawBodyValidator
+from .bulk_list_validator import BulkListValidator, BULK_PARSERS
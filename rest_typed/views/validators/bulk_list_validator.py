@@ -0,0 +1,111 @@
+import uuid
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import IntegerField
+
+
+def parse_int(value: str) -> int:
+    if len(value) > IntegerField.MAX_STRING_LENGTH:
+        raise ValueError()
+    return int(value)
+
+
+BULK_PARSERS: Dict[Any, Callable[[str], Any]] = {int: parse_int, uuid.UUID: uuid.UUID}
+
+CONTAINERS: Dict[str, Callable[[List[Any]], Any]] = {
+    "list": list,
+    "tuple": tuple,
+    "frozenset": frozenset,
+    "array": lambda values: array("q", values),
+}
+
+
+class BulkListValidator(object):
+    """
+    Validates a delimited list in one pass: `max_length` is checked by
+    counting delimiters before splitting, and items are parsed directly,
+    falling back to the child field only for items that need its error
+    message or its more lenient parsing.
+    """
+
+    def __init__(
+        self,
+        field: serializers.ListField,
+        parse: Optional[Callable[[str], Any]],
+        delimiter: str = ",",
+        container: str = None,
+    ):
+        self.field = field
+        self.parse = parse
+        self.delimiter = delimiter
+        self.container = container or "list"
+
+    def run_validation(self, data: Any):
+        field = self.field
+        is_empty_value, data = field.validate_empty_values(data)
+
+        if is_empty_value:
+            # Defaults come back in the same container as parsed values.
+            if isinstance(data, (list, tuple, set, frozenset)):
+                return self.make_container(list(data))
+            return data
+
+        if isinstance(data, str):
+            if (
+                field.max_length is not None
+                and data.count(self.delimiter) >= field.max_length
+            ):
+                field.fail("max_length", max_length=field.max_length)
+
+            items = data.split(self.delimiter)
+        elif isinstance(data, (list, tuple)):
+            items = data
+        else:
+            field.fail("not_a_list", input_type=type(data).__name__)
+
+        if not field.allow_empty and len(items) == 0:
+            field.fail("empty")
+
+        values = self.run_child_validation(items)
+        field.run_validators(values)
+        return self.make_container(values)
+
+    def run_child_validation(self, items: List[Any]) -> List[Any]:
+        parse = self.parse
+        child = self.field.child
+        min_value = getattr(child, "min_value", None)
+        max_value = getattr(child, "max_value", None)
+        values = []
+        errors = {}
+
+        for index, item in enumerate(items):
+            if parse is not None and isinstance(item, str):
+                try:
+                    value = parse(item)
+                except ValueError:
+                    pass
+                else:
+                    if (min_value is None or value >= min_value) and (
+                        max_value is None or value <= max_value
+                    ):
+                        values.append(value)
+                        continue
+
+            try:
+                values.append(child.run_validation(item))
+            except ValidationError as e:
+                errors[index] = e.detail
+
+        if errors:
+            raise ValidationError(errors)
+
+        return values
+
+    def make_container(self, values: List[Any]) -> Any:
+        try:
+            return CONTAINERS[self.container](values)
+        except (OverflowError, TypeError):
+            raise ValidationError("Ensure every value is a 64-bit integer.")
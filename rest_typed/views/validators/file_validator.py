@@ -0,0 +1,73 @@
+import hashlib
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from django.core.files.uploadedfile import UploadedFile
+from django.template.defaultfilters import filesizeformat
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
+
+if TYPE_CHECKING:
+    from rest_typed.views import ParamSettings
+    from rest_typed.views.uploads import TypedUploadHandler
+
+
+class FileValidator(object):
+    def __init__(
+        self,
+        settings: "ParamSettings",
+        many: bool = False,
+        handler: Optional["TypedUploadHandler"] = None,
+        field_name: str = None,
+    ):
+        self.settings = settings
+        self.many = many
+        self.handler = handler
+        self.field_name = field_name
+
+    def run_validation(self, data: Any):
+        if self.handler and self.field_name in self.handler.errors:
+            raise ValidationError(self.handler.errors[self.field_name])
+
+        if data is empty or data == []:
+            if self.settings.default is not empty:
+                return self.settings.default
+            raise ValidationError("No file was submitted.")
+
+        files: List[Any] = list(data) if self.many else [data]
+        checksums = []
+
+        if self.handler:
+            checksums = self.handler.checksums.get(self.field_name, [])
+
+        for i, file in enumerate(files):
+            self.validate_file(file, checksums[i] if i < len(checksums) else None)
+
+        return files if self.many else files[0]
+
+    def validate_file(self, file: Any, checksum: Optional[str]):
+        if not isinstance(file, UploadedFile):
+            raise ValidationError("The submitted data was not a file.")
+
+        max_size = self.settings.max_size
+
+        if max_size is not None and file.size > max_size:
+            raise ValidationError(
+                f"Ensure this file is no larger than {filesizeformat(max_size)}."
+            )
+
+        content_types = self.settings.content_types
+
+        if content_types is not None and file.content_type not in content_types:
+            raise ValidationError(f"Unsupported file type '{file.content_type}'.")
+
+        if self.settings.checksum:
+            if checksum is None:
+                hasher = hashlib.new(self.settings.checksum)
+
+                for chunk in file.chunks():
+                    hasher.update(chunk)
+
+                file.seek(0)
+                checksum = hasher.hexdigest()
+
+            file.checksum = checksum
@@ -0,0 +1,42 @@
+import io
+from typing import TYPE_CHECKING, Any
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
+
+if TYPE_CHECKING:
+    from rest_typed.views import ParamSettings
+
+
+class RawBodyValidator(object):
+    def __init__(self, settings: "ParamSettings", kind: str):
+        self.settings = settings
+        self.kind = kind
+
+    def run_validation(self, data: Any):
+        if data is empty:
+            if self.settings.default is not empty:
+                return self.settings.default
+            raise ValidationError("This field is required.")
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            max_length = self.settings.max_length
+
+            if max_length is not None and len(data) > max_length:
+                raise ValidationError(
+                    f"Ensure this field has no more than {max_length} bytes."
+                )
+
+            if self.kind == "stream":
+                return io.BytesIO(data)
+            if self.kind == "memoryview":
+                return memoryview(data)
+            return bytes(data)
+
+        if self.kind == "stream" and hasattr(data, "read"):
+            return data
+
+        raise ValidationError("Expected raw bytes.")
@@ -0,0 +1,56 @@
+from typing import Any, Callable, List, Optional
+
+REQUEST_ENCODINGS = ("gzip", "x-gzip", "deflate")
+
+
+class ViewSettings(object):
+    idempotent: bool
+    etag: Optional[Callable[..., Optional[str]]]
+    last_modified: Optional[Callable[..., Any]]
+    request_encodings: List[str]
+    max_body_size: Optional[int]
+    max_decoded_body_size: Optional[int]
+    background: bool
+
+    def __init__(
+        self,
+        idempotent: bool = False,
+        # Conditional request args
+        etag: Callable[..., Optional[str]] = None,
+        last_modified: Callable[..., Any] = None,
+        # Request body args
+        request_encodings: List[str] = None,
+        max_body_size: int = None,
+        max_decoded_body_size: int = None,
+        background: bool = False,
+    ):
+        self.idempotent = idempotent
+        self.etag = etag
+        self.last_modified = last_modified
+        self.request_encodings = [e.lower() for e in request_encodings or []]
+        self.max_body_size = max_body_size
+        self.max_decoded_body_size = max_decoded_body_size
+        self.background = background
+
+        for encoding in self.request_encodings:
+            if encoding not in REQUEST_ENCODINGS:
+                raise Exception(
+                    f"'request_encodings' must only contain: {', '.join(REQUEST_ENCODINGS)}"
+                )
+
+        for size in (self.max_body_size, self.max_decoded_body_size):
+            if size is not None and (not isinstance(size, int) or size < 0):
+                raise Exception(
+                    "'max_body_size' and 'max_decoded_body_size' must be non-negative integers"
+                )
+
+        for func in (self.etag, self.last_modified):
+            if func is not None and not callable(func):
+                raise Exception("'etag' and 'last_modified' must be callables")
+
+        if self.background and self.is_conditional:
+            raise Exception("'background' views can't use 'etag' or 'last_modified'")
+
+    @property
+    def is_conditional(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
@@ -0,0 +1,225 @@
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+from rest_typed.serializers import TModelSerializer, TSerializer
+from test_project.testapp.models import Director, Movie
+
+
+def make_serializers(compiled: bool) -> Dict[str, type]:
+    meta = type("Meta", (), {"compiled": compiled})
+
+    class AddressSerializer(TSerializer):
+        street: str
+        city: str
+        postcode: str
+        country: str = "US"
+
+        Meta = meta
+
+    class ItemSerializer(TSerializer):
+        sku: UUID
+        name: str
+        quantity: int
+        price: float
+        discount: Optional[float] = None
+        gift: bool = False
+        shipped_on: Optional[date] = None
+        tags: List[str] = []
+
+        Meta = meta
+
+    class OrderSerializer(TSerializer):
+        reference: str
+        placed_at: datetime
+        notes = serializers.CharField(allow_blank=True, default="")
+        shipping: AddressSerializer
+        billing: Optional[AddressSerializer] = None
+        items: List[ItemSerializer]
+
+        Meta = meta
+
+    class DirectorSerializer(TModelSerializer):
+        class Meta:
+            model = Director
+            fields = ["id", "name", "biography"]
+            compiled = meta.compiled
+            cache_fields = True
+
+    class MovieSerializer(TModelSerializer):
+        director: DirectorSerializer
+
+        class Meta:
+            model = Movie
+            fields = ["id", "title", "rating", "genre", "director"]
+            compiled = meta.compiled
+            cache_fields = True
+
+    return {"order": OrderSerializer, "item": ItemSerializer, "movie": MovieSerializer}
+
+
+def make_payload(items: int) -> Dict[str, Any]:
+    address = {"street": "1 Main St", "city": "Springfield", "postcode": "49007"}
+
+    return {
+        "reference": "ORD-1",
+        "placed_at": "2021-06-01T12:00:00Z",
+        "shipping": address,
+        "billing": dict(address, country="CA"),
+        "items": [
+            {
+                "sku": str(uuid4()),
+                "name": f"Item {i}",
+                "quantity": i,
+                "price": 9.99 if i % 4 else "9.99",
+                "gift": i % 2 == 0,
+                "shipped_on": "2021-06-02" if i % 3 == 0 else None,
+                "tags": ["a", "b"],
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def make_invalid_payload(items: int) -> Dict[str, Any]:
+    payload = make_payload(items)
+    payload["shipping"].pop("city")
+
+    for i, item in enumerate(payload["items"]):
+        if i % 5 == 0:
+            item["quantity"] = "many"
+
+    return payload
+
+
+@contextmanager
+def drf_get_fields():
+    """
+    Builds typed serializer fields the way DRF's `get_fields` does, as the
+    baseline to compare against.
+    """
+    patched = [
+        (TSerializer, serializers.Serializer),
+        (TModelSerializer, serializers.ModelSerializer),
+    ]
+    originals = [typed.get_fields for typed, _ in patched]
+
+    for typed, drf in patched:
+        typed.get_fields = drf.get_fields
+
+    try:
+        yield
+    finally:
+        for (typed, _), get_fields in zip(patched, originals):
+            typed.get_fields = get_fields
+
+
+def make_movies(count: int) -> List[Movie]:
+    director = Director(id=1, name="Agnes Varda", biography="...")
+    return [
+        Movie(id=i, title=f"Movie {i}", rating=i / 10, genre="drama", director=director)
+        for i in range(count)
+    ]
+
+
+class MovieList(list):
+    pass
+
+
+class ItemList(list):
+    pass
+
+
+def make_items(count: int) -> ItemList:
+    items = make_payload(count)["items"]
+
+    for i, item in enumerate(items):
+        if i % 50 == 0:
+            item["quantity"] = "many"
+
+    return ItemList(items)
+
+
+def run(serializer_classes: Dict[str, type], payload: Any) -> Any:
+    if isinstance(payload, Movie):
+        return serializer_classes["movie"](payload).data
+
+    if isinstance(payload, MovieList):
+        return serializer_classes["movie"](payload, many=True).data
+
+    if isinstance(payload, ItemList):
+        serializer = serializer_classes["item"](data=payload, many=True)
+        return serializer.validated_data if serializer.is_valid() else serializer.errors
+
+    OrderSerializer = serializer_classes["order"]
+    serializer = OrderSerializer(data=payload)
+
+    if not serializer.is_valid():
+        return serializer.errors
+
+    return serializer.validated_data, OrderSerializer(serializer.validated_data).data
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - started) / repeat
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares typed serializer validation and serialization against "
+        "DRF's generic implementation: outputs must match, and timings are "
+        "reported for each."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        items = options["items"]
+        cases = {
+            "one large order": [make_payload(items)],
+            "one large invalid order": [make_invalid_payload(items)],
+            "many small orders": [make_payload(1) for _ in range(items)],
+            "many movies": make_movies(items),
+            "movie list": [MovieList(make_movies(items * 10))],
+            "bulk items": [make_items(items * 10)],
+        }
+        modes = {
+            "drf": (make_serializers(compiled=False), drf_get_fields),
+            "typed": (make_serializers(compiled=False), nullcontext),
+            "compiled": (make_serializers(compiled=True), nullcontext),
+        }
+
+        for label, payloads in cases.items():
+            results, timings = {}, {}
+
+            for mode, (serializer_classes, context) in modes.items():
+
+                def run_all():
+                    return [run(serializer_classes, p) for p in payloads]
+
+                with context():
+                    results[mode] = run_all()
+                    timings[mode] = timed(run_all, options["repeat"])
+
+            for mode, result in results.items():
+                if result != results["drf"]:
+                    raise CommandError(f"{label}: {mode} output differs from DRF's")
+
+            self.stdout.write(
+                f"{label}: "
+                + ", ".join(
+                    f"{mode} {timing * 1000:.2f}ms ({timings['drf'] / timing:.2f}x)"
+                    for mode, timing in timings.items()
+                )
+            )
@@ -23,9 +23,17 @@ class UserAccount(models.Model):
     )
 
 
+class Director(models.Model):
+    name = models.CharField(max_length=100)
+    biography = models.TextField(default="")
+
+
 class Movie(models.Model):
     title = models.CharField(max_length=100)
     rating = models.FloatField(default=0)
+    director = models.ForeignKey(
+        Director, null=True, on_delete=models.SET_NULL, related_name="movies"
+    )
 
     genre = models.CharField(
         max_length=30, choices=(("comedy", "Comedy"), ("drama", "Drama"))
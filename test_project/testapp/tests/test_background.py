@@ -0,0 +1,127 @@
+import threading
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from rest_typed.views import Body, Query, typed_api_view
+from rest_typed.views import background
+from rest_typed.views.background import LocalBackend
+
+release = threading.Event()
+
+
+@typed_api_view(["POST"], background=True)
+def add(a: int = Body(source="a"), b: int = Body(source="b")):
+    if a < 0:
+        raise PermissionDenied("No negatives.")
+    if b < 0:
+        raise ValueError("boom")
+    return Response({"sum": a + b}, status=201)
+
+
+@typed_api_view(["GET"], background=True)
+def wait(timeout: float = Query(default=5)):
+    release.wait(timeout)
+    return Response({"waited": True})
+
+
+class BackgroundViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        release.clear()
+        self.factory = APIRequestFactory()
+
+    def tearDown(self):
+        release.set()
+
+    def submit(self, data: dict, user: User = None):
+        request = self.factory.post("/add/", data, format="json")
+
+        if user is not None:
+            force_authenticate(request, user=user)
+
+        return add(request)
+
+    def poll(self, url: str, deadline: float = 5) -> Response:
+        until = time.monotonic() + deadline
+
+        while True:
+            response = self.client.get(url)
+
+            if response.data["status"] in ("succeeded", "failed"):
+                return response
+
+            if time.monotonic() > until:
+                self.fail(f"Job at {url} did not finish")
+
+            time.sleep(0.01)
+
+    def test_returns_202_with_status_url(self):
+        response = self.submit({"a": 1, "b": 2})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(response["Location"], response.data["status_url"])
+
+        result = self.poll(response.data["status_url"])
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.data["status"], "succeeded")
+        self.assertEqual(result.data["status_code"], 201)
+        self.assertEqual(result.data["result"], {"sum": 3})
+
+    def test_validation_errors_are_returned_synchronously(self):
+        response = self.submit({"a": "one", "b": 2})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("a", response.data)
+
+    def test_failures_are_reported_on_the_status_url(self):
+        denied = self.poll(self.submit({"a": -1, "b": 2}).data["status_url"])
+
+        with self.assertLogs("rest_typed.views.background", level="ERROR"):
+            crashed = self.poll(self.submit({"a": 1, "b": -2}).data["status_url"])
+
+        self.assertEqual(denied.data["status"], "failed")
+        self.assertEqual(denied.data["status_code"], 403)
+        self.assertEqual(denied.data["result"], "No negatives.")
+
+        self.assertEqual(crashed.data["status"], "failed")
+        self.assertEqual(crashed.data["status_code"], 500)
+
+    def test_jobs_are_only_visible_to_their_owner(self):
+        owner = User.objects.create(username="robert")
+        other = User.objects.create(username="paul")
+        status_url = self.submit({"a": 1, "b": 2}, user=owner).data["status_url"]
+
+        self.client.force_authenticate(user=owner)
+        self.assertEqual(self.poll(status_url).data["status"], "succeeded")
+
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get(status_url).status_code, 404)
+
+    def test_full_queue_returns_503(self):
+        with mock.patch.object(
+            background, "_backend", LocalBackend(max_workers=1, max_pending=1)
+        ):
+            first = wait(self.factory.get("/wait/"))
+            second = wait(self.factory.get("/wait/"))
+            release.set()
+
+            self.assertEqual(first.status_code, 202)
+            self.assertEqual(second.status_code, 503)
+            self.assertEqual(
+                self.poll(first.data["status_url"]).data["status"], "succeeded"
+            )
+
+    def test_background_views_cant_be_conditional(self):
+        with self.assertRaises(Exception):
+
+            @typed_api_view(["GET"], background=True, etag=lambda: "v1")
+            def get_version():
+                return Response({})
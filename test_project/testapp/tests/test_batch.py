@@ -0,0 +1,118 @@
+from unittest import mock
+
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory, APITestCase, APITransactionTestCase
+from rest_typed.views import batch
+
+
+class BatchRequestMixin(object):
+    def post_batch(self, operations: list):
+        return self.client.post(
+            reverse("batch"), {"operations": operations}, format="json"
+        )
+
+
+class BatchViewTests(BatchRequestMixin, APITestCase):
+
+    def test_dispatches_operations_in_order(self):
+        response = self.post_batch(
+            [
+                {
+                    "method": "GET",
+                    "path": "/test-optional-list-param/",
+                    "query": {"ids": "1,2"},
+                },
+                {
+                    "method": "POST",
+                    "path": "/band-members/",
+                    "body": {"name": "Homer"},
+                },
+                {"method": "GET", "path": "/test-optional-list-param/?ids=3"},
+                {"method": "POST", "path": "/band-members/", "body": {}},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            [
+                {"status": 200, "body": {"v": [1, 2]}},
+                {"status": 200, "body": {"name": "Homer", "email": None}},
+                {"status": 200, "body": {"v": [3]}},
+                {
+                    "status": 400,
+                    "body": {"band_member": {"name": ["This field is required."]}},
+                },
+            ],
+        )
+
+    def test_reads_run_in_order_inside_transactions(self):
+        operations = [{"method": "GET", "path": "/test-optional-list-param/"}] * 2
+
+        with mock.patch.object(batch, "dispatch_concurrently") as dispatch:
+            response = self.post_batch(operations)
+
+        self.assertEqual(response.status_code, 200)
+        dispatch.assert_not_called()
+
+    def test_sub_requests_only_share_identity_headers(self):
+        request = APIRequestFactory().post(
+            "/batch/",
+            HTTP_AUTHORIZATION="Token abc",
+            HTTP_IDEMPOTENCY_KEY="key-1",
+            HTTP_IF_NONE_MATCH='"etag"',
+            HTTP_CONTENT_ENCODING="gzip",
+        )
+        sub = batch.build_sub_request(
+            Request(request),
+            {"method": "GET", "path": "/test/", "query": {}, "body": None},
+        )
+
+        self.assertEqual(sub.META["HTTP_AUTHORIZATION"], "Token abc")
+        self.assertEqual(sub.META["SERVER_NAME"], request.META["SERVER_NAME"])
+        self.assertNotIn("HTTP_IDEMPOTENCY_KEY", sub.META)
+        self.assertNotIn("HTTP_IF_NONE_MATCH", sub.META)
+        self.assertNotIn("HTTP_CONTENT_ENCODING", sub.META)
+
+    def test_unknown_paths_and_nested_batches(self):
+        response = self.post_batch(
+            [
+                {"method": "GET", "path": "/does-not-exist/"},
+                {"method": "POST", "path": "/batch/", "body": {"operations": []}},
+            ]
+        )
+
+        self.assertEqual([r["status"] for r in response.data], [404, 400])
+
+    def test_rejects_too_many_operations(self):
+        operations = [{"method": "GET", "path": "/test/"}] * 6
+        response = self.post_batch(operations)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            {"operations": ["Ensure this field has no more than 5 elements."]},
+        )
+
+
+class ConcurrentBatchViewTests(BatchRequestMixin, APITransactionTestCase):
+    def test_concurrent_reads_keep_their_positions(self):
+        operations = [
+            {
+                "method": "GET",
+                "path": "/test-optional-list-param/",
+                "query": {"ids": str(i)},
+            }
+            for i in range(5)
+        ]
+
+        with mock.patch.object(
+            batch, "dispatch_concurrently", wraps=batch.dispatch_concurrently
+        ) as dispatch:
+            response = self.post_batch(operations)
+
+        self.assertEqual(
+            [r["body"] for r in response.data], [{"v": [i]} for i in range(5)]
+        )
+        dispatch.assert_called_once()
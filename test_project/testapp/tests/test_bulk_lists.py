@@ -0,0 +1,89 @@
+import uuid
+from array import array
+from typing import List
+
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.views import ParamSettings, Query, typed_api_view
+
+RESULTS = {}
+
+
+@typed_api_view(["GET"])
+def lookup(
+    ids: List[int] = Query(default=[], max_length=5, child=ParamSettings(min_value=1)),
+    tokens: List[uuid.UUID] = Query(default=[]),
+    packed: List[int] = Query(default=[], container="array"),
+    unique: List[int] = Query(default=[], container="frozenset"),
+    names: List[str] = Query(default=[], container="tuple", delimiter="|"),
+):
+    RESULTS.update(ids=ids, tokens=tokens, packed=packed, unique=unique, names=names)
+    return Response({"count": len(ids)})
+
+
+class BulkListTests(APITestCase):
+    def setUp(self):
+        RESULTS.clear()
+        self.factory = APIRequestFactory()
+
+    def get(self, **query):
+        return lookup(self.factory.get("/lookup/", query))
+
+    def test_ints_are_parsed(self):
+        response = self.get(ids="3,1, 2,1.0")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(RESULTS["ids"], [3, 1, 2, 1])
+        self.assertEqual(type(RESULTS["ids"]), list)
+
+    def test_uuids_are_parsed(self):
+        first, second = uuid.uuid4(), uuid.uuid4()
+        self.get(tokens=f"{first},{second.hex}")
+
+        self.assertEqual(RESULTS["tokens"], [first, second])
+
+    def test_item_errors_are_reported_by_index(self):
+        response = self.get(ids="1,x,0", tokens="nope")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            str(response.data["ids"][1][0]), "A valid integer is required."
+        )
+        self.assertEqual(
+            str(response.data["ids"][2][0]),
+            "Ensure this value is greater than or equal to 1.",
+        )
+        self.assertEqual(str(response.data["tokens"][0][0]), "Must be a valid UUID.")
+
+    def test_max_length_is_checked_before_splitting(self):
+        response = self.get(ids=",".join(["x"] * 10000))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            str(response.data["ids"][0]),
+            "Ensure this field has no more than 5 elements.",
+        )
+
+    def test_containers(self):
+        self.get(packed="1,2,3", unique="4,4,5", names="a,b|c")
+
+        self.assertEqual(RESULTS["packed"], array("q", [1, 2, 3]))
+        self.assertEqual(RESULTS["unique"], frozenset([4, 5]))
+        self.assertEqual(RESULTS["names"], ("a,b", "c"))
+
+    def test_defaults_use_the_container(self):
+        self.get()
+
+        self.assertEqual(RESULTS["packed"], array("q"))
+        self.assertEqual(RESULTS["unique"], frozenset())
+        self.assertEqual(RESULTS["names"], ())
+
+    def test_array_overflow(self):
+        response = self.get(packed=str(2**64))
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_container(self):
+        with self.assertRaises(Exception):
+            Query(container="set")
@@ -0,0 +1,102 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from django.contrib.auth.models import Group, User
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APITestCase
+
+from rest_typed.views.client import TypedClient
+from test_project.testapp.models import Movie
+from test_project.testapp.view_sets import MovieViewSet
+from test_project.testapp.views import (
+    BagOptions,
+    BandMemberSerializer,
+    create_band_member,
+    get_logs,
+    get_movie_summary,
+)
+
+
+class TypedClientTests(APITestCase):
+    def test_call_with_python_values(self):
+        data = TypedClient().call(
+            get_logs,
+            myid=2,
+            latitude=Decimal("63.44"),
+            title="My title",
+            price=7.5,
+            is_pretty=True,
+            email="homer@hotmail.com",
+            upper_alpha_string="NBA",
+            identifier="24adfads",
+            website="http://bloomgerg.com",
+            identity=UUID("a1e77325-8429-480e-a990-8764f33db2d8"),
+            ip="162.254.168.185",
+            timestamp=datetime(2013, 7, 16, 19, 23, tzinfo=timezone.utc),
+            start_date=date(2013, 7, 16),
+            start_time=time(10, 0),
+            duration=timedelta(days=12, seconds=143),
+            bag_type=BagOptions.paper,
+            numbers=[1, 2, 3],
+        )
+
+        self.assertEqual(data["id"], 2)
+        self.assertEqual(data["bag_type"], "paper")
+        self.assertEqual(data["numbers"], [1, 2, 3])
+        self.assertEqual(data["start_date"], date(2013, 7, 16))
+
+    def test_call_validates_values(self):
+        with self.assertRaises(ValidationError) as context:
+            TypedClient().call(create_band_member, band_member={"email": "a@b.com"})
+
+        self.assertEqual(
+            context.exception.detail,
+            {"band_member": {"name": ["This field is required."]}},
+        )
+
+    def test_call_validates_serializer_instances(self):
+        client = TypedClient()
+        member = BandMemberSerializer(data={"name": "Ringo"})
+        data = client.call(create_band_member, band_member=member)
+
+        self.assertEqual(data, {"name": "Ringo", "email": None})
+
+        with self.assertRaises(ValidationError) as context:
+            client.call(
+                create_band_member,
+                band_member=BandMemberSerializer(data={"email": "a@b.com"}),
+            )
+
+        self.assertEqual(
+            context.exception.detail,
+            {"band_member": {"name": ["This field is required."]}},
+        )
+
+        with self.assertRaises(ValidationError):
+            client.call(create_band_member, band_member=BandMemberSerializer())
+
+    def test_call_runs_current_user_checks(self):
+        with self.assertRaises(ValidationError):
+            TypedClient().call(get_movie_summary, id=3)
+
+        critic = User.objects.create(username="roger")
+        critic.groups.add(Group.objects.create(name="critics"))
+        data = TypedClient(user=critic).call(get_movie_summary, id=3, lang="fr")
+
+        self.assertEqual(data, {"id": 3, "lang": "fr"})
+
+    def test_call_rejects_unknown_values(self):
+        with self.assertRaises(TypeError):
+            TypedClient().call(get_movie_summary, id=3, language="fr")
+
+    def test_call_action(self):
+        movie = Movie.objects.create(title="My movie", rating=5.0, genre="comedy")
+
+        data = TypedClient().call_action(
+            MovieViewSet, "reviews", pk=movie.pk, test_qp="cats"
+        )
+
+        self.assertEqual(
+            data, {"id": movie.pk, "test_qp": "cats", "title": "My default title"}
+        )
@@ -0,0 +1,457 @@
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest import mock
+from uuid import UUID
+
+from django.core.validators import MaxValueValidator
+from django.test import override_settings
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+from rest_typed.serializers import TModelSerializer, TSerializer
+from rest_typed.serializers.compiler import (
+    MAX_VARIANTS,
+    compile_to_internal_value,
+    get_input_signature,
+    get_output_signature,
+)
+from test_project.testapp.models import Director, Movie
+
+
+def make_serializers(compiled: bool):
+    meta = type("Meta", (), {"compiled": compiled})
+
+    class ChapterSerializer(TSerializer):
+        title: str
+        pages: int
+
+        Meta = meta
+
+    class BookSerializer(TSerializer):
+        title = serializers.CharField(max_length=10, min_length=2)
+        subtitle = serializers.CharField(trim_whitespace=False, required=False)
+        isbn = serializers.CharField(source="meta.isbn", required=False)
+        pages = serializers.IntegerField(min_value=1, max_value=5000)
+        price: float
+        rating = serializers.FloatField(min_value=0, max_value=5, default=0)
+        in_print: bool = True
+        summary: Optional[str] = None
+        tags: List[str] = []
+        chapters: List[ChapterSerializer] = []
+        slug = serializers.SlugField(read_only=True)
+
+        Meta = meta
+
+        def validate_price(self, value):
+            if value == 13:
+                raise serializers.ValidationError("Unlucky price.")
+            return value
+
+        def validate(self, data):
+            if data.get("rating") == 5 and data.get("in_print") is False:
+                raise serializers.ValidationError(
+                    "Out of print books can't be rated 5."
+                )
+            return data
+
+    return BookSerializer
+
+
+def make_output_serializers(compiled: bool):
+    meta = type("Meta", (), {"compiled": compiled})
+
+    class AuthorSerializer(TSerializer):
+        name: str
+        born: Optional[int] = None
+
+        Meta = meta
+
+    class EditionSerializer(TSerializer):
+        id: UUID
+        title: str
+        pages: int
+        price: float
+        in_print: bool
+        published_at: datetime
+        author: AuthorSerializer
+        co_authors: List[AuthorSerializer]
+        tags: List[str]
+        label = serializers.CharField(source="get_label")
+        publisher = serializers.CharField(source="publisher.name")
+        note = serializers.CharField(required=False)
+        secret = serializers.CharField(write_only=True)
+        shelf = serializers.IntegerField(default=0)
+
+        Meta = meta
+
+    class MovieSerializer(TModelSerializer):
+        class Meta:
+            model = Movie
+            fields = ["id", "title", "rating", "genre", "director"]
+            compiled = meta.compiled
+
+    return EditionSerializer, MovieSerializer
+
+
+def make_account_serializer(compiled: bool):
+    class AccountSerializer(TSerializer):
+        name: str
+        owner: str = ""
+        quota = serializers.IntegerField(min_value=0)
+
+        class Meta:
+            pass
+
+        def __init__(self, *args, limit: int, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.fields["quota"].validators.append(MaxValueValidator(limit))
+
+        def get_fields(self):
+            fields = super().get_fields()
+
+            if not self.context["request"].user.is_staff:
+                fields["owner"].read_only = True
+
+            return fields
+
+    AccountSerializer.Meta.compiled = compiled
+    return AccountSerializer
+
+
+def make_request(is_staff: bool):
+    return SimpleNamespace(user=SimpleNamespace(is_staff=is_staff))
+
+
+BookSerializer = make_serializers(compiled=False)
+CompiledBookSerializer = make_serializers(compiled=True)
+EditionSerializer, MovieSerializer = make_output_serializers(compiled=False)
+CompiledEditionSerializer, CompiledMovieSerializer = make_output_serializers(True)
+AccountSerializer = make_account_serializer(compiled=False)
+CompiledAccountSerializer = make_account_serializer(compiled=True)
+
+
+def make_edition(**kwargs):
+    author = SimpleNamespace(name="Frank Herbert", born=1920)
+    values = dict(
+        id=UUID("de305d54-75b4-431b-adb2-eb6b9e546013"),
+        title="Dune",
+        pages="412",
+        price=9,
+        in_print=1,
+        published_at=datetime(1965, 8, 1, 12, 30),
+        author=author,
+        co_authors=[author, {"name": "Brian Herbert"}],
+        tags=("sf", 2),
+        get_label=lambda: "Dune (1965)",
+        publisher=SimpleNamespace(name="Chilton"),
+        secret="hidden",
+    )
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+VALID = {
+    "title": " Dune ",
+    "subtitle": "  with spaces ",
+    "isbn": "978-0441013593",
+    "pages": 412,
+    "price": 9,
+    "rating": 4.5,
+    "in_print": False,
+    "tags": ["sf", "classic"],
+    "chapters": [{"title": "Book One", "pages": 100}],
+    "slug": "ignored",
+}
+
+INVALID = [
+    {},
+    {"title": "", "pages": 0, "price": "x"},
+    {"title": "   ", "pages": 5001, "price": 13},
+    {"title": "An overly long title", "pages": True, "price": 1.5, "in_print": 2},
+    {"title": "Nul\x00l", "pages": "12", "price": "3.5", "rating": 6},
+    {"title": "Café", "pages": 1.0, "price": None, "summary": 5},
+    {"title": 12, "pages": 12, "price": 1, "chapters": [{"title": "x"}, {}]},
+    {"title": ["x"], "pages": {"n": 1}, "price": float("inf"), "tags": "sf"},
+]
+
+
+class CompiledSerializerTests(APITestCase):
+    def validate(self, serializer_class, data, **kwargs):
+        serializer = serializer_class(data=data, **kwargs)
+        valid = serializer.is_valid()
+        return valid, serializer.validated_data if valid else serializer.errors
+
+    def assertSameResult(self, data, **kwargs):
+        expected = self.validate(BookSerializer, data, **kwargs)
+        actual = self.validate(CompiledBookSerializer, data, **kwargs)
+        self.assertEqual(actual, expected)
+        return actual
+
+    def test_valid_data_matches_drf(self):
+        valid, validated_data = self.assertSameResult(VALID)
+
+        self.assertTrue(valid)
+        self.assertEqual(validated_data["title"], "Dune")
+        self.assertEqual(validated_data["subtitle"], "  with spaces ")
+        self.assertEqual(validated_data["meta"], {"isbn": "978-0441013593"})
+        self.assertIsInstance(validated_data["price"], float)
+        self.assertNotIn("slug", validated_data)
+
+    def test_errors_match_drf(self):
+        for data in INVALID:
+            with self.subTest(data=data):
+                valid, _ = self.assertSameResult(data)
+                self.assertFalse(valid)
+
+    def test_non_dict_input_matches_drf(self):
+        for data in ([VALID], "text", None):
+            with self.subTest(data=data):
+                self.assertSameResult(data)
+
+    def test_partial_input_matches_drf(self):
+        valid, validated_data = self.assertSameResult({"pages": 12}, partial=True)
+
+        self.assertTrue(valid)
+        self.assertEqual(validated_data, {"pages": 12})
+
+    def test_generates_code_once_per_class(self):
+        signature = get_input_signature(CompiledBookSerializer())
+        self.validate(CompiledBookSerializer, VALID)
+        variants = CompiledBookSerializer.__dict__["_compiled_to_internal_value"]
+        compiled = variants[signature]
+        self.validate(CompiledBookSerializer, VALID)
+
+        self.assertIs(variants[signature], compiled)
+        self.assertIn("ret['pages'] = v3", compiled.__source__)
+        self.assertNotIn("_compiled_to_internal_value", BookSerializer.__dict__)
+
+    def test_signature_is_worked_out_once_per_fields(self):
+        serializer = CompiledBookSerializer()
+
+        with mock.patch(
+            "rest_typed.serializers.serializers.get_input_signature",
+            wraps=get_input_signature,
+        ) as get_signature:
+            serializer.to_internal_value(VALID)
+            # One per serializer instance, nested ones included.
+            calls = get_signature.call_count
+
+            for _ in range(3):
+                serializer.to_internal_value(VALID)
+
+            self.assertEqual(get_signature.call_count, calls)
+
+            del serializer.fields
+            serializer.to_internal_value(VALID)
+
+            self.assertEqual(get_signature.call_count, calls * 2)
+
+    def test_instance_field_changes_match_drf(self):
+        data = {"name": "a", "owner": "evil", "quota": 100}
+        cases = [(True, 500), (False, 500), (False, 5), (True, 5)]
+
+        for is_staff, limit in cases:
+            with self.subTest(is_staff=is_staff, limit=limit):
+                context = {"request": make_request(is_staff)}
+                expected = self.validate(
+                    AccountSerializer, data, limit=limit, context=context
+                )
+                actual = self.validate(
+                    CompiledAccountSerializer, data, limit=limit, context=context
+                )
+
+                self.assertEqual(actual, expected)
+                self.assertEqual(actual[0], limit == 500)
+
+                if actual[0]:
+                    self.assertEqual("owner" in actual[1], is_staff)
+
+        self.assertEqual(
+            len(CompiledAccountSerializer.__dict__["_compiled_to_internal_value"]), 4
+        )
+
+    def test_variants_per_class_are_capped(self):
+        context = {"request": make_request(True)}
+
+        for limit in range(1, MAX_VARIANTS + 3):
+            valid, _ = self.validate(
+                CompiledAccountSerializer,
+                {"name": "a", "quota": MAX_VARIANTS},
+                limit=limit,
+                context=context,
+            )
+            self.assertEqual(valid, limit >= MAX_VARIANTS)
+
+        self.assertEqual(
+            len(CompiledAccountSerializer.__dict__["_compiled_to_internal_value"]),
+            MAX_VARIANTS,
+        )
+
+    def test_changed_fields_use_drf(self):
+        serializer = CompiledBookSerializer(
+            data={"pages": 12, "price": 1, "chapters": []}
+        )
+        serializer.fields.pop("title")
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    @override_settings(DRF_TYPED_VIEWS={"compiled_serializers": True})
+    def test_compiled_setting(self):
+        class ChapterSerializer(TSerializer):
+            title: str
+
+        ChapterSerializer(data={"title": "Intro"}).is_valid()
+
+        self.assertTrue(ChapterSerializer.__dict__["_compiled_to_internal_value"])
+
+        with override_settings(DRF_TYPED_VIEWS={}):
+            compiled = ChapterSerializer()._get_compiled(
+                "_compiled_to_internal_value",
+                compile_to_internal_value,
+                get_input_signature,
+            )
+
+        self.assertIs(compiled, False)
+
+    def test_many_matches_drf(self):
+        out_of_print = dict(VALID, rating=5)
+        batches = [
+            [VALID, VALID],
+            [VALID, *INVALID, "text", None, out_of_print, VALID],
+            [],
+            "text",
+        ]
+
+        for data in batches:
+            with self.subTest(data=data):
+                self.assertSameResult(data, many=True)
+
+        self.assertSameResult([], many=True, allow_empty=False)
+
+    def test_many_validates_fields_in_columns(self):
+        valid, validated_data = self.assertSameResult([VALID] * 3, many=True)
+        batch = CompiledBookSerializer.__dict__["_compiled_validate_batch"][
+            get_input_signature(CompiledBookSerializer())
+        ]
+
+        self.assertTrue(valid)
+        self.assertEqual(len(validated_data), 3)
+        self.assertEqual(
+            batch.__source__.count("for data, ret, errors in zip"),
+            len(
+                [f for f in CompiledBookSerializer().fields.values() if not f.read_only]
+            ),
+        )
+
+    def test_many_instance_field_changes_match_drf(self):
+        data = [{"name": "a", "owner": "evil", "quota": 1}, {"name": "b", "quota": 3}]
+
+        for is_staff in (True, False):
+            with self.subTest(is_staff=is_staff):
+                kwargs = {"limit": 5, "context": {"request": make_request(is_staff)}}
+                expected = self.validate(AccountSerializer, data, many=True, **kwargs)
+                actual = self.validate(
+                    CompiledAccountSerializer, data, many=True, **kwargs
+                )
+
+                self.assertEqual(actual, expected)
+                self.assertEqual("owner" in actual[1][0], is_staff)
+
+    def test_max_items(self):
+        for serializer_class in (BookSerializer, CompiledBookSerializer):
+            with self.subTest(serializer_class=serializer_class):
+                valid, errors = self.validate(
+                    serializer_class, [VALID] * 3, many=True, max_items=2
+                )
+
+                self.assertFalse(valid)
+                self.assertEqual(
+                    errors,
+                    {
+                        "non_field_errors": [
+                            "Ensure this list has no more than 2 items."
+                        ]
+                    },
+                )
+                self.assertEqual(errors["non_field_errors"][0].code, "max_items")
+                self.assertTrue(
+                    self.validate(
+                        serializer_class, [VALID] * 2, many=True, max_items=2
+                    )[0]
+                )
+
+    def test_representation_matches_drf(self):
+        editions = [
+            make_edition(),
+            make_edition(note="Signed", shelf=4, author=None, in_print=False),
+            vars(make_edition(title=7, price=9.5, co_authors=[])),
+        ]
+
+        for edition in editions:
+            with self.subTest(edition=edition):
+                self.assertEqual(
+                    CompiledEditionSerializer(edition).data,
+                    EditionSerializer(edition).data,
+                )
+
+        self.assertEqual(
+            CompiledEditionSerializer(editions, many=True).data,
+            EditionSerializer(editions, many=True).data,
+        )
+
+        data = CompiledEditionSerializer(editions[0]).data
+        self.assertEqual(data["pages"], 412)
+        self.assertEqual(data["label"], "Dune (1965)")
+        self.assertEqual(data["publisher"], "Chilton")
+        self.assertEqual(data["shelf"], 0)
+        self.assertNotIn("note", data)
+        self.assertNotIn("secret", data)
+
+    def test_many_works_out_signature_once(self):
+        editions = [make_edition() for _ in range(5)]
+        serializer = CompiledEditionSerializer(editions, many=True)
+
+        with mock.patch(
+            "rest_typed.serializers.serializers.get_output_signature",
+            wraps=get_output_signature,
+        ) as get_signature:
+            data = serializer.data
+
+        self.assertEqual(data, EditionSerializer(editions, many=True).data)
+        # The child, its author field and its co_authors list's child.
+        self.assertEqual(get_signature.call_count, 3)
+
+    def test_instance_write_only_fields_are_hidden_like_drf(self):
+        edition = make_edition()
+        CompiledEditionSerializer(edition).data
+
+        for serializer_class in (EditionSerializer, CompiledEditionSerializer):
+            with self.subTest(serializer_class=serializer_class):
+                serializer = serializer_class(edition)
+                serializer.fields["publisher"].write_only = True
+
+                self.assertNotIn("publisher", serializer.data)
+                self.assertIn("publisher", serializer_class(edition).data)
+
+    def test_missing_required_attribute_raises_like_drf(self):
+        edition = make_edition()
+        del edition.title
+
+        for serializer_class in (EditionSerializer, CompiledEditionSerializer):
+            with self.assertRaisesMessage(AttributeError, "field `title`"):
+                serializer_class().to_representation(edition)
+
+    def test_model_representation_matches_drf(self):
+        director = Director.objects.create(name="Agnes Varda")
+        Movie.objects.create(title="Cleo", genre="drama", director=director)
+        Movie.objects.create(title="Untitled", genre="comedy", rating=2)
+        movies = Movie.objects.order_by("id")
+
+        self.assertEqual(
+            CompiledMovieSerializer(movies, many=True).data,
+            MovieSerializer(movies, many=True).data,
+        )
+        self.assertEqual(
+            CompiledMovieSerializer(movies, many=True).data[0]["director"],
+            director.pk,
+        )
@@ -0,0 +1,58 @@
+from django.contrib.auth.models import Group, User
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from rest_typed.views import Body, typed_api_view
+
+
+class ConditionalViewTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("get-movie-summary", args=[3])
+
+    def login_critic(self):
+        user = User.objects.create(username="roger")
+        user.groups.add(Group.objects.create(name="critics"))
+        self.client.force_authenticate(user)
+
+    def test_sets_condition_headers(self):
+        self.login_critic()
+        response = self.client.get(self.url, {"lang": "fr"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], '"movie-3-fr-v1"')
+        self.assertEqual(response["Last-Modified"], "Tue, 01 Jun 2021 12:00:00 GMT")
+
+    def test_matching_etag_returns_304_before_current_user_validation(self):
+        response = self.client.get(
+            self.url, {"lang": "fr"}, HTTP_IF_NONE_MATCH='"movie-3-fr-v1"'
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_stale_etag_validates_all_params(self):
+        response = self.client.get(
+            self.url, {"lang": "fr"}, HTTP_IF_NONE_MATCH='"movie-3-fr-v0"'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            {"critic": ["User must be a member of the 'critics' group"]},
+        )
+
+    def test_if_modified_since_returns_304(self):
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE="Wed, 02 Jun 2021 00:00:00 GMT"
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_condition_function_cannot_receive_body_params(self):
+        def get_etag(title: str) -> str:
+            return title
+
+        with self.assertRaises(Exception) as context:
+
+            @typed_api_view(["PUT"], etag=get_etag)
+            def update_title(title: str = Body()):
+                return
+
+        self.assertTrue("not 'title'" in str(context.exception))
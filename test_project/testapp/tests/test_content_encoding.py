@@ -0,0 +1,94 @@
+import gzip
+import json
+import zlib
+
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.views import Body, typed_api_view
+
+
+@typed_api_view(
+    ["POST"],
+    request_encodings=["gzip", "deflate"],
+    max_body_size=1024,
+    max_decoded_body_size=4096,
+)
+def ingest(events: list = Body(source="events")):
+    return Response({"count": len(events)})
+
+
+@typed_api_view(["POST"], request_encodings=["gzip"])
+def ingest_raw(payload: bytes = Body()):
+    return Response({"size": len(payload)})
+
+
+class ContentEncodingTests(APITestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def post(self, view, body: bytes, encoding: str = None):
+        extra = {"HTTP_CONTENT_ENCODING": encoding} if encoding else {}
+        request = self.factory.post(
+            "/ingest/", body, content_type="application/json", **extra
+        )
+        return view(request)
+
+    def payload(self, count: int) -> bytes:
+        return json.dumps({"events": [{"id": i} for i in range(count)]}).encode()
+
+    def test_gzip_body_is_decoded(self):
+        response = self.post(ingest, gzip.compress(self.payload(3)), "gzip")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"count": 3})
+
+    def test_deflate_body_is_decoded(self):
+        response = self.post(ingest, zlib.compress(self.payload(2)), "deflate")
+
+        self.assertEqual(response.data, {"count": 2})
+
+    def test_identity_body_is_unchanged(self):
+        self.assertEqual(self.post(ingest, self.payload(1)).data, {"count": 1})
+
+    def test_raw_body_params_see_decoded_body(self):
+        body = b"x" * 100
+        response = self.post(ingest_raw, gzip.compress(body), "gzip")
+
+        self.assertEqual(response.data, {"size": 100})
+
+    def test_unsupported_encoding(self):
+        response = self.post(ingest, b"...", "br")
+
+        self.assertEqual(response.status_code, 415)
+        self.assertEqual(
+            response.data["detail"], 'Unsupported content encoding "br" in request.'
+        )
+
+    def test_body_size_is_checked_from_content_length(self):
+        response = self.post(ingest, self.payload(100))
+
+        self.assertEqual(response.status_code, 413)
+
+    def test_decoded_size_is_capped(self):
+        bomb = gzip.compress(b" " * 512 * 1024)
+        self.assertLess(len(bomb), 1024)
+
+        response = self.post(ingest, bomb, "gzip")
+
+        self.assertEqual(response.status_code, 413)
+
+    def test_malformed_body(self):
+        response = self.post(ingest, b"not gzip", "gzip")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["detail"], "Request body is not valid gzip data."
+        )
+
+    def test_invalid_settings(self):
+        with self.assertRaises(Exception):
+            typed_api_view(["POST"], request_encodings=["br"])
+
+        with self.assertRaises(Exception):
+            typed_api_view(["POST"], max_body_size=-1)
@@ -0,0 +1,88 @@
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.views import Depends, Header, Query, typed_api_view
+
+CALLS = []
+
+
+def get_tenant(tenant_id: int = Header(source="x-tenant")) -> dict:
+    CALLS.append("tenant")
+    return {"id": tenant_id}
+
+
+def get_flags(tenant: dict = Depends(get_tenant)) -> list:
+    CALLS.append("flags")
+    return [f"tenant-{tenant['id']}-beta"]
+
+
+def get_plan(tenant_id: int = Header(source="x-tenant")) -> str:
+    CALLS.append("plan")
+    return "gold" if tenant_id == 1 else "basic"
+
+
+@typed_api_view(["GET"])
+def dashboard(
+    tenant: dict = Depends(get_tenant),
+    flags: list = Depends(get_flags),
+    plan: str = Depends(get_plan, cache_scope="process", ttl=60),
+    q: str = Query(default=""),
+):
+    return Response({"tenant": tenant, "flags": flags, "plan": plan, "q": q})
+
+
+class DependencyTests(APITestCase):
+    def setUp(self):
+        CALLS.clear()
+        self.factory = APIRequestFactory()
+
+    def get(self, **headers):
+        return dashboard(self.factory.get("/dashboard/", **headers))
+
+    def test_shared_dependencies_run_once_per_request(self):
+        response = self.get(HTTP_X_TENANT="7")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {"tenant": {"id": 7}, "flags": ["tenant-7-beta"], "plan": "basic", "q": ""},
+        )
+        self.assertEqual(CALLS.count("tenant"), 1)
+        self.assertEqual(CALLS.count("flags"), 1)
+
+    def test_request_scoped_dependencies_run_again_for_new_requests(self):
+        self.get(HTTP_X_TENANT="7")
+        self.get(HTTP_X_TENANT="7")
+        self.assertEqual(CALLS.count("tenant"), 2)
+
+    def test_process_scoped_dependency_is_cached_by_its_params(self):
+        self.get(HTTP_X_TENANT="8")
+        self.get(HTTP_X_TENANT="8")
+        self.get(HTTP_X_TENANT="1")
+
+        self.assertEqual(CALLS.count("plan"), 2)
+
+    def test_dependency_param_errors_are_reported(self):
+        response = self.get(HTTP_X_TENANT="seven")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data, {"x-tenant": ["A valid integer is required."]}
+        )
+
+    def test_circular_dependencies_fail_at_decoration_time(self):
+        def first(value: int = None):
+            return value
+
+        def second(value: int = Depends(first)):
+            return value
+
+        first.__defaults__ = (Depends(second),)
+
+        with self.assertRaises(Exception) as context:
+
+            @typed_api_view(["GET"])
+            def view(value: int = Depends(first)):
+                return Response(value)
+
+        self.assertTrue("Circular dependency" in str(context.exception))
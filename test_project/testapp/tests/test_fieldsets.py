@@ -0,0 +1,124 @@
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.views import Fields, typed_api_view
+from rest_typed.views.fieldsets import FieldSet
+from test_project.testapp.models import Director, Movie
+
+
+class DirectorSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Director
+        fields = ["id", "name"]
+
+
+class MovieDetailSerializer(serializers.ModelSerializer):
+    director = DirectorSerializer()
+    director_name = serializers.CharField(source="director.name", default=None)
+    summary = serializers.SerializerMethodField()
+    tagline = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Movie
+        fields = [
+            "id",
+            "title",
+            "rating",
+            "genre",
+            "director",
+            "director_name",
+            "summary",
+            "tagline",
+        ]
+        field_sources = {"summary": ["title", "genre"]}
+
+    def get_summary(self, movie: Movie) -> str:
+        return f"{movie.title} ({movie.genre})"
+
+    def get_tagline(self, movie: Movie) -> str:
+        return f"Directed by {movie.director.name}"
+
+
+QUERYSETS = []
+
+
+@typed_api_view(["GET"])
+def list_movies(fields: FieldSet = Fields(MovieDetailSerializer)):
+    queryset = fields.apply(Movie.objects.select_related("director").order_by("id"))
+    QUERYSETS.append(queryset)
+    return Response(fields.get_serializer(queryset, many=True).data)
+
+
+class FieldSetTests(APITestCase):
+    def setUp(self):
+        QUERYSETS.clear()
+        self.factory = APIRequestFactory()
+        director = Director.objects.create(name="Ridley", biography="..." * 100)
+        Movie.objects.create(
+            title="Alien", rating=8.5, genre="drama", director=director
+        )
+
+    def get(self, **query):
+        return list_movies(self.factory.get("/movies/", query))
+
+    def loaded_columns(self) -> set:
+        movie = list(QUERYSETS[-1])[0]
+        return {
+            f.attname for f in Movie._meta.concrete_fields
+        } - movie.get_deferred_fields()
+
+    def test_all_fields_by_default(self):
+        response = self.get()
+
+        self.assertEqual(
+            list(response.data[0].keys()),
+            [
+                "id",
+                "title",
+                "rating",
+                "genre",
+                "director",
+                "director_name",
+                "summary",
+                "tagline",
+            ],
+        )
+        self.assertEqual(QUERYSETS[-1].query.select_related, {"director": {}})
+
+    def test_sparse_fields_narrow_columns_and_joins(self):
+        with self.assertNumQueries(1):
+            response = self.get(fields="title,rating")
+
+        self.assertEqual(response.data, [{"title": "Alien", "rating": 8.5}])
+        self.assertFalse(QUERYSETS[-1].query.select_related)
+        self.assertEqual(self.loaded_columns(), {"id", "title", "rating"})
+
+    def test_related_fields_keep_their_join(self):
+        with self.assertNumQueries(1):
+            response = self.get(fields="director_name")
+
+        self.assertEqual(response.data, [{"director_name": "Ridley"}])
+        self.assertEqual(QUERYSETS[-1].query.select_related, {"director": {}})
+
+    def test_declared_sources_are_used_for_method_fields(self):
+        response = self.get(fields="summary")
+
+        self.assertEqual(response.data, [{"summary": "Alien (drama)"}])
+        self.assertEqual(self.loaded_columns(), {"id", "title", "genre"})
+
+    def test_untraceable_fields_leave_queryset_alone(self):
+        with self.assertNumQueries(1):
+            response = self.get(fields="tagline")
+
+        self.assertEqual(response.data, [{"tagline": "Directed by Ridley"}])
+        self.assertEqual(QUERYSETS[-1].query.select_related, {"director": {}})
+        self.assertEqual(len(self.loaded_columns()), 5)
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.get(fields="title,budget")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(
+            str(response.data["fields"][0]).startswith("Unknown fields: budget.")
+        )
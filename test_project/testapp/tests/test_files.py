@@ -0,0 +1,141 @@
+import hashlib
+from typing import List
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+from django.core.files.uploadhandler import MemoryFileUploadHandler
+from django.middleware.csrf import _get_new_csrf_token
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import authentication_classes
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.views import File, typed_api_view
+from rest_typed.views.client import TypedClient
+
+
+@typed_api_view(["POST"])
+def upload_avatar(
+    avatar: UploadedFile = File(
+        max_size=16, content_types=["image/png"], checksum="sha256"
+    ),
+):
+    return Response(
+        {"name": avatar.name, "size": avatar.size, "checksum": avatar.checksum}
+    )
+
+
+@typed_api_view(["POST"])
+@authentication_classes([SessionAuthentication])
+def upload_session_avatar(
+    avatar: UploadedFile = File(max_size=16, checksum="sha256"),
+):
+    return Response({"checksum": avatar.checksum})
+
+
+@typed_api_view(["POST"])
+def upload_attachments(attachments: List[UploadedFile] = File(default=[], max_size=16)):
+    return Response([attachment.name for attachment in attachments])
+
+
+class FileParamTests(APITestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def post(self, view, **files):
+        return view(self.factory.post("/upload/", files, format="multipart"))
+
+    def test_file_is_streamed_and_hashed(self):
+        content = b"\x89PNG data"
+        avatar = SimpleUploadedFile("me.png", content, content_type="image/png")
+        response = self.post(upload_avatar, avatar=avatar)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {
+                "name": "me.png",
+                "size": len(content),
+                "checksum": hashlib.sha256(content).hexdigest(),
+            },
+        )
+
+    def test_limits_apply_before_session_authentication(self):
+        # The CSRF check reads the multipart body before the view runs.
+        factory = APIRequestFactory(enforce_csrf_checks=True)
+        user = User.objects.create(username="robert")
+        token = _get_new_csrf_token()
+
+        def post(content: bytes):
+            request = factory.post(
+                "/upload/",
+                {"avatar": SimpleUploadedFile("me.png", content)},
+                format="multipart",
+                HTTP_X_CSRFTOKEN=token,
+            )
+            request.COOKIES["csrftoken"] = token
+            request.user = user
+            return upload_session_avatar(request)
+
+        response = post(b"x" * 16)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["checksum"], hashlib.sha256(b"x" * 16).hexdigest()
+        )
+
+        with mock.patch.object(
+            MemoryFileUploadHandler, "receive_data_chunk"
+        ) as receive_data_chunk:
+            response = post(b"x" * 17)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            str(response.data["avatar"][0]),
+            "Ensure this file is no larger than 16\xa0bytes.",
+        )
+        receive_data_chunk.assert_not_called()
+
+    def test_missing_file_is_an_error(self):
+        response = self.post(upload_avatar)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(str(response.data["avatar"][0]), "No file was submitted.")
+
+    def test_oversize_file_is_rejected(self):
+        avatar = SimpleUploadedFile("me.png", b"x" * 17, content_type="image/png")
+        response = self.post(upload_avatar, avatar=avatar)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            str(response.data["avatar"][0]),
+            "Ensure this file is no larger than 16\xa0bytes.",
+        )
+
+    def test_wrong_content_type_is_skipped(self):
+        avatar = SimpleUploadedFile("me.gif", b"GIF89a", content_type="image/gif")
+        response = self.post(upload_avatar, avatar=avatar)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            str(response.data["avatar"][0]), "Unsupported file type 'image/gif'."
+        )
+
+    def test_many_files(self):
+        response = self.post(
+            upload_attachments,
+            attachments=[
+                SimpleUploadedFile("a.txt", b"a"),
+                SimpleUploadedFile("b.txt", b"b"),
+            ],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, ["a.txt", "b.txt"])
+        self.assertEqual(self.post(upload_attachments).data, [])
+
+    def test_client_passes_uploaded_files(self):
+        avatar = SimpleUploadedFile("me.png", b"png", content_type="image/png")
+        data = TypedClient().call(upload_avatar, avatar=avatar)
+
+        self.assertEqual(data["checksum"], hashlib.sha256(b"png").hexdigest())
@@ -0,0 +1,184 @@
+import warnings
+from dataclasses import dataclass
+from typing import List, Optional
+
+from django.db.models import Q
+from pydantic import BaseModel, Field
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.serializers import TSerializer
+from rest_typed.views import Filter, typed_api_view
+from rest_typed.views.client import TypedClient
+from rest_typed.views.filters import FilterQuery, UnindexedFilterWarning
+from test_project.testapp.models import Movie
+
+
+class MovieFilter(TSerializer):
+    title__icontains: Optional[str] = None
+    rating__gte: Optional[float] = None
+    genre__in: Optional[List[str]] = None
+
+
+class MovieFilterSchema(BaseModel):
+    rating__gte: Optional[float] = Field(None, alias="min_rating")
+    id__in: Optional[List[int]] = None
+
+
+@dataclass
+class MovieFilterData:
+    genre: Optional[str] = None
+    rating__lt: Optional[float] = None
+
+
+class MovieRatingFilter(TSerializer):
+    min_rating = serializers.FloatField(source="rating__gte", required=False)
+
+
+class ComedyFilter(TSerializer):
+    genre: str = "comedy"
+
+
+class ComedyFilterSchema(BaseModel):
+    genre: str = "comedy"
+
+
+@dataclass
+class ComedyFilterData:
+    genre: str = "comedy"
+
+
+def list_titles(filters: FilterQuery):
+    movies = filters.apply(Movie.objects.order_by("id"))
+    return Response([movie.title for movie in movies])
+
+
+with warnings.catch_warnings(record=True) as DECORATION_WARNINGS:
+    warnings.simplefilter("always")
+
+    @typed_api_view(["GET"])
+    def filter_movies(filters: FilterQuery = Filter(MovieFilter, model=Movie)):
+        movies = filters.apply(Movie.objects.order_by("id"))
+        return Response([movie.title for movie in movies])
+
+    @typed_api_view(["GET"])
+    def filter_movies_pydantic(
+        filters: FilterQuery = Filter(MovieFilterSchema, model=Movie)
+    ):
+        return Response(filters.data)
+
+    @typed_api_view(["GET"])
+    def filter_movies_dataclass(
+        filters: FilterQuery = Filter(MovieFilterData, model=Movie, delimiter="|")
+    ):
+        return Response(str(filters.q))
+
+    @typed_api_view(["GET"])
+    def filter_movies_by_rating(
+        filters: FilterQuery = Filter(MovieRatingFilter, model=Movie)
+    ):
+        return list_titles(filters)
+
+    def make_default_filter_view(schema):
+        @typed_api_view(["GET"])
+        def filter_movies_by_default(
+            filters: FilterQuery = Filter(schema, model=Movie)
+        ):
+            return list_titles(filters)
+
+        return filter_movies_by_default
+
+    DEFAULT_FILTER_VIEWS = [
+        make_default_filter_view(schema)
+        for schema in (ComedyFilter, ComedyFilterSchema, ComedyFilterData)
+    ]
+
+
+class FilterParamTests(APITestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        Movie.objects.create(title="Alien", rating=8.5, genre="drama")
+        Movie.objects.create(title="Airplane!", rating=7.5, genre="comedy")
+        Movie.objects.create(title="Aliens", rating=8.0, genre="comedy")
+
+    def test_filters_compile_to_one_query(self):
+        request = self.factory.get(
+            "/movies/", {"title__icontains": "alien", "genre__in": "comedy,drama"}
+        )
+
+        with self.assertNumQueries(1):
+            response = filter_movies(request)
+
+        self.assertEqual(response.data, ["Alien", "Aliens"])
+
+    def test_missing_values_are_ignored(self):
+        response = filter_movies(self.factory.get("/movies/", {"rating__gte": "8"}))
+        self.assertEqual(response.data, ["Alien", "Aliens"])
+
+        response = filter_movies(self.factory.get("/movies/"))
+        self.assertEqual(len(response.data), 3)
+
+    def test_repeated_keys_make_a_list(self):
+        request = self.factory.get("/movies/?genre__in=comedy&genre__in=drama")
+        self.assertEqual(len(filter_movies(request).data), 3)
+
+    def test_validation_errors(self):
+        response = filter_movies(self.factory.get("/movies/", {"rating__gte": "x"}))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("rating__gte", response.data["filters"])
+
+    def test_pydantic_schema_uses_aliases(self):
+        response = filter_movies_pydantic(
+            self.factory.get("/movies/", {"min_rating": "8", "id__in": "1,2"})
+        )
+
+        self.assertEqual(response.data, {"rating__gte": 8.0, "id__in": [1, 2]})
+
+    def test_sources_name_lookups(self):
+        response = filter_movies_by_rating(
+            self.factory.get("/movies/", {"min_rating": "8"})
+        )
+
+        self.assertEqual(response.data, ["Alien", "Aliens"])
+
+    def test_defaults_apply_to_every_schema(self):
+        for view in DEFAULT_FILTER_VIEWS:
+            with self.subTest(view=view):
+                response = view(self.factory.get("/movies/"))
+                self.assertEqual(response.data, ["Airplane!", "Aliens"])
+
+    def test_dataclass_schema(self):
+        response = filter_movies_dataclass(
+            self.factory.get("/movies/", {"genre": "comedy"})
+        )
+
+        self.assertEqual(response.data, str(Q(genre="comedy")))
+
+    def test_client_passes_values(self):
+        data = TypedClient().call(filter_movies, filters={"rating__gte": 8})
+        self.assertEqual(data, ["Alien", "Aliens"])
+
+    def test_warns_about_unindexed_fields(self):
+        messages = [
+            str(w.message)
+            for w in DECORATION_WARNINGS
+            if issubclass(w.category, UnindexedFilterWarning)
+        ]
+
+        self.assertIn(
+            "Filter field 'rating__gte' of MovieFilter uses testapp.Movie.rating, "
+            "which has no database index",
+            messages,
+        )
+
+    def test_unknown_lookup_fields_are_rejected(self):
+        class BadFilter(TSerializer):
+            budget: Optional[int] = None
+
+        with self.assertRaises(Exception):
+
+            @typed_api_view(["GET"])
+            def bad(filters: FilterQuery = Filter(BadFilter, model=Movie)):
+                pass
@@ -0,0 +1,137 @@
+from typing import IO, Optional
+
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.serializers import TModelSerializer, TSerializer
+from rest_typed.views import Body, Cursor, Depends, Fields, Filter, typed_api_view
+from rest_typed.views.fieldsets import FieldSet
+from rest_typed.views.filters import FilterQuery
+from rest_typed.views.idempotency import cache_key
+from rest_typed.views.pagination import CursorPage
+from test_project.testapp.models import Movie
+from test_project.testapp.views import ORDERS_CREATED
+
+IMPORTS = []
+
+
+class MovieFilter(TSerializer):
+    rating__gte: Optional[float] = None
+
+
+class MovieSerializer(TModelSerializer):
+    class Meta:
+        model = Movie
+        fields = ["id", "title"]
+
+
+class ImportOptions(object):
+    pass
+
+
+@typed_api_view(["POST"], idempotent=True)
+def import_movies(
+    body: bytes = Body(),
+    page: CursorPage = Cursor(ordering=["id"]),
+    filters: FilterQuery = Filter(MovieFilter, model=Movie),
+    fields: FieldSet = Fields(MovieSerializer),
+    options: ImportOptions = Depends(ImportOptions),
+):
+    IMPORTS.append(body)
+    return Response(len(IMPORTS), status=201)
+
+
+class IdempotencyTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        ORDERS_CREATED.clear()
+        IMPORTS.clear()
+
+    def post_order(self, data: dict, key: str = None):
+        headers = {"HTTP_IDEMPOTENCY_KEY": key} if key else {}
+        return self.client.post(reverse("create-order"), data, format="json", **headers)
+
+    def test_repeated_key_replays_stored_response(self):
+        r1 = self.post_order({"item": "lamp"}, key="abc")
+        r2 = self.post_order({"item": "lamp"}, key="abc")
+
+        self.assertEqual(r1.status_code, 201)
+        self.assertEqual(r2.status_code, 201)
+        self.assertEqual(r1.data, r2.data)
+        self.assertEqual(r2["Location"], "/orders/1/")
+        self.assertEqual(r2["Idempotent-Replayed"], "true")
+        self.assertEqual(len(ORDERS_CREATED), 1)
+
+    def test_semantically_identical_params_match(self):
+        self.post_order({"item": "lamp", "quantity": 1}, key="abc")
+        r2 = self.post_order({"item": "lamp", "quantity": "1"}, key="abc")
+
+        self.assertEqual(r2.status_code, 201)
+        self.assertEqual(len(ORDERS_CREATED), 1)
+
+    def test_key_reused_with_different_params(self):
+        self.post_order({"item": "lamp"}, key="abc")
+        r2 = self.post_order({"item": "chair"}, key="abc")
+
+        self.assertEqual(r2.status_code, 422)
+        self.assertEqual(len(ORDERS_CREATED), 1)
+
+    def test_object_params_match(self):
+        factory = APIRequestFactory()
+        url = "/movies/import/?rating__gte=8&fields=title"
+
+        def post(body: bytes):
+            request = factory.post(
+                url,
+                body,
+                content_type="application/octet-stream",
+                HTTP_IDEMPOTENCY_KEY="abc",
+            )
+            return import_movies(request)
+
+        responses = [post(b"a,b"), post(b"a,b"), post(b"a,c")]
+
+        self.assertEqual(responses[1].status_code, 201)
+        self.assertEqual(responses[1]["Idempotent-Replayed"], "true")
+        self.assertEqual(responses[2].status_code, 422)
+        self.assertEqual(IMPORTS, [b"a,b"])
+
+    def test_stream_bodies_are_rejected(self):
+        def upload(body: IO[bytes] = Body()):
+            pass
+
+        with self.assertRaisesMessage(Exception, "stream body param 'body'"):
+            typed_api_view(["POST"], idempotent=True)(upload)
+
+    def test_requests_without_key_always_execute(self):
+        self.post_order({"item": "lamp"})
+        self.post_order({"item": "lamp"})
+        self.assertEqual(len(ORDERS_CREATED), 2)
+
+    def test_invalid_params_are_not_stored(self):
+        r1 = self.post_order({}, key="abc")
+        r2 = self.post_order({"item": "lamp"}, key="abc")
+
+        self.assertEqual(r1.status_code, 400)
+        self.assertEqual(r2.status_code, 201)
+        self.assertEqual(len(ORDERS_CREATED), 1)
+
+    @override_settings(
+        DRF_TYPED_VIEWS={
+            "idempotency_wait_timeout": 0.1,
+            "idempotency_poll_interval": 0.01,
+        }
+    )
+    def test_concurrent_duplicate_waits_then_conflicts(self):
+        response = self.post_order({"item": "lamp"}, key="abc")
+        request = response.wsgi_request
+        cache.clear()
+        cache.set(cache_key(request, "abc") + ":lock", "in-flight")
+
+        r2 = self.post_order({"item": "lamp"}, key="abc")
+
+        self.assertEqual(r2.status_code, 409)
+        self.assertEqual(len(ORDERS_CREATED), 1)
@@ -0,0 +1,125 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from rest_framework import serializers
+from rest_framework.decorators import parser_classes, renderer_classes
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.serializers import TSerializer
+from rest_typed.views import Body, typed_api_view
+from rest_typed.views.msgpack_codec import ExtType, py_packb, py_unpackb
+from rest_typed.views.parsers import MessagePackParser
+from rest_typed.views.renderers import MessagePackRenderer
+
+
+class PaymentSerializer(TSerializer):
+    id: uuid.UUID
+    amount = serializers.DecimalField(max_digits=8, decimal_places=2)
+    paid_at: datetime
+
+
+@typed_api_view(["POST"])
+@parser_classes([MessagePackParser])
+@renderer_classes([MessagePackRenderer])
+def record_payment(payment: PaymentSerializer = Body()):
+    data = payment.validated_data
+    return Response(
+        {"id": data["id"], "amount": data["amount"], "paid_at": data["paid_at"]}
+    )
+
+
+class MessagePackCodecTests(APITestCase):
+    def test_spec_vectors(self):
+        vectors = [
+            (None, b"\xc0"),
+            (True, b"\xc3"),
+            (5, b"\x05"),
+            (-3, b"\xfd"),
+            (200, b"\xcc\xc8"),
+            (-200, b"\xd1\xff\x38"),
+            (2**40, b"\xcf\x00\x00\x01\x00\x00\x00\x00\x00"),
+            (1.5, b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"),
+            ("hi", b"\xa2hi"),
+            (b"\x00", b"\xc4\x01\x00"),
+            ([1, 2], b"\x92\x01\x02"),
+            ({"a": 1}, b"\x81\xa1a\x01"),
+        ]
+
+        for value, packed in vectors:
+            self.assertEqual(py_packb(value), packed)
+            self.assertEqual(py_unpackb(packed), value)
+
+    def test_round_trips_large_containers(self):
+        value = {"items": list(range(70000)), "text": "x" * 70000}
+        self.assertEqual(py_unpackb(py_packb(value)), value)
+
+    def test_timestamps(self):
+        for value in (
+            datetime(2021, 5, 1, tzinfo=timezone.utc),
+            datetime(2021, 5, 1, 12, 30, 1, 250, tzinfo=timezone.utc),
+            datetime(2600, 1, 1, tzinfo=timezone.utc),
+            datetime(1900, 1, 1, tzinfo=timezone.utc),
+        ):
+            self.assertEqual(py_unpackb(py_packb(value)), value)
+
+        self.assertEqual(
+            py_packb(datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc)),
+            b"\xd6\xff\x00\x00\x00\x01",
+        )
+
+    def test_unknown_ext_types(self):
+        packed = py_packb(ExtType(5, b"abc"))
+        self.assertEqual(py_unpackb(packed), ExtType(5, b"abc"))
+
+    def test_malformed_data(self):
+        with self.assertRaises(ValueError):
+            py_unpackb(b"\xa5ab")
+
+        with self.assertRaises(ValueError):
+            py_unpackb(b"\x01\x02")
+
+        with self.assertRaises(TypeError):
+            py_packb(object())
+
+
+class MessagePackViewTests(APITestCase):
+    def test_parses_and_renders_typed_values(self):
+        payment_id = uuid.uuid4()
+        paid_at = datetime(2021, 5, 1, 12, 30, tzinfo=timezone.utc)
+        body = py_packb({"id": str(payment_id), "amount": "12.50", "paid_at": paid_at})
+        request = APIRequestFactory().post(
+            "/payments/", body, content_type="application/msgpack"
+        )
+        response = record_payment(request)
+        response.render()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(
+            py_unpackb(response.content),
+            {"id": str(payment_id), "amount": "12.50", "paid_at": paid_at},
+        )
+
+    def test_validation_errors_are_rendered(self):
+        request = APIRequestFactory().post(
+            "/payments/", py_packb({"id": "nope"}), content_type="application/msgpack"
+        )
+        response = record_payment(request)
+        response.render()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("amount", py_unpackb(response.content)["payment"])
+
+    def test_malformed_body(self):
+        request = APIRequestFactory().post(
+            "/payments/", b"\xc1", content_type="application/msgpack"
+        )
+        response = record_payment(request)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_renders_decimals_as_strings(self):
+        rendered = MessagePackRenderer().render({"total": Decimal("1.10")})
+        self.assertEqual(py_unpackb(rendered), {"total": "1.10"})
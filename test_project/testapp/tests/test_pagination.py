@@ -0,0 +1,114 @@
+from urllib.parse import parse_qs, urlsplit
+
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.views import Cursor, typed_api_view
+from rest_typed.views.pagination import CursorPage, encode_cursor
+from test_project.testapp.models import Movie, UserAccount
+
+
+@typed_api_view(["GET"])
+def list_movies(
+    page: CursorPage = Cursor(
+        ordering=["-rating"], page_size=2, max_page_size=5, count="estimated"
+    ),
+):
+    movies = page.paginate(Movie.objects.all())
+    return page.get_response([movie.title for movie in movies])
+
+
+@typed_api_view(["GET"])
+def list_accounts(page: CursorPage = Cursor(ordering=["-joined_at"], page_size=2)):
+    accounts = page.paginate(UserAccount.objects.all())
+    return page.get_response([account.username for account in accounts])
+
+
+class CursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+        for title, rating in [
+            ("A", 9.0),
+            ("B", 8.0),
+            ("C", 8.0),
+            ("D", 7.5),
+            ("E", 3.0),
+        ]:
+            Movie.objects.create(title=title, rating=rating, genre="drama")
+
+    def get(self, url: str):
+        return list_movies(self.factory.get(url))
+
+    def cursor_of(self, link: str) -> str:
+        return parse_qs(urlsplit(link).query)["cursor"][0]
+
+    def test_walks_forward_and_back(self):
+        first = self.get("/movies/")
+
+        self.assertEqual(first.data["results"], ["A", "B"])
+        self.assertEqual(first.data["count"], 5)
+        self.assertIsNone(first.data["previous"])
+
+        second = self.get(f"/movies/?cursor={self.cursor_of(first.data['next'])}")
+        self.assertEqual(second.data["results"], ["C", "D"])
+
+        third = self.get(f"/movies/?cursor={self.cursor_of(second.data['next'])}")
+        self.assertEqual(third.data["results"], ["E"])
+        self.assertIsNone(third.data["next"])
+
+        back = self.get(f"/movies/?cursor={self.cursor_of(third.data['previous'])}")
+        self.assertEqual(back.data["results"], ["C", "D"])
+
+        start = self.get(f"/movies/?cursor={self.cursor_of(back.data['previous'])}")
+        self.assertEqual(start.data["results"], ["A", "B"])
+        self.assertIsNone(start.data["previous"])
+
+    def test_page_size_is_capped(self):
+        response = self.get("/movies/?page_size=50")
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_tampered_cursor_is_rejected(self):
+        response = self.get("/movies/?cursor=abc:def")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(str(response.data["cursor"][0]), "Invalid cursor.")
+
+    def test_cursor_with_wrong_shape_is_rejected(self):
+        response = self.get(f"/movies/?cursor={encode_cursor(['x'], False)}")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_ordering_is_required(self):
+        with self.assertRaises(Exception):
+            Cursor(ordering=[])
+
+    def test_null_values_are_paged(self):
+        joined = [None, "2021-01-02T00:00Z", None, "2021-01-01T00:00Z", None]
+
+        for index, joined_at in enumerate(joined):
+            UserAccount.objects.create(username=str(index), joined_at=joined_at)
+
+        pages = []
+        response = list_accounts(self.factory.get("/accounts/"))
+
+        while True:
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data["results"])
+
+            if response.data["next"] is None:
+                break
+
+            cursor = self.cursor_of(response.data["next"])
+            response = list_accounts(self.factory.get(f"/accounts/?cursor={cursor}"))
+
+        self.assertEqual(pages, [["0", "2"], ["4", "1"], ["3"]])
+
+        cursor = self.cursor_of(response.data["previous"])
+        back = list_accounts(self.factory.get(f"/accounts/?cursor={cursor}"))
+        self.assertEqual(back.data["results"], ["4", "1"])
+
+        cursor = self.cursor_of(back.data["previous"])
+        start = list_accounts(self.factory.get(f"/accounts/?cursor={cursor}"))
+        self.assertEqual(start.data["results"], ["0", "2"])
+        self.assertIsNone(start.data["previous"])
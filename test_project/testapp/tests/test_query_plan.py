@@ -0,0 +1,173 @@
+from types import SimpleNamespace
+from typing import List, Optional
+
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+from rest_typed.serializers import TModelSerializer, optimize_queryset
+from rest_typed.serializers.query_plan import get_query_plan
+from test_project.testapp.models import Director, Movie
+
+
+class DirectorSerializer(TModelSerializer):
+    class Meta:
+        model = Director
+        fields = ["id", "name"]
+
+
+class MovieSerializer(TModelSerializer):
+    director: Optional[DirectorSerializer] = None
+
+    class Meta:
+        model = Movie
+        fields = ["id", "title", "director"]
+
+
+class MovieTitleSerializer(TModelSerializer):
+    class Meta:
+        model = Movie
+        fields = ["id", "title"]
+
+
+class FilmographySerializer(TModelSerializer):
+    movies: List[MovieTitleSerializer]
+
+    class Meta:
+        model = Director
+        fields = ["id", "name", "movies"]
+
+
+class StaffFilmographySerializer(FilmographySerializer):
+    def __init__(self, *args, hide: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields[hide].write_only = True
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        if not self.context["request"].user.is_staff:
+            fields.pop("movies")
+
+        return fields
+
+
+class MovieFilmographySerializer(TModelSerializer):
+    director: Optional[FilmographySerializer] = None
+    director_name = serializers.CharField(source="director.name", default=None)
+    label = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Movie
+        fields = ["id", "title", "director", "director_name", "label"]
+
+    def get_label(self, movie):
+        return f"{movie.title} ({movie.rating})"
+
+
+class QueryPlanTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name in ("Agnes Varda", "Chantal Akerman"):
+            director = Director.objects.create(name=name)
+
+            for i in range(3):
+                Movie.objects.create(
+                    title=f"{name} {i}", genre="drama", director=director
+                )
+
+        Movie.objects.create(title="Untitled", genre="comedy")
+
+    def assertOptimized(self, serializer_class, queryset, num_queries, **kwargs):
+        expected = serializer_class(queryset, many=True, **kwargs).data
+
+        with self.assertNumQueries(num_queries):
+            serializer = serializer_class(many=True, **kwargs)
+            serializer.instance = optimize_queryset(queryset, serializer.child)
+            actual = serializer.data
+
+        self.assertEqual(actual, expected)
+
+    def test_joins_nested_foreign_keys(self):
+        plan = get_query_plan(MovieSerializer(), Movie)
+
+        self.assertEqual(plan.select_related, {"director"})
+        self.assertEqual(
+            plan.columns, {"id", "title", "director", "director__id", "director__name"}
+        )
+        self.assertOptimized(MovieSerializer, Movie.objects.order_by("id"), 1)
+
+    def test_prefetches_reverse_relations(self):
+        plan = get_query_plan(FilmographySerializer(), Director)
+
+        self.assertEqual(plan.select_related, set())
+        self.assertEqual(list(plan.prefetch_related), ["movies"])
+        self.assertEqual(
+            plan.prefetch_related["movies"][1].columns, {"id", "title", "director"}
+        )
+        self.assertOptimized(FilmographySerializer, Director.objects.order_by("id"), 2)
+
+    def test_prefetches_through_joins(self):
+        plan = get_query_plan(MovieFilmographySerializer(), Movie)
+
+        self.assertEqual(plan.select_related, {"director"})
+        self.assertEqual(list(plan.prefetch_related), ["director__movies"])
+        # The method field may read any column.
+        self.assertIsNone(plan.columns)
+        self.assertOptimized(
+            MovieFilmographySerializer, Movie.objects.order_by("id"), 2
+        )
+
+    def test_plan_is_computed_once_per_class(self):
+        self.assertIs(
+            get_query_plan(MovieSerializer(), Movie),
+            get_query_plan(MovieSerializer(), Movie),
+        )
+
+    def test_chosen_columns_are_kept(self):
+        queryset = optimize_queryset(Movie.objects.only("title"), MovieTitleSerializer)
+
+        self.assertEqual(queryset.query.deferred_loading, ({"title"}, False))
+
+    def test_joined_relations_are_loaded(self):
+        queryset = Movie.objects.select_related("director").order_by("id")
+
+        self.assertOptimized(MovieTitleSerializer, queryset, 1)
+        self.assertEqual(
+            optimize_queryset(queryset, MovieTitleSerializer).query.deferred_loading,
+            ({"director", "id", "title"}, False),
+        )
+
+        queryset = optimize_queryset(
+            Movie.objects.select_related(), MovieTitleSerializer
+        )
+        self.assertEqual(queryset.query.deferred_loading, (frozenset(), True))
+        self.assertEqual(len(queryset), 7)
+
+    def test_prefetched_lookups_are_kept(self):
+        queryset = Director.objects.prefetch_related("movies").order_by("id")
+
+        self.assertOptimized(FilmographySerializer, queryset, 2)
+
+    def test_instance_fields_are_planned(self):
+        queryset = Director.objects.order_by("id")
+        plans = [
+            (True, "name", 2, ["movies"]),
+            (True, "movies", 1, []),
+            (False, "name", 1, []),
+        ]
+
+        for is_staff, hide, num_queries, prefetches in plans:
+            with self.subTest(is_staff=is_staff, hide=hide):
+                kwargs = {
+                    "hide": hide,
+                    "context": {
+                        "request": SimpleNamespace(
+                            user=SimpleNamespace(is_staff=is_staff)
+                        )
+                    },
+                }
+                plan = get_query_plan(StaffFilmographySerializer(**kwargs), Director)
+
+                self.assertEqual(list(plan.prefetch_related), prefetches)
+                self.assertOptimized(
+                    StaffFilmographySerializer, queryset, num_queries, **kwargs
+                )
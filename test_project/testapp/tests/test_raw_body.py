@@ -0,0 +1,100 @@
+import hashlib
+from typing import BinaryIO
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_typed.views import Body, Header, typed_api_view
+from rest_typed.views.client import TypedClient
+
+
+@typed_api_view(["POST"])
+def receive_webhook(
+    payload: bytes = Body(max_length=32), signature: str = Header(default="")
+):
+    digest = hashlib.sha256(payload).hexdigest()
+    return Response({"size": len(payload), "valid": digest == signature})
+
+
+@typed_api_view(["POST"])
+def store_blob(blob: BinaryIO = Body()):
+    return Response({"head": blob.read(4).decode(), "rest": len(blob.read())})
+
+
+@typed_api_view(["POST"])
+def inspect_blob(blob: memoryview = Body(default=None)):
+    return Response({"size": None if blob is None else blob.nbytes})
+
+
+class RawBodyTests(APITestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def post(self, view, body: bytes, **extra):
+        request = self.factory.post(
+            "/raw/", body, content_type="application/octet-stream", **extra
+        )
+        return view(request)
+
+    def test_bytes_receive_body_unparsed(self):
+        body = b'{"event": "paid"}'
+        response = self.post(
+            receive_webhook,
+            body,
+            HTTP_SIGNATURE=hashlib.sha256(body).hexdigest(),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"size": len(body), "valid": True})
+
+    def test_max_length_is_checked_from_content_length(self):
+        response = self.post(receive_webhook, b"x" * 33)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            str(response.data["payload"][0]),
+            "Ensure this field has no more than 32 bytes.",
+        )
+
+    def test_max_length_is_checked_when_content_length_lies(self):
+        request = self.factory.post(
+            "/raw/", b"x" * 33, content_type="application/octet-stream"
+        )
+        request.META["CONTENT_LENGTH"] = "10"
+        request._stream.remaining = 33
+        response = receive_webhook(request)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_empty_body_is_required(self):
+        response = self.post(receive_webhook, b"")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(str(response.data["payload"][0]), "This field is required.")
+
+    def test_file_like_receives_stream(self):
+        response = self.post(store_blob, b"\x00ABCDEFG")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"head": "\x00ABC", "rest": 4})
+
+    def test_memoryview(self):
+        self.assertEqual(self.post(inspect_blob, b"abc").data, {"size": 3})
+        self.assertEqual(self.post(inspect_blob, b"").data, {"size": None})
+
+    def test_raw_body_cannot_be_combined_with_other_body_params(self):
+        with self.assertRaisesMessage(
+            Exception, "raw body param 'payload' cannot be combined"
+        ):
+
+            @typed_api_view(["POST"])
+            def both(payload: bytes = Body(), event: str = Body(source="event")):
+                pass
+
+    def test_client_passes_bytes(self):
+        data = TypedClient().call(receive_webhook, payload=b"abc")
+        self.assertEqual(data["size"], 3)
+
+        with self.assertRaises(ValidationError):
+            TypedClient().call(receive_webhook, payload=b"x" * 33)
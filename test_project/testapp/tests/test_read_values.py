@@ -0,0 +1,125 @@
+from typing import Optional
+
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+from rest_typed.serializers import TModelSerializer
+from test_project.testapp.models import Director, Movie
+
+
+def make_serializers(read_values: bool):
+    meta = type("Meta", (), {"read_values": read_values})
+
+    class DirectorSerializer(TModelSerializer):
+        class Meta:
+            model = Director
+            fields = ["id", "name", "biography"]
+            read_values = meta.read_values
+
+    class MovieSerializer(TModelSerializer):
+        director: Optional[DirectorSerializer] = None
+        director_id = serializers.IntegerField(read_only=True)
+        headline = serializers.CharField(source="title")
+
+        class Meta:
+            model = Movie
+            fields = ["id", "title", "rating", "genre", "director"]
+            fields += ["director_id", "headline"]
+            read_values = meta.read_values
+
+    class MovieKeySerializer(TModelSerializer):
+        class Meta:
+            model = Movie
+            fields = ["id", "title", "director"]
+            read_values = meta.read_values
+
+    class MovieLabelSerializer(TModelSerializer):
+        director_name = serializers.CharField(source="director.name", default="")
+        label = serializers.SerializerMethodField()
+
+        class Meta:
+            model = Movie
+            fields = ["id", "director_name", "label"]
+            read_values = meta.read_values
+
+        def get_label(self, movie):
+            return movie.get_genre_display()
+
+    return MovieSerializer, MovieKeySerializer, MovieLabelSerializer
+
+
+MovieSerializer, MovieKeySerializer, MovieLabelSerializer = make_serializers(False)
+ValuesMovieSerializer, ValuesMovieKeySerializer, ValuesMovieLabelSerializer = (
+    make_serializers(True)
+)
+
+
+class ReadValuesTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        director = Director.objects.create(name="Agnes Varda", biography="...")
+        Movie.objects.create(title="Cleo", genre="drama", director=director, rating=4)
+        Movie.objects.create(title="Vagabond", genre="drama", director=director)
+        Movie.objects.create(title="Untitled", genre="comedy", rating=2.5)
+
+    def assertSameData(self, serializer_class, values_serializer_class):
+        expected = serializer_class(Movie.objects.order_by("id"), many=True).data
+        actual = values_serializer_class(Movie.objects.order_by("id"), many=True).data
+
+        self.assertEqual(actual, expected)
+        return actual
+
+    def test_joined_rows_match_instances(self):
+        with self.assertNumQueries(1):
+            data = ValuesMovieSerializer(Movie.objects.order_by("id"), many=True).data
+
+        self.assertEqual(data[0]["director"]["name"], "Agnes Varda")
+        self.assertIsNone(data[2]["director"])
+        self.assertSameData(MovieSerializer, ValuesMovieSerializer)
+
+    def test_foreign_keys_match_instances(self):
+        data = self.assertSameData(MovieKeySerializer, ValuesMovieKeySerializer)
+
+        self.assertEqual([movie["director"] for movie in data][-1], None)
+        variants = ValuesMovieKeySerializer.__dict__["_compiled_read_values"]
+        self.assertTrue(all(variants.values()))
+
+    def test_other_sources_use_instances(self):
+        self.assertSameData(MovieLabelSerializer, ValuesMovieLabelSerializer)
+        variants = ValuesMovieLabelSerializer.__dict__["_compiled_read_values"]
+        self.assertFalse(any(variants.values()))
+
+    def test_evaluated_querysets_and_changed_fields_use_instances(self):
+        movies = Movie.objects.order_by("id")
+        list(movies)
+
+        with self.assertNumQueries(0):
+            ValuesMovieKeySerializer(movies, many=True).data
+
+        serializer = ValuesMovieKeySerializer(Movie.objects.order_by("id"), many=True)
+        serializer.child.fields.pop("director")
+
+        self.assertEqual(
+            serializer.data, [{"id": m.id, "title": m.title} for m in movies]
+        )
+
+    def test_instance_write_only_fields_are_hidden(self):
+        self.assertSameData(MovieSerializer, ValuesMovieSerializer)
+        data = []
+
+        for serializer_class in (MovieSerializer, ValuesMovieSerializer):
+            serializer = serializer_class(Movie.objects.order_by("id"), many=True)
+            serializer.child.fields["title"].write_only = True
+            serializer.child.fields["director"].fields["biography"].write_only = True
+            data.append(serializer.data)
+
+        self.assertEqual(data[1], data[0])
+        self.assertNotIn("title", data[1][0])
+        self.assertEqual(list(data[1][0]["director"]), ["id", "name"])
+        self.assertEqual(
+            len(ValuesMovieSerializer.__dict__["_compiled_read_values"]), 2
+        )
+
+    def test_off_by_default(self):
+        MovieKeySerializer(Movie.objects.all(), many=True).data
+
+        self.assertNotIn("_compiled_read_values", MovieKeySerializer.__dict__)
@@ -0,0 +1,109 @@
+import base64
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connections
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import viewsets
+from rest_framework.authentication import BasicAuthentication
+from rest_framework.response import Response
+from rest_framework.test import (
+    APIRequestFactory,
+    APITransactionTestCase,
+    force_authenticate,
+)
+
+from rest_typed.views import (
+    CurrentUser,
+    TypedViewSetMixin,
+    typed_action,
+    typed_api_view,
+)
+from rest_typed.views.replicas import ReplicaRouter
+from test_project.testapp.models import Director, Movie
+
+REPLICA_SETTINGS = {
+    "schema_packages": ["pydantic"],
+    "read_replicas": ["replica"],
+    "replica_stickiness": 30,
+}
+
+
+@typed_api_view(["GET", "POST"])
+def movie_count(user: User = CurrentUser(member_of="critics")):
+    return Response({"count": Movie.objects.count()})
+
+
+class MovieViewSet(TypedViewSetMixin, viewsets.ViewSet):
+    authentication_classes = [BasicAuthentication]
+
+    @typed_action(detail=False, methods=["get"])
+    def count(self, user: User = CurrentUser(member_of="critics")):
+        return Response({"count": Movie.objects.count()})
+
+
+class ReplicaRoutingTests(APITransactionTestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create(username="robert")
+        self.user.groups.create(name="critics")
+
+    def call(self, method: str):
+        request = getattr(self.factory, method)("/movies/count/")
+        force_authenticate(request, user=self.user)
+
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            with CaptureQueriesContext(connections["default"]) as default:
+                response = movie_count(request)
+
+        self.assertEqual(response.status_code, 200)
+        return len(replica.captured_queries), len(default.captured_queries)
+
+    @override_settings(DRF_TYPED_VIEWS=REPLICA_SETTINGS)
+    def test_safe_requests_read_from_replica(self):
+        # The CurrentUser group check and the view's own query.
+        self.assertEqual(self.call("get"), (2, 0))
+
+    @override_settings(DRF_TYPED_VIEWS=REPLICA_SETTINGS)
+    def test_reads_stick_to_primary_after_a_write(self):
+        self.assertEqual(self.call("post"), (0, 2))
+        self.assertEqual(self.call("get"), (0, 2))
+
+    def test_routing_is_off_without_replicas(self):
+        self.assertEqual(self.call("get"), (0, 2))
+
+    @override_settings(DRF_TYPED_VIEWS=REPLICA_SETTINGS)
+    def test_action_reads_from_replica(self):
+        self.user.set_password("secret")
+        self.user.save()
+        credentials = base64.b64encode(b"robert:secret").decode()
+        request = self.factory.get(
+            "/movies/count/", HTTP_AUTHORIZATION=f"Basic {credentials}"
+        )
+        view = MovieViewSet.as_view({"get": "count"})
+
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            with CaptureQueriesContext(connections["default"]) as default:
+                response = view(request)
+
+        self.assertEqual(response.status_code, 200)
+        # The user lookup, the group check and the view's own query.
+        self.assertEqual(
+            (len(replica.captured_queries), len(default.captured_queries)), (3, 0)
+        )
+
+    @override_settings(DRF_TYPED_VIEWS=REPLICA_SETTINGS)
+    def test_replica_and_primary_objects_can_be_related(self):
+        director = Director.objects.create(name="Agnes Varda")
+        director._state.db = "replica"
+        movie = Movie.objects.create(title="Cleo", genre="drama")
+
+        movie.director = director
+
+        self.assertIs(movie.director, director)
+        director._state.db = "other"
+        self.assertIsNone(ReplicaRouter().allow_relation(movie, director))
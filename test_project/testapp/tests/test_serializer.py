@@ -1,16 +1,31 @@
+import gc
+import json
 from collections import OrderedDict
 from datetime import date, datetime, time, timedelta
 from enum import Enum
+from io import StringIO
 from typing import List, Literal, Optional
 from uuid import UUID
 
+from django.core.management import call_command
+from django.test import override_settings
 from pytz import UTC
 from rest_framework import serializers
 from rest_framework.test import APITestCase
-from rest_typed.serializers import TModelSerializer, TSerializer
+from rest_typed.serializers import TModelSerializer, TSerializer, warmup_serializers
+from rest_typed.serializers.serializers import TypedAttribute, clear_model_fields
 from test_project.testapp.models import Movie
 
 
+class ReviewSerializer(TSerializer):
+    rating: int
+    reviewer: "ReviewerSerializer"
+
+
+class ReviewerSerializer(TSerializer):
+    name: str
+
+
 class SerializerTests(APITestCase):
     def test_add_boolean_field_from_type_hint(self):
         class MovieSerializer(TSerializer):
@@ -220,3 +235,296 @@ class SerializerTests(APITestCase):
         book = BookSerializer(data={"author": {"name": "JK Rowling"}})
         self.assertEqual(book.fields["author"].allow_null, False)
         self.assertEqual(book.fields["author"].default, None)
+
+    def test_instances_get_their_own_fields(self):
+        class BookSerializer(TSerializer):
+            title: str
+            tags: List[str] = []
+
+        first, second = BookSerializer(), BookSerializer()
+
+        self.assertIsNot(first.fields["title"], second.fields["title"])
+        self.assertIs(first.fields["title"].parent, first)
+        self.assertIs(first.fields["tags"].child.parent, first.fields["tags"])
+        self.assertIsNot(first.fields["tags"].default, second.fields["tags"].default)
+        self.assertIsNone(BookSerializer._declared_fields["title"].parent)
+
+    def test_copied_fields_validate_like_deep_copies(self):
+        class AuthorSerializer(TSerializer):
+            name: str
+
+        class BookSerializer(TSerializer):
+            title = serializers.CharField(max_length=5)
+            pages: int
+            tags: List[str] = []
+            author: AuthorSerializer
+
+        data = {"title": "Dune", "pages": "412", "tags": ["sf"], "author": {}}
+        book = BookSerializer(data=data)
+        reference = BookSerializer(data=data)
+        reference.get_fields = lambda: serializers.Serializer.get_fields(reference)
+
+        self.assertFalse(book.is_valid())
+        self.assertFalse(reference.is_valid())
+        self.assertEqual(book.errors, reference.errors)
+
+        data["author"] = {"name": "Frank Herbert"}
+        book = BookSerializer(data=data)
+        book.is_valid(raise_exception=True)
+
+        self.assertEqual(book.validated_data["pages"], 412)
+        self.assertEqual(book.author.name, "Frank Herbert")
+
+    def test_benchmark_output_matches_baseline(self):
+        call_command("benchmark_serializers", items=3, repeat=1, stdout=StringIO())
+
+    def test_model_serializer_introspects_model_once_per_class(self):
+        built = []
+
+        class MovieSerializer(TModelSerializer):
+            rating: Optional[int] = None
+
+            class Meta:
+                model = Movie
+                fields = ["id", "title", "rating", "director"]
+                cache_fields = True
+
+            def build_field(self, *args):
+                built.append(args[0])
+                return super().build_field(*args)
+
+        first, second = MovieSerializer(), MovieSerializer()
+
+        self.assertEqual(list(first.fields), ["id", "title", "rating", "director"])
+        self.assertEqual(list(second.fields), ["id", "title", "rating", "director"])
+        self.assertEqual(built, ["id", "title", "director"])
+        self.assertIsNot(first.fields["title"], second.fields["title"])
+        self.assertIs(second.fields["title"].parent, second)
+        self.assertIsInstance(first.fields["rating"], serializers.IntegerField)
+        self.assertEqual(
+            second.fields["director"].get_queryset().model,
+            Movie._meta.get_field("director").related_model,
+        )
+
+    def test_model_serializer_field_cache_invalidation(self):
+        built = []
+
+        def define():
+            class MovieSerializer(TModelSerializer):
+                class Meta:
+                    model = Movie
+                    fields = ["title"]
+                    cache_fields = True
+
+                def build_field(self, *args):
+                    built.append(args[0])
+                    return super().build_field(*args)
+
+            return MovieSerializer
+
+        define()().fields
+        define()().fields
+        self.assertEqual(built, ["title", "title"])
+
+        MovieSerializer = define()
+        MovieSerializer().fields
+        clear_model_fields()
+        MovieSerializer().fields
+        self.assertEqual(built, ["title"] * 4)
+
+        MovieSerializer.Meta.cache_fields = False
+        MovieSerializer().fields
+        MovieSerializer().fields
+        self.assertEqual(built, ["title"] * 6)
+
+        del MovieSerializer.Meta.cache_fields
+        MovieSerializer().fields
+        self.assertEqual(built, ["title"] * 7)
+
+        clear_model_fields()
+
+        with override_settings(DRF_TYPED_VIEWS={"cache_model_fields": True}):
+            MovieSerializer().fields
+            MovieSerializer().fields
+        self.assertEqual(built, ["title"] * 8)
+
+    def test_nested_attributes_are_slotted_records(self):
+        class PublisherSerializer(TSerializer):
+            name: str
+
+        class AuthorSerializer(TSerializer):
+            name: str
+            publisher: Optional[PublisherSerializer] = None
+
+        class BookSerializer(TSerializer):
+            author: AuthorSerializer
+            co_authors: List[AuthorSerializer] = []
+
+        data = {
+            "author": {"name": "Terry Pratchett", "publisher": {"name": "Corgi"}},
+            "co_authors": [{"name": "Neil Gaiman"}],
+        }
+        book = BookSerializer(data=data)
+        book.is_valid(raise_exception=True)
+
+        self.assertEqual(book.author.publisher.name, "Corgi")
+        self.assertEqual(book.co_authors[0].name, "Neil Gaiman")
+        self.assertIsNone(book.co_authors[0].publisher)
+        self.assertFalse(hasattr(book.author, "__dict__"))
+        self.assertIs(type(book.author), type(book.co_authors[0]))
+        self.assertEqual(type(book.author).__name__, "AuthorRecord")
+        self.assertEqual(book.author, data["author"])
+        self.assertEqual(book.author["name"], "Terry Pratchett")
+        self.assertEqual(
+            book.co_authors[0].asdict(), {"name": "Neil Gaiman", "publisher": None}
+        )
+
+    def test_records_are_mappings(self):
+        class AuthorSerializer(TSerializer):
+            name: str
+            born: Optional[int] = None
+            alias = serializers.CharField(required=False)
+
+        class BookSerializer(TSerializer):
+            author: AuthorSerializer
+
+        book = BookSerializer(data={"author": {"name": "Terry Pratchett"}})
+        book.is_valid(raise_exception=True)
+        author = book.author
+
+        self.assertEqual(dict(**author), {"name": "Terry Pratchett", "born": None})
+        self.assertEqual(list(author.keys()), ["name", "born"])
+        self.assertEqual(len(author), 2)
+        self.assertIn("name", author)
+        self.assertNotIn("alias", author)
+        self.assertEqual(author.get("alias", "-"), "-")
+        self.assertEqual(author.get("name"), "Terry Pratchett")
+
+    def test_records_hold_validated_keys(self):
+        class AuthorSerializer(TSerializer):
+            name: str
+            pen_name = serializers.CharField(source="alias")
+
+            def validate(self, data):
+                data["initials"] = data["name"][0]
+                return data
+
+        class BookSerializer(TSerializer):
+            author: AuthorSerializer
+
+        book = BookSerializer(data={"author": {"name": "Terry", "pen_name": "TP"}})
+        book.is_valid(raise_exception=True)
+        author = book.author
+
+        self.assertEqual(type(author).__name__, "AuthorRecord")
+        self.assertEqual(author.alias, "TP")
+        self.assertEqual(author.initials, "T")
+        self.assertEqual(author, book.validated_data["author"])
+        self.assertEqual(
+            dict(author), {"name": "Terry", "alias": "TP", "initials": "T"}
+        )
+
+    def test_records_fall_back_to_dicts(self):
+        class EntrySerializer(TSerializer):
+            keys: List[str]
+            title: str
+
+        class IndexSerializer(TSerializer):
+            entry: EntrySerializer
+
+        index = IndexSerializer(data={"entry": {"keys": ["a"], "title": "A"}})
+        index.is_valid(raise_exception=True)
+
+        self.assertIs(type(index.entry), dict)
+        self.assertEqual(index.entry, {"keys": ["a"], "title": "A"})
+        self.assertEqual(json.dumps(index.entry), '{"keys": ["a"], "title": "A"}')
+
+    def test_attributes_are_converted_once(self):
+        class ChapterSerializer(TSerializer):
+            title: str
+
+        class BookSerializer(TSerializer):
+            chapters: List[ChapterSerializer]
+            data: str = "unused"
+
+        book = BookSerializer(data={"chapters": [{"title": "Intro"}]})
+
+        with self.assertRaises(AssertionError):
+            book.chapters
+
+        book.is_valid(raise_exception=True)
+
+        self.assertIsInstance(BookSerializer.__dict__["chapters"], TypedAttribute)
+        self.assertIs(book.chapters, book.chapters)
+        self.assertIs(book.__dict__["chapters"], book.chapters)
+        self.assertEqual(
+            book.data, {"chapters": [{"title": "Intro"}], "data": "unused"}
+        )
+
+    def test_model_serializer_attributes_are_converted_once(self):
+        class MovieSerializer(TModelSerializer):
+            class Meta:
+                model = Movie
+                fields = ["title", "genre"]
+
+        movie = MovieSerializer(data={"title": "Cleo", "genre": "drama"})
+        movie.is_valid(raise_exception=True)
+
+        self.assertEqual(movie.title, "Cleo")
+        self.assertEqual(movie.__dict__["title"], "Cleo")
+
+    def test_fields_are_built_on_first_use(self):
+        class AuthorSerializer(TSerializer):
+            name: str
+            nickname = serializers.CharField(required=False)
+
+        class BookSerializer(AuthorSerializer):
+            title: str = "Untitled"
+
+        self.assertEqual(list(BookSerializer._declared_fields), ["nickname"])
+        self.assertEqual(BookSerializer.title, "Untitled")
+
+        book = BookSerializer(data={"name": "Ann Leckie"})
+        book.is_valid(raise_exception=True)
+
+        self.assertEqual(list(book.fields), ["nickname", "name", "title"])
+        self.assertEqual(book.title, "Untitled")
+        self.assertEqual(list(AuthorSerializer._declared_fields), ["nickname", "name"])
+        self.assertIsInstance(BookSerializer.__dict__["title"], TypedAttribute)
+
+    def test_type_hints_can_refer_to_later_classes(self):
+        review = ReviewSerializer(data={"rating": 4, "reviewer": {"name": "Ann"}})
+        review.is_valid(raise_exception=True)
+
+        self.assertEqual(review.reviewer.name, "Ann")
+        self.assertIsInstance(review.fields["reviewer"], ReviewerSerializer)
+
+    def test_unresolved_type_hints_raise_on_first_use(self):
+        class PosterSerializer(TSerializer):
+            artist: "ArtistSerializer"
+
+        with self.assertRaisesMessage(NameError, "PosterSerializer"):
+            PosterSerializer()
+
+    @override_settings(DRF_TYPED_VIEWS={"eager_serializer_fields": True})
+    def test_eager_fields(self):
+        class PosterSerializer(TSerializer):
+            artist: str
+
+        self.assertEqual(list(PosterSerializer._declared_fields), ["artist"])
+
+        with self.assertRaises(NameError):
+
+            class PosterSerializer(TSerializer):
+                artist: "ArtistSerializer"
+
+    def test_warmup_builds_pending_classes(self):
+        # Drop classes other tests left unresolvable on purpose.
+        gc.collect()
+
+        class PosterSerializer(TSerializer):
+            artist: str
+
+        self.assertGreaterEqual(warmup_serializers(), 1)
+        self.assertEqual(list(PosterSerializer._declared_fields), ["artist"])
+        self.assertEqual(warmup_serializers(), 0)
@@ -1,4 +1,4 @@
-from datetime import date, datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import List, Optional
@@ -42,6 +42,24 @@ def create_user(user: SuperUser):
     return Response(dict(user))
 
 
+class OrderSerializer(TSerializer):
+    item: str
+    quantity: int = 1
+
+
+ORDERS_CREATED = []
+
+
+@typed_api_view(["POST"], idempotent=True)
+def create_order(order: OrderSerializer):
+    ORDERS_CREATED.append(order.asdict())
+    return Response(
+        {"order_number": len(ORDERS_CREATED), **order.asdict()},
+        status=201,
+        headers={"Location": f"/orders/{len(ORDERS_CREATED)}/"},
+    )
+
+
 @typed_api_view(["GET"])
 def get_cache_header(cache: str = Header()):
     return Response(cache)
@@ -95,6 +113,25 @@ def get_logs(
     )
 
 
+def movie_summary_etag(id: int, lang: str) -> str:
+    return f"movie-{id}-{lang}-v1"
+
+
+def movie_summary_last_modified(id: int) -> datetime:
+    return datetime(2021, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@typed_api_view(
+    ["GET"], etag=movie_summary_etag, last_modified=movie_summary_last_modified
+)
+def get_movie_summary(
+    id: int = Path(),
+    lang: str = Query(default="en"),
+    critic: User = CurrentUser(member_of="critics"),
+):
+    return Response({"id": id, "lang": lang})
+
+
 @typed_api_view(["GET"])
 def test_view(c: str = Header(source="connection")):
     return Response({"v": c})
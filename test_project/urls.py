@@ -5,11 +5,15 @@ from test_project.testapp.views import (
     create_user,
     get_logs,
     create_band_member,
+    create_order,
+    get_movie_summary,
     test_view_for_optional_list_param,
     get_cache_header,
     test_view,
 )
 from test_project.testapp.view_sets import MovieViewSet
+from rest_typed.views.background import background_job_view
+from rest_typed.views.batch import batch_view
 
 router = routers.SimpleRouter()
 
@@ -21,6 +25,18 @@ urlpatterns = [
     url(r"^test/", test_view, name="test-view"),
     url(r"^test/", test_view, name="test-view"),
     url(r"^band-members/", create_band_member, name="create-band-member"),
+    url(r"^orders/", create_order, name="create-order"),
+    url(r"^batch/", batch_view(max_operations=5, concurrent=True), name="batch"),
+    url(
+        r"^jobs/(?P<job_id>[0-9a-f]+)/",
+        background_job_view(),
+        name="typed-background-job",
+    ),
+    url(
+        r"^movie-summaries/(?P<id>[0-9]+)/",
+        get_movie_summary,
+        name="get-movie-summary",
+    ),
     url(r"^get-cache-header/", get_cache_header, name="get-cache-header"),
     url(
         r"^test-optional-list-param/",